@@ -3,6 +3,8 @@
 from motion_analysis_2d.defs import project_name, app_version, module_name
 
 
+# main() calls multiprocessing.freeze_support() first, the worker processes of
+# tracker evaluation and parallel tracking re-run this executable
 block_cipher = None
 
 a = Analysis(
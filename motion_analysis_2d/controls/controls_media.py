@@ -10,6 +10,7 @@ class MediaControls(QtWidgets.QFrame):
     next_frame = Signal()
     seek_bar_moved = Signal(int)
     track_enabled = Signal(bool)
+    reverse_toggled = Signal(bool)
 
     def __init__(self, parent=None, orientation="horizontal"):
         super().__init__(parent=parent)
@@ -52,6 +53,15 @@ class MediaControls(QtWidgets.QFrame):
         self.play_button.toggled.connect(self.play_button_toggled)
         self.main_layout.addWidget(self.play_button)
 
+        self.reverse_button = QtWidgets.QPushButton(self)
+        self.reverse_button.setToolTip("Play and track backwards.")
+        self.reverse_button.setIcon(qta.icon("mdi6.swap-horizontal"))
+        self.reverse_button.setIconSize(QtCore.QSize(icon_size, icon_size))
+        self.reverse_button.setFlat(True)
+        self.reverse_button.setCheckable(True)
+        self.reverse_button.toggled.connect(self.reverse_toggled.emit)
+        self.main_layout.addWidget(self.reverse_button)
+
         self.seek_bar = SpinBoxSlider(orientation, self)
         self.seek_bar.spinbox.setPrefix("Frame ")
         self.seek_bar.setSingleStep(1)
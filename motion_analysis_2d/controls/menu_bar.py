@@ -11,8 +11,12 @@ from motion_analysis_2d.preferences_pane import ShortcutsWidget, VisualPreferenc
 class MenuBar(QtWidgets.QMenuBar):
     open_video_file = Signal(object)
     open_video_folder = Signal(object)
+    open_live_source = Signal()
     update_shortcuts = Signal(object)
     update_visual_preferences = Signal(object)
+    track_range = Signal()
+    track_backwards = Signal()
+    track_parallel = Signal()
 
     def __init__(self, parent=None):
         super().__init__(parent=parent)
@@ -30,6 +34,12 @@ class MenuBar(QtWidgets.QMenuBar):
         )
         self.open_video_folder_action.triggered.connect(self.add_folder)
 
+        self.open_live_source_action = self.file_menu.addAction(
+            qta.icon("mdi6.webcam"), "Open Live Source..."
+        )
+        self.open_live_source_action.setShortcut("Ctrl+L")
+        self.open_live_source_action.triggered.connect(self.open_live_source.emit)
+
         self.edit_menu = self.addMenu("Edit")
         self.shortcuts_action = self.edit_menu.addAction(
             qta.icon("mdi6.keyboard"), "Shortcuts"
@@ -45,6 +55,24 @@ class MenuBar(QtWidgets.QMenuBar):
         self.visual_pref_action.triggered.connect(self.open_visual_preference_widget)
         self.visual_preference_widget = None
 
+        self.tracking_menu = self.addMenu("Tracking")
+        self.track_range_action = self.tracking_menu.addAction(
+            qta.icon("mdi6.fast-forward"), "Track Range..."
+        )
+        self.track_range_action.setShortcut("Ctrl+R")
+        self.track_range_action.triggered.connect(self.track_range.emit)
+
+        self.track_backwards_action = self.tracking_menu.addAction(
+            qta.icon("mdi6.rewind"), "Track Backwards to Gap"
+        )
+        self.track_backwards_action.setShortcut("Ctrl+Shift+R")
+        self.track_backwards_action.triggered.connect(self.track_backwards.emit)
+
+        self.track_parallel_action = self.tracking_menu.addAction(
+            qta.icon("mdi6.call-split"), "Track Range in Parallel..."
+        )
+        self.track_parallel_action.triggered.connect(self.track_parallel.emit)
+
         self.edit_menu = self.addMenu("Help")
         self.help_action = self.edit_menu.addAction(qta.icon("mdi6.help"), "Help")
         self.help_action.setShortcut("Ctrl+H")
@@ -69,7 +97,7 @@ class MenuBar(QtWidgets.QMenuBar):
             "Open Video Folder",
         )
         if folder_name:
-            self.open_video_folder.emit(list(Path(folder_name).glob("*")))
+            self.open_video_folder.emit([Path(folder_name)])
 
     def open_shortcuts_widget(self):
         self.shortcuts_widget = ShortcutsWidget()
@@ -1,14 +1,30 @@
 from .arrow_item import ArrowItem
 from .badge_button import BadgeButton
+from .capture_factory import open_capture
+from .cascade_tracker import CascadeTracker
 from .color_button import ColorButton
 from .dock_base import BaseDock
 from .file_list import FileListWidget
+from .file_list_model import FileListModel
+from .folder_scanner import FolderScanner
+from .frame_processor import FrameProcessor
+from .frame_stack_capture import FrameStackCapture
+from .frame_products import FrameProducts
+from .frame_result import FrameResult
 from .gui_save_base import BaseGuiSave
 from .help_widget import HelpView
+from .image_sequence_capture import ImageSequenceCapture
+from .live_capture import LiveCapture, open_live_capture
+from .metadata_prober import MetadataProber, probe_video
+from .motion_gate import MotionGate
+from .motion_predictor import MotionPredictor
 from .my_colors import tab10_rgb, tab10_qcolor, tab10_gbr, tab10_rgb_cycle
 from .path_edit import PathEdit
 from .perspective_item import PerspectiveItem
 from .pie_item import PieItem
 from .spinbox_slider import SpinBoxSlider
+from .stabilizer import Stabilizer
 from .static_tracker import StaticTracker
 from .steps_enum import StepsEnum
+from .tracker_overlay import TrackerOverlay
+from .trajectory_item import TrajectoryItem
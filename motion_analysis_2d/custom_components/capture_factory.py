@@ -0,0 +1,23 @@
+from pathlib import Path
+
+import cv2 as cv
+
+from .frame_stack_capture import FrameStackCapture
+from .image_sequence_capture import ImageSequenceCapture
+
+frame_stack_suffixes = (".npy", ".raw")
+
+
+def open_capture(path, frame_rate=None):
+    """
+    Open a clip with the capture matching its source type
+
+    :param path: video file, image sequence folder or .npy/.raw frame stack
+    :param frame_rate: frame rate used when the source does not store one
+    """
+    path = Path(path)
+    if path.is_dir():
+        return ImageSequenceCapture(path, frame_rate)
+    if path.suffix.lower() in frame_stack_suffixes:
+        return FrameStackCapture(path, frame_rate)
+    return cv.VideoCapture(str(path))
@@ -0,0 +1,81 @@
+import cv2 as cv
+
+from motion_analysis_2d.funcs import crop_patch
+
+
+class CascadeTracker:
+    """Run a cheap tracker and fall back to an expensive one on low confidence.
+
+    Confidence is the normalised correlation between the patch under the cheap
+    tracker's bbox and a template patch. The template is captured at
+    initialisation and refreshed from very confident frames and from frames the
+    fallback tracked, so a lasting change in appearance does not keep every
+    frame on the fallback. Frames are grayscale, see tracker_products.
+    """
+
+    def __init__(
+        self,
+        create_fast,
+        create_fallback,
+        confidence_threshold=0.5,
+        refresh_threshold=0.8,
+    ):
+        self.create_fast = create_fast
+        self.create_fallback = create_fallback
+        self.confidence_threshold = confidence_threshold
+        self.refresh_threshold = refresh_threshold
+
+        self.fast = None
+        self.fallback = None
+        self.template = None
+        self.bbox = None
+        self.prev_frame = None
+
+        self.confidence = 0.0
+        self.fell_back = False
+        self.frames = 0
+        self.fallbacks = 0
+
+    def init(self, frame, bbox):
+        self.fast = self.create_fast()
+        self.fast.init(frame, bbox)
+        self.fallback = None
+        self.template = crop_patch(frame, bbox)
+        self.bbox = tuple(bbox)
+        self.prev_frame = frame
+
+    def update(self, frame):
+        self.frames += 1
+
+        ret, bbox = self.fast.update(frame)
+        self.confidence = self.patch_confidence(frame, bbox) if ret else 0.0
+        self.fell_back = self.confidence < self.confidence_threshold
+
+        if self.fell_back:
+            self.fallbacks += 1
+            if self.fallback is None:
+                self.fallback = self.create_fallback()
+                self.fallback.init(self.prev_frame, self.bbox)
+            ret, bbox = self.fallback.update(frame)
+            if ret:
+                self.fast = self.create_fast()
+                self.fast.init(frame, bbox)
+                self.template = crop_patch(frame, bbox)
+        else:
+            self.fallback = None
+            if self.confidence >= self.refresh_threshold:
+                self.template = crop_patch(frame, bbox)
+
+        if ret:
+            self.bbox = tuple(bbox)
+        self.prev_frame = frame
+        return ret, bbox
+
+    def patch_confidence(self, frame, bbox):
+        patch = crop_patch(frame, bbox)
+        t_h, t_w = self.template.shape[:2]
+        if patch.size == 0 or t_h == 0 or t_w == 0:
+            return 0.0
+        if patch.shape != self.template.shape:
+            patch = cv.resize(patch, (t_w, t_h))
+        return float(cv.matchTemplate(patch, self.template, cv.TM_CCOEFF_NORMED)[0, 0])
@@ -1,168 +1,158 @@
 from pathlib import Path
 
-import qtawesome as qta
+from motion_analysis_2d.custom_components.file_list_model import FileListModel
+from motion_analysis_2d.defs import QtCore, QtWidgets, Signal
+from motion_analysis_2d.funcs import check_file_type
 
-from motion_analysis_2d.custom_components.my_colors import tab10_qcolor
-from motion_analysis_2d.defs import QtCore, QtWidgets
-from motion_analysis_2d.funcs import guess_file_type, check_file_type
 
+class FileListWidget(QtWidgets.QListView):
+    paths_added = Signal(list)
+    selection_changed = Signal()
+    folders_dropped = Signal(list)
 
-class FileListWidget(QtWidgets.QListWidget):
     def __init__(self, filetypes=None, parent=None):
         super().__init__(parent=parent)
 
         self.filetypes = filetypes
         self.setAcceptDrops(True)
 
-        self.setWordWrap(True)
+        # uniform rows keep the layout cheap with thousands of files
+        self.setUniformItemSizes(True)
+        self.setTextElideMode(QtCore.Qt.ElideMiddle)
         self.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
-        self.setDragDropMode(QtWidgets.QAbstractItemView.InternalMove)
-        self.full_paths = {}
-
-        self.image_file_icons = {
-            "jpeg": qta.icon("mdi.file-image", color=tab10_qcolor["blue"]),
-            "png": qta.icon("mdi.file-image", color=tab10_qcolor["purple"]),
-            "tiff": qta.icon("mdi.file-image", color=tab10_qcolor["green"]),
-            "bmp": qta.icon("mdi.file-image", color=tab10_qcolor["cyan"]),
-            "svg+xml": qta.icon("mdi.file-image", color=tab10_qcolor["pink"]),
-            "x-emf": qta.icon("mdi.file-image", color=tab10_qcolor["gray"]),
-            "gif": qta.icon("mdi.file-image", color=tab10_qcolor["orange"]),
-            "generic": qta.icon("mdi.file-image", color=tab10_qcolor["red"]),
-        }
-        self.video_file_icons = {
-            "mp4": qta.icon("mdi.file-video", color=tab10_qcolor["blue"]),
-            "webm": qta.icon("mdi.file-video", color=tab10_qcolor["purple"]),
-            "x-matroska": qta.icon("mdi.file-video", color=tab10_qcolor["green"]),
-            "x-ms-wmv": qta.icon("mdi.file-video", color=tab10_qcolor["cyan"]),
-            "mpeg": qta.icon("mdi.file-video", color=tab10_qcolor["pink"]),
-            "quicktime": qta.icon("mdi.file-video", color=tab10_qcolor["gray"]),
-            "avi": qta.icon("mdi.file-video", color=tab10_qcolor["orange"]),
-            "generic": qta.icon("mdi.file-video", color=tab10_qcolor["red"]),
-        }
-
-    def add_file_to_list(self, file_path):
-        key = file_path.name
-        keys_prev = [k for k, v in self.full_paths.items() if key == v.name]
-        paths_prev = [self.full_paths[k] for k in keys_prev]
-        file_type = guess_file_type(file_path)
-        # if doesn't exist, create new file.
-        # if exists, check if it's the same file.
-        #   if it's the same, move file to top.
-        #   if not the same, remove add parent dir(s) until unique
-        if not keys_prev:
-            self.full_paths[key] = file_path
-            self.generate_file_item(key, file_type)
-        else:
-            if file_path in paths_prev:
-                # move to top
-                i = paths_prev.index(file_path)
-                k_prev = keys_prev[i]
-                item = self.findItems(k_prev, QtCore.Qt.MatchExactly)[0]
-                row = self.row(item)
-                self.takeItem(row)
-                self.insertItem(0, item)
-                self.setCurrentItem(item)
-            else:
-                keys_new = [key] * len(keys_prev)
-                key_curr = key
-                lvl = 0
-                while len(set(keys_new + [key_curr])) < len(keys_new + [key_curr]):
-                    for i, p in enumerate(paths_prev):
-                        keys_new[i] = "/".join([p.parents[lvl].name, keys_new[i]])
-                    key_curr = "/".join([file_path.parents[lvl].name, key_curr])
-                    lvl += 1
-
-                for k_prev, k_new, p in zip(keys_prev, keys_new, paths_prev):
-                    item = self.findItems(k_prev, QtCore.Qt.MatchExactly)[0]
-                    item.setText(k_new)
-                    self.full_paths[k_new] = p
-                    del self.full_paths[k_prev]
-
-                self.full_paths[key_curr] = file_path
-                self.generate_file_item(key_curr, file_type)
-
-    def generate_file_item(self, key, file_type):
-        file_type, subtype = file_type.split("/")
-        file_item = QtWidgets.QListWidgetItem(key)
-        if file_type == "video":
-            if subtype in self.video_file_icons.keys():
-                file_item.setIcon(self.video_file_icons[subtype])
-            else:
-                file_item.setIcon(self.video_file_icons["generic"])
-
-        elif file_type == "image":
-            if subtype in self.video_file_icons.keys():
-                file_item.setIcon(self.image_file_icons[subtype])
-            else:
-                file_item.setIcon(self.image_file_icons["generic"])
-
-        self.insertItem(0, file_item)
-        self.setCurrentItem(file_item)
+        self.setDragDropMode(QtWidgets.QAbstractItemView.DropOnly)
+        self.drag_paths = None
+
+        self.file_model = FileListModel(self)
+        self.proxy_model = QtCore.QSortFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.file_model)
+        self.proxy_model.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        self.setModel(self.proxy_model)
+        self.selectionModel().currentChanged.connect(self.selection_changed.emit)
 
     def valid_paths(self, e):
-        if e.mimeData().hasUrls():
-            urls = e.mimeData().urls()
-            if Path(urls[0].toLocalFile()).is_dir():
-                paths = Path(urls[0].toLocalFile()).glob("*")
-            else:
-                paths = (Path(url.toLocalFile()) for url in e.mimeData().urls())
-            if self.filetypes is None:
-                return [p for p in paths if p.is_file()]
-            else:
-                return [p for p in paths if check_file_type(p, self.filetypes)]
+        """
+        Dropped (files, folders), checked once per drag
+
+        Files are kept by type. Folders are only told apart from files here,
+        they are scanned in the background once dropped.
+        """
+        if self.drag_paths is None:
+            files, folders = [], []
+            if e.mimeData().hasUrls():
+                for url in e.mimeData().urls():
+                    p = Path(url.toLocalFile())
+                    if p.is_dir():
+                        folders.append(p)
+                    elif p.is_file() and (
+                        self.filetypes is None or check_file_type(p, self.filetypes)
+                    ):
+                        files.append(p)
+            self.drag_paths = (files, folders)
+        return self.drag_paths
 
     def dragEnterEvent(self, e):
-        if self.valid_paths(e):
+        self.drag_paths = None
+        if any(self.valid_paths(e)):
             e.acceptProposedAction()
             e.setDropAction(QtCore.Qt.LinkAction)
         else:
             super().dragEnterEvent(e)
 
     def dragMoveEvent(self, e):
-        if self.valid_paths(e):
+        if any(self.valid_paths(e)):
             e.acceptProposedAction()
             e.setDropAction(QtCore.Qt.LinkAction)
         else:
             super().dragMoveEvent(e)
 
+    def dragLeaveEvent(self, e):
+        self.drag_paths = None
+        super().dragLeaveEvent(e)
+
     def dropEvent(self, e):
-        if paths := self.valid_paths(e):
-            self.add_items(paths)
+        files, folders = self.valid_paths(e)
+        self.drag_paths = None
+        if files or folders:
+            if files:
+                self.add_items(files)
+            if folders:
+                self.folders_dropped.emit(folders)
             e.accept()
         else:
             super().dropEvent(e)
 
-    def add_items(self, paths):
-        for p in paths:
-            self.blockSignals(True)
-            self.add_file_to_list(p)
-            self.blockSignals(False)
-        self.itemSelectionChanged.emit()
+    def add_items(self, paths, select=True):
+        """
+        :param paths: paths put at the top of the list
+        :param select: make the top path current, else keep the current path
+        """
+        paths = list(paths)
+        current = self.current_path()
+        self.blockSignals(True)
+        self.file_model.add_paths(paths)
+        self.set_current_path(paths[-1] if select and paths else current)
+        self.blockSignals(False)
+        self.paths_added.emit(paths)
+        if select:
+            self.selection_changed.emit()
 
     def remove_all(self):
         self.blockSignals(True)
-        self.clear()
+        self.file_model.clear()
         self.blockSignals(False)
-        self.full_paths = {}
-        self.itemSelectionChanged.emit()
+        self.selection_changed.emit()
 
     def remove_selection(self):
-        items = self.selectedItems()
-        for item in items:
-            row = self.row(item)
+        paths = [index.data(FileListModel.PathRole) for index in self.selectedIndexes()]
+        if not paths:
+            return
+        row = self.current_row()
+        self.blockSignals(True)
+        self.file_model.remove_paths(paths)
+        self.set_current_row(min(row, self.count() - 1))
+        self.blockSignals(False)
+        self.selection_changed.emit()
+
+    def count(self):
+        return self.proxy_model.rowCount()
+
+    def current_row(self):
+        return self.currentIndex().row()
 
-            self.blockSignals(True)
-            self.takeItem(row)
-            self.blockSignals(False)
+    def set_current_row(self, row):
+        self.setCurrentIndex(self.proxy_model.index(row, 0))
 
-            del self.full_paths[item.text()]
-            self.itemSelectionChanged.emit()
+    def path_at(self, row):
+        return self.proxy_model.index(row, 0).data(FileListModel.PathRole)
+
+    def current_path(self):
+        return self.currentIndex().data(FileListModel.PathRole)
+
+    def set_current_path(self, path):
+        index = self.file_model.index_of(path)
+        self.setCurrentIndex(self.proxy_model.mapFromSource(index))
+
+    def set_filter(self, text):
+        """Show only the files whose name contains text, the open file stays open"""
+        self.blockSignals(True)
+        self.proxy_model.setFilterFixedString(text)
+        self.blockSignals(False)
+
+    def sort_by_role(self, role, order=QtCore.Qt.AscendingOrder):
+        self.blockSignals(True)
+        self.proxy_model.setSortRole(role)
+        self.proxy_model.sort(0, order)
+        self.blockSignals(False)
 
     def sort_ascend(self):
-        self.sortItems(QtCore.Qt.AscendingOrder)
+        self.sort_by_role(QtCore.Qt.DisplayRole, QtCore.Qt.AscendingOrder)
 
     def sort_descend(self):
-        self.sortItems(QtCore.Qt.DescendingOrder)
+        self.sort_by_role(QtCore.Qt.DisplayRole, QtCore.Qt.DescendingOrder)
+
+    def sort_by_duration(self):
+        self.sort_by_role(FileListModel.DurationRole)
 
 
 if __name__ == "__main__":
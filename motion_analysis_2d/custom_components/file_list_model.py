@@ -0,0 +1,168 @@
+import qtawesome as qta
+
+from motion_analysis_2d.custom_components.my_colors import tab10_qcolor
+from motion_analysis_2d.defs import QtCore, QtGui
+from motion_analysis_2d.funcs import disambiguate_paths, guess_file_type
+
+
+class FileListModel(QtCore.QAbstractListModel):
+    """Queue of files shown by name, parent folders are added to tell apart
+    files with the same name.
+
+    Paths are indexed by name, adding a file only renames the files it
+    collides with.
+    """
+
+    PathRole = QtCore.Qt.UserRole
+    DurationRole = QtCore.Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.paths = []
+        self.rows = {}
+        self.keys = {}
+        self.by_name = {}
+        self.file_types = {}
+        self.tooltips = {}
+        self.durations = {}
+        self.complete = set()
+
+        self.image_file_icons = {
+            "jpeg": qta.icon("mdi.file-image", color=tab10_qcolor["blue"]),
+            "png": qta.icon("mdi.file-image", color=tab10_qcolor["purple"]),
+            "tiff": qta.icon("mdi.file-image", color=tab10_qcolor["green"]),
+            "bmp": qta.icon("mdi.file-image", color=tab10_qcolor["cyan"]),
+            "svg+xml": qta.icon("mdi.file-image", color=tab10_qcolor["pink"]),
+            "x-emf": qta.icon("mdi.file-image", color=tab10_qcolor["gray"]),
+            "gif": qta.icon("mdi.file-image", color=tab10_qcolor["orange"]),
+            "generic": qta.icon("mdi.file-image", color=tab10_qcolor["red"]),
+        }
+        self.video_file_icons = {
+            "mp4": qta.icon("mdi.file-video", color=tab10_qcolor["blue"]),
+            "webm": qta.icon("mdi.file-video", color=tab10_qcolor["purple"]),
+            "x-matroska": qta.icon("mdi.file-video", color=tab10_qcolor["green"]),
+            "x-ms-wmv": qta.icon("mdi.file-video", color=tab10_qcolor["cyan"]),
+            "mpeg": qta.icon("mdi.file-video", color=tab10_qcolor["pink"]),
+            "quicktime": qta.icon("mdi.file-video", color=tab10_qcolor["gray"]),
+            "avi": qta.icon("mdi.file-video", color=tab10_qcolor["orange"]),
+            "generic": qta.icon("mdi.file-video", color=tab10_qcolor["red"]),
+        }
+        self.sequence_icon = qta.icon("mdi.folder-image", color=tab10_qcolor["blue"])
+        self.complete_brush = QtGui.QBrush(tab10_qcolor["gray"])
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.paths)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        path = self.paths[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return self.keys[path]
+        elif role == QtCore.Qt.DecorationRole:
+            return self.file_icon(self.file_types[path])
+        elif role == QtCore.Qt.ToolTipRole:
+            return self.tooltips.get(path)
+        elif role == QtCore.Qt.ForegroundRole:
+            if path in self.complete:
+                return self.complete_brush
+        elif role == self.PathRole:
+            return path
+        elif role == self.DurationRole:
+            return self.durations.get(path, float("inf"))
+        return None
+
+    def file_icon(self, file_type):
+        if file_type is None:
+            return None
+        file_type, subtype = file_type.split("/")
+        if file_type == "video":
+            return self.video_file_icons.get(subtype, self.video_file_icons["generic"])
+        elif file_type == "image":
+            return self.image_file_icons.get(subtype, self.image_file_icons["generic"])
+        elif file_type == "inode":
+            return self.sequence_icon
+        return None
+
+    def add_paths(self, paths):
+        """
+        Put paths at the top of the queue, the last one first
+
+        Paths already in the queue are moved. Only the files sharing a name
+        with a new file are renamed, the model is reset once.
+        """
+        top = list(dict.fromkeys(reversed(paths)))
+        moved = set(top)
+        self.beginResetModel()
+        self.paths = top + [p for p in self.paths if p not in moved]
+        names = set()
+        for p in top:
+            if p in self.keys:
+                continue
+            self.by_name.setdefault(p.name, []).append(p)
+            if p.is_dir():
+                self.file_types[p] = "inode/directory"
+            else:
+                self.file_types[p] = guess_file_type(p)
+            names.add(p.name)
+        for name in names:
+            self.rename(name)
+        self.rows = {p: i for i, p in enumerate(self.paths)}
+        self.endResetModel()
+
+    def remove_paths(self, paths):
+        removed = set(paths) & self.keys.keys()
+        if not removed:
+            return
+        self.beginResetModel()
+        self.paths = [p for p in self.paths if p not in removed]
+        names = set()
+        for p in removed:
+            self.by_name[p.name].remove(p)
+            del self.keys[p]
+            del self.file_types[p]
+            self.tooltips.pop(p, None)
+            self.durations.pop(p, None)
+            self.complete.discard(p)
+            names.add(p.name)
+        for name in names:
+            if self.by_name[name]:
+                self.rename(name)
+            else:
+                del self.by_name[name]
+        self.rows = {p: i for i, p in enumerate(self.paths)}
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self.paths = []
+        self.rows = {}
+        self.keys = {}
+        self.by_name = {}
+        self.file_types = {}
+        self.tooltips = {}
+        self.durations = {}
+        self.complete = set()
+        self.endResetModel()
+
+    def rename(self, name):
+        group = self.by_name[name]
+        self.keys.update(zip(group, disambiguate_paths(group)))
+
+    def index_of(self, path):
+        if (row := self.rows.get(path)) is None:
+            return QtCore.QModelIndex()
+        return self.index(row)
+
+    def set_metadata(self, path, tooltip, duration=None, complete=False):
+        if path not in self.rows:
+            return
+        self.tooltips[path] = tooltip
+        if duration is not None:
+            self.durations[path] = duration
+        if complete:
+            self.complete.add(path)
+        else:
+            self.complete.discard(path)
+        index = self.index_of(path)
+        self.dataChanged.emit(index, index)
@@ -0,0 +1,55 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from motion_analysis_2d.defs import QtCore, Signal
+from motion_analysis_2d.funcs import scan_folder
+
+
+class FolderScanner(QtCore.QObject):
+    """Scans folders in a background thread and streams the clips found.
+
+    Clips are emitted in batches at most every batch_interval seconds, the
+    first batch of a scan is flagged so the file list can select it.
+    """
+
+    found = Signal(list, bool)
+
+    def __init__(self, batch_interval=0.25, parent=None):
+        super().__init__(parent)
+        self.batch_interval = batch_interval
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.stopped = threading.Event()
+
+    def scan(
+        self, folders, filetypes=None, recursive=False, include=None, exclude=None
+    ):
+        self.executor.submit(
+            self.scan_in_thread, list(folders), filetypes, recursive, include, exclude
+        )
+
+    def scan_in_thread(self, folders, filetypes, recursive, include, exclude):
+        batch = []
+        first = True
+        last_emit = perf_counter()
+        for folder in folders:
+            try:
+                for path in scan_folder(folder, filetypes, recursive, include, exclude):
+                    if self.stopped.is_set():
+                        return
+                    batch.append(path)
+                    if perf_counter() - last_emit > self.batch_interval:
+                        # queued to the thread of the scanner
+                        self.found.emit(batch, first)
+                        batch = []
+                        first = False
+                        last_emit = perf_counter()
+            except OSError as e:
+                logging.warning(f"Scanning {folder} stopped. {e}")
+        if batch:
+            self.found.emit(batch, first)
+
+    def shutdown(self):
+        self.stopped.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,46 @@
+import cv2 as cv
+
+rotate_codes = {
+    "90": cv.ROTATE_90_CLOCKWISE,
+    "180": cv.ROTATE_180,
+    "270": cv.ROTATE_90_COUNTERCLOCKWISE,
+}
+flip_codes = {"h_flip": 1, "v_flip": 0, "hv_flip": -1}
+
+
+class FrameProcessor:
+    """Picklable snapshot of the undistort, orient and perspective settings
+
+    The stabilizer is owned by the processor, give it a copy.
+    """
+
+    def __init__(
+        self,
+        undistort_maps=None,
+        rotation="0",
+        flip="no_flip",
+        warp=None,
+        stabilizer=None,
+    ):
+        self.undistort_maps = undistort_maps
+        self.rotation = rotation
+        self.flip = flip
+        self.warp = warp
+        self.stabilizer = stabilizer
+
+    def __call__(self, frame, frame_no):
+        if self.undistort_maps is not None:
+            frame = cv.remap(frame, *self.undistort_maps, cv.INTER_LINEAR)
+        if self.rotation in rotate_codes:
+            frame = cv.rotate(frame, rotate_codes[self.rotation])
+        if self.flip in flip_codes:
+            frame = cv.flip(frame, flip_codes[self.flip])
+        if self.warp is not None:
+            frame = cv.warpPerspective(frame, *self.warp)
+        if self.stabilizer is not None:
+            frame = self.stabilizer.stabilize(frame, frame_no)
+        return frame
+
+    @property
+    def shift(self):
+        return self.stabilizer.shift if self.stabilizer is not None else None
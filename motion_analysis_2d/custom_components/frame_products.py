@@ -0,0 +1,41 @@
+import cv2 as cv
+import numpy as np
+
+
+class FrameProducts:
+    """Images derived from one frame, computed once on first use and shared"""
+
+    def __init__(self, frame, shift=None, capture_time=None):
+        self.frame = frame
+        self.shift = shift
+        # perf_counter time a live frame was grabbed, for latency measurement
+        self.capture_time = capture_time
+        self._cache = {("frame", 1.0): frame}
+
+    @property
+    def gray(self):
+        return self.get("gray")
+
+    def get(self, product="frame", scale=1.0):
+        key = (product, float(scale))
+        if key not in self._cache:
+            self._cache[key] = self._compute(product, float(scale))
+        return self._cache[key]
+
+    def _compute(self, product, scale):
+        if scale != 1:
+            level = -np.log2(scale)
+            if level > 0 and level == int(level):
+                return cv.pyrDown(self.get(product, scale * 2))
+            return cv.resize(
+                self.get(product),
+                None,
+                fx=scale,
+                fy=scale,
+                interpolation=cv.INTER_AREA,
+            )
+        if product == "gray":
+            if self.frame.ndim == 2:
+                return self.frame
+            return cv.cvtColor(self.frame, cv.COLOR_BGR2GRAY)
+        raise KeyError(f"Unknown frame product {product}.")
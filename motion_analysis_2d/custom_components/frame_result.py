@@ -0,0 +1,60 @@
+import numpy as np
+
+
+class FrameResult:
+    """Copy of the tracking state after one frame, handed to the GUI.
+
+    Everything the GUI draws is copied, the tracking thread keeps writing into
+    its own arrays while the result is drawn. Only the rows written since the
+    last result are copied if rows is given, merge then completes them from the
+    previous result. Take a result with the lock of the tracking data held.
+    """
+
+    def __init__(
+        self, frame_no, timestamp, frame, tracking_data, analysis_data, rows=None
+    ):
+        self.frame_no = frame_no
+        self.timestamp = timestamp
+        # frames are replaced, not written into, by the stream
+        self.frame = frame
+        self.rows = None if rows is None else slice(*rows)
+        take = slice(None) if rows is None else self.rows
+        self.tracking_data = {
+            name: {
+                key: data[key][take].copy() for key in ("frame_no", "bbox", "target")
+            }
+            for name, data in tracking_data.items()
+        }
+        self.analysis_data = {
+            item_type: {
+                name: {
+                    key: value[take].copy()
+                    for key, value in data.items()
+                    if isinstance(value, np.ndarray)
+                }
+                for name, data in items.items()
+            }
+            for item_type, items in analysis_data.items()
+        }
+
+    def merge(self, previous):
+        """
+        Complete the rows of a partial result with the arrays of previous
+
+        The arrays of previous are written into and reused, they are owned by
+        the GUI and the other rows did not change since previous was taken.
+        """
+        if self.rows is None:
+            return
+        for name, data in self.tracking_data.items():
+            arrays = previous.tracking_data[name]
+            for key, rows in data.items():
+                arrays[key][self.rows] = rows
+            self.tracking_data[name] = arrays
+        for item_type, items in self.analysis_data.items():
+            for name, data in items.items():
+                arrays = previous.analysis_data[item_type][name]
+                for key, rows in data.items():
+                    arrays[key][self.rows] = rows
+                items[name] = arrays
+        self.rows = None
@@ -0,0 +1,64 @@
+import logging
+
+import cv2 as cv
+import numpy as np
+
+from motion_analysis_2d.funcs import open_frame_stack
+
+
+class FrameStackCapture:
+    """Memory-mapped uint8 frame stack read through the cv.VideoCapture interface.
+
+    Seeking only moves an index and colour frames are served as views into the
+    mapped file, the OS page cache does the reading. Like cv.VideoCapture, a
+    stack that cannot be read is not opened instead of raising.
+    """
+
+    def __init__(self, path, frame_rate=None):
+        try:
+            self.frames, stack_frame_rate = open_frame_stack(path)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Opening frame stack failed. {e}")
+            self.frames, stack_frame_rate = np.zeros((0, 1, 1), np.uint8), None
+        self.frame_rate = float(stack_frame_rate or frame_rate or 1.0)
+        self.pos = 0
+
+    def isOpened(self):
+        return self.frames is not None and len(self.frames) > 0
+
+    def grab(self):
+        if self.pos >= len(self.frames):
+            return False
+        self.pos += 1
+        return True
+
+    def read(self):
+        if self.pos >= len(self.frames):
+            return False, None
+        frame = self.frames[self.pos]
+        self.pos += 1
+        if frame.ndim == 2:
+            frame = cv.cvtColor(frame, cv.COLOR_GRAY2BGR)
+        elif frame.shape[2] == 4:
+            frame = cv.cvtColor(frame, cv.COLOR_BGRA2BGR)
+        return True, frame
+
+    def set(self, prop, value):
+        if prop == cv.CAP_PROP_POS_FRAMES:
+            self.pos = int(np.clip(value, 0, len(self.frames)))
+            return True
+        return False
+
+    def get(self, prop):
+        if prop == cv.CAP_PROP_POS_FRAMES:
+            return float(self.pos)
+        if prop == cv.CAP_PROP_POS_MSEC:
+            return max(self.pos - 1, 0) * 1000 / self.frame_rate
+        if prop == cv.CAP_PROP_FPS:
+            return self.frame_rate
+        if prop == cv.CAP_PROP_FRAME_COUNT:
+            return float(len(self.frames))
+        return 0.0
+
+    def release(self):
+        self.frames = None
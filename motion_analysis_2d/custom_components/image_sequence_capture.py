@@ -0,0 +1,81 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2 as cv
+import numpy as np
+
+from motion_analysis_2d.funcs import sequence_frames, sequence_timestamps
+
+
+def read_image(path):
+    # imdecode instead of imread to also handle non-ascii paths
+    return cv.imdecode(np.fromfile(str(path), dtype=np.uint8), cv.IMREAD_COLOR)
+
+
+class ImageSequenceCapture:
+    """Folder of numbered images read through the cv.VideoCapture interface.
+
+    The next frames are decoded ahead in a thread pool, cv.imdecode releases
+    the GIL so the decoding runs in parallel with tracking.
+    """
+
+    def __init__(self, folder, frame_rate=None, prefetch=8, workers=4):
+        self.frames = sequence_frames(folder)
+        self.timestamps, self.frame_rate = sequence_timestamps(
+            folder, len(self.frames), frame_rate
+        )
+        self.prefetch = prefetch
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.pending = {}
+        self.pos = 0
+
+    def isOpened(self):
+        return self.executor is not None and len(self.frames) > 0
+
+    def schedule(self):
+        window = range(self.pos, min(self.pos + self.prefetch, len(self.frames)))
+        for idx in list(self.pending):
+            if idx not in window:
+                self.pending.pop(idx).cancel()
+        for idx in window:
+            if idx not in self.pending:
+                self.pending[idx] = self.executor.submit(read_image, self.frames[idx])
+
+    def grab(self):
+        if self.pos >= len(self.frames):
+            return False
+        self.pos += 1
+        return True
+
+    def read(self):
+        if self.pos >= len(self.frames):
+            return False, None
+        self.schedule()
+        frame = self.pending.pop(self.pos).result()
+        self.pos += 1
+        self.schedule()
+        return frame is not None, frame
+
+    def set(self, prop, value):
+        if prop == cv.CAP_PROP_POS_FRAMES:
+            self.pos = int(np.clip(value, 0, len(self.frames)))
+            return True
+        return False
+
+    def get(self, prop):
+        if prop == cv.CAP_PROP_POS_FRAMES:
+            return float(self.pos)
+        if prop == cv.CAP_PROP_POS_MSEC:
+            return float(self.timestamps[self.pos - 1]) if self.pos > 0 else 0.0
+        if prop == cv.CAP_PROP_FPS:
+            return self.frame_rate
+        if prop == cv.CAP_PROP_FRAME_COUNT:
+            return float(len(self.frames))
+        return 0.0
+
+    def release(self):
+        if self.executor is not None:
+            for future in self.pending.values():
+                future.cancel()
+            self.pending = {}
+            self.executor.shutdown(wait=True)
+            self.executor = None
@@ -0,0 +1,112 @@
+import threading
+from time import perf_counter, sleep
+
+import cv2 as cv
+
+
+class LiveCapture:
+    """Camera or network stream read through the cv.VideoCapture interface.
+
+    A grabber thread keeps only the newest frame in a single slot. A frame that
+    is not read before the next one arrives is dropped, so a slow consumer never
+    blocks the grabber and always gets the most recent image. With pace=True a
+    video file is replayed at its native frame rate to simulate a camera.
+    """
+
+    def __init__(self, source, max_frames=36000, pace=False, frame_rate=None):
+        self.cap = cv.VideoCapture(source)
+        self.frame_rate = frame_rate or self.cap.get(cv.CAP_PROP_FPS) or 30.0
+        self.max_frames = max_frames
+        self.pace = pace
+        file_frames = int(self.cap.get(cv.CAP_PROP_FRAME_COUNT))
+        if pace and file_frames > 0:
+            self.max_frames = min(max_frames, file_frames)
+
+        self.condition = threading.Condition()
+        self.slot = None
+        self.grabbed = 0
+        self.dropped = 0
+        self.start_time = None
+        self.running = self.cap.isOpened()
+
+        self.pos = 0
+        self.capture_time = None
+
+        self.thread = threading.Thread(target=self.grab_loop, daemon=True)
+        self.thread.start()
+
+    def grab_loop(self):
+        start = perf_counter()
+        while self.running and self.grabbed < self.max_frames:
+            if self.pace:
+                delay = start + self.grabbed / self.frame_rate - perf_counter()
+                if delay > 0:
+                    sleep(delay)
+            ret, frame = self.cap.read()
+            if not ret:
+                break
+            capture_time = perf_counter()
+            with self.condition:
+                if self.start_time is None:
+                    self.start_time = capture_time
+                if self.slot is not None:
+                    self.dropped += 1
+                self.grabbed += 1
+                self.slot = (self.grabbed, capture_time, frame)
+                self.condition.notify()
+
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def read(self, timeout=1.0):
+        with self.condition:
+            self.condition.wait_for(
+                lambda: self.slot is not None or not self.running, timeout
+            )
+            if self.slot is None:
+                return False, None
+            self.pos, self.capture_time, frame = self.slot
+            self.slot = None
+        return True, frame
+
+    def grab(self):
+        return self.read()[0]
+
+    def set(self, prop, value):
+        # a live source can not seek
+        return False
+
+    def get(self, prop):
+        if prop == cv.CAP_PROP_POS_FRAMES:
+            return float(self.pos)
+        if prop == cv.CAP_PROP_POS_MSEC:
+            if self.capture_time is None:
+                return 0.0
+            return 1000 * (self.capture_time - self.start_time)
+        if prop == cv.CAP_PROP_FPS:
+            return self.frame_rate
+        if prop == cv.CAP_PROP_FRAME_COUNT:
+            return float(self.max_frames)
+        return 0.0
+
+    def release(self):
+        self.running = False
+        self.thread.join()
+        self.cap.release()
+
+
+def open_live_capture(source, simulate=False, max_frames=36000):
+    """
+    Open a live source
+
+    :param source: camera index, stream URL or video file
+    :param simulate: replay a video file at its native frame rate
+    :param max_frames: number of frames recorded before the source stops
+    """
+    if isinstance(source, str) and source.isdigit():
+        source = int(source)
+    return LiveCapture(source, max_frames, pace=simulate)
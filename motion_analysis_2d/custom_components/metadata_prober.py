@@ -0,0 +1,166 @@
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import cv2 as cv
+import numpy as np
+
+from motion_analysis_2d.defs import QtCore, Signal, metadata_cache_file
+from motion_analysis_2d.funcs import data_file_complete, file_signature
+from .capture_factory import open_capture
+
+
+def keyframe_spacing(path, max_packets=300):
+    """
+    Median distance between keyframes in the first packets of a video
+
+    Packets are only demuxed, not decoded. Returns None when the backend does
+    not report keyframes.
+    """
+    has_key_frame = getattr(cv, "CAP_PROP_LRF_HAS_KEY_FRAME", None)
+    if has_key_frame is None:
+        return None
+    cap = cv.VideoCapture(str(path))
+    keyframes = []
+    if cap.set(cv.CAP_PROP_FORMAT, -1):
+        for i in range(max_packets):
+            if not cap.grab():
+                break
+            if cap.get(has_key_frame):
+                keyframes.append(i)
+    cap.release()
+    if len(keyframes) < 2:
+        return None
+    return float(np.median(np.diff(keyframes)))
+
+
+def probe_video(path, frame_rate=None):
+    """
+    Read the properties of a clip without streaming it
+
+    :param path: video file, image sequence folder or .npy/.raw frame stack
+    :param frame_rate: frame rate used when the source does not store one
+    """
+    path = Path(path)
+    cap = open_capture(path, frame_rate)
+    try:
+        if not cap.isOpened():
+            return {"error": "not supported"}
+        fps = cap.get(cv.CAP_PROP_FPS) or frame_rate or 0.0
+        frames = int(cap.get(cv.CAP_PROP_FRAME_COUNT))
+        width = int(cap.get(cv.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv.CAP_PROP_FRAME_HEIGHT))
+        if width == 0 or height == 0:
+            ret, frame = cap.read()
+            if ret:
+                height, width = frame.shape[:2]
+        fourcc = int(cap.get(cv.CAP_PROP_FOURCC))
+    finally:
+        cap.release()
+
+    if isinstance(cap, cv.VideoCapture):
+        codec = "".join(chr((fourcc >> 8 * i) & 0xFF) for i in range(4)).strip("\0")
+        spacing = keyframe_spacing(path)
+    else:
+        # every frame of a sequence or stack is read on its own
+        codec, spacing = None, 1.0
+    return {
+        "frame_rate": fps,
+        "frames": frames,
+        "width": width,
+        "height": height,
+        "duration": frames / fps if fps > 0 else 0.0,
+        "codec": codec,
+        "keyframe_spacing": spacing,
+        "complete": data_file_complete(path, frames),
+    }
+
+
+class MetadataProber(QtCore.QObject):
+    """Probes clips in a thread pool and caches the results by file signature.
+
+    The cache is kept in the config folder, a clip is probed again when its
+    size or modification time, or those of its data file, change. Signatures
+    are checked in the pool and the cache is saved once probing settles, the
+    GUI thread does no file I/O.
+    """
+
+    probed = Signal(Path, dict)
+
+    def __init__(self, workers=4, save_delay=2000, parent=None):
+        super().__init__(parent)
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.cache_file = metadata_cache_file()
+        self.cache = self.load_cache()
+        self.lock = threading.Lock()
+        self.dirty = False
+        self.pending = set()
+        self.probed.connect(self.probe_finished)
+
+        self.save_timer = QtCore.QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(save_delay)
+        self.save_timer.timeout.connect(self.save_cache)
+
+    def load_cache(self):
+        if not self.cache_file.is_file():
+            return {}
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Metadata cache {self.cache_file} ignored. {e}")
+            return {}
+
+    def save_cache(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            text = json.dumps(self.cache)
+            self.dirty = False
+        try:
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                f.write(text)
+        except OSError as e:
+            logging.warning(f"Metadata cache {self.cache_file} not saved. {e}")
+
+    def probe(self, paths, frame_rate=None):
+        """Emit probed for each path, from the cache or once it is probed"""
+        for path in paths:
+            if path not in self.pending:
+                self.pending.add(path)
+                self.executor.submit(self.probe_in_thread, path, frame_rate)
+
+    def probe_in_thread(self, path, frame_rate):
+        try:
+            signature = file_signature(path)
+            with self.lock:
+                entry = self.cache.get(str(path))
+            if entry is not None and entry["signature"] == signature:
+                metadata = entry["metadata"]
+            else:
+                metadata = probe_video(path, frame_rate)
+                if not metadata.get("error"):
+                    with self.lock:
+                        self.cache[str(path)] = {
+                            "signature": signature,
+                            "metadata": metadata,
+                        }
+                        self.dirty = True
+        except Exception as e:
+            metadata = {"error": str(e)}
+        # queued to the thread of the prober
+        self.probed.emit(path, metadata)
+
+    def probe_finished(self, path, metadata):
+        self.pending.discard(path)
+        if self.dirty:
+            # one save after a burst of results
+            self.save_timer.start()
+
+    def shutdown(self):
+        self.save_timer.stop()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.save_cache()
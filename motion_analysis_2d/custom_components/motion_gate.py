@@ -0,0 +1,48 @@
+import numpy as np
+
+
+class MotionGate:
+    """Decide whether a tracker update can be skipped because its region is still.
+
+    The bbox region is compared with the same region at the last real tracker
+    update, so slow drift cannot hide behind small frame to frame differences.
+    """
+
+    def __init__(self, threshold=2.0, max_skip=10, downsample=4):
+        self.threshold = threshold
+        self.max_skip = max_skip
+        self.downsample = downsample
+
+        self.reference = None
+        self.skipped = 0
+        self.total_skipped = 0
+
+    def patch(self, gray, bbox):
+        x, y, w, h = (int(round(a)) for a in bbox)
+        x, y = max(x, 0), max(y, 0)
+        return gray[y : y + h : self.downsample, x : x + w : self.downsample].astype(
+            np.int16
+        )
+
+    def check(self, gray, bbox):
+        if self.reference is None or self.skipped >= self.max_skip:
+            return False
+
+        patch = self.patch(gray, bbox)
+        if patch.size == 0 or patch.shape != self.reference.shape:
+            return False
+
+        energy = np.abs(patch - self.reference).mean()
+        if energy < self.threshold:
+            self.skipped += 1
+            self.total_skipped += 1
+            return True
+        return False
+
+    def set_reference(self, gray, bbox):
+        self.reference = self.patch(gray, bbox)
+        self.skipped = 0
+
+    def reset(self):
+        self.reference = None
+        self.skipped = 0
@@ -0,0 +1,97 @@
+import cv2 as cv
+import numpy as np
+
+
+class MotionPredictor:
+    """Kalman filter on target position with constant velocity or acceleration.
+
+    Time is measured in frames, the transition is rebuilt when the number of
+    frames between updates changes.
+    """
+
+    def __init__(
+        self,
+        model="velocity",
+        process_noise=1e-2,
+        measurement_noise=1e-1,
+        max_dropout=5,
+    ):
+        self.model = model
+        self.max_dropout = max_dropout
+        self.dropout = 0
+
+        if model not in ("velocity", "acceleration"):
+            raise NotImplementedError
+        self.dt = 1
+        transition = self.transition(self.dt)
+
+        n_states = len(transition)
+        self.kalman = cv.KalmanFilter(n_states, 2)
+        self.kalman.transitionMatrix = transition
+        self.kalman.measurementMatrix = np.eye(2, n_states, dtype=np.float32)
+        self.kalman.processNoiseCov = np.eye(n_states, dtype=np.float32) * np.float32(
+            process_noise
+        )
+        self.kalman.measurementNoiseCov = np.eye(2, dtype=np.float32) * np.float32(
+            measurement_noise
+        )
+
+    def init(self, point):
+        n_states = self.kalman.transitionMatrix.shape[0]
+        state = np.zeros((n_states, 1), dtype=np.float32)
+        state[:2, 0] = point
+        self.kalman.statePre = state.copy()
+        self.kalman.statePost = state
+        self.kalman.errorCovPost = np.eye(n_states, dtype=np.float32)
+        self.dropout = 0
+
+    def transition(self, dt):
+        if self.model == "velocity":
+            return np.array(
+                [
+                    [1, 0, dt, 0],
+                    [0, 1, 0, dt],
+                    [0, 0, 1, 0],
+                    [0, 0, 0, 1],
+                ],
+                dtype=np.float32,
+            )
+        return np.array(
+            [
+                [1, 0, dt, 0, 0.5 * dt**2, 0],
+                [0, 1, 0, dt, 0, 0.5 * dt**2],
+                [0, 0, 1, 0, dt, 0],
+                [0, 0, 0, 1, 0, dt],
+                [0, 0, 0, 0, 1, 0],
+                [0, 0, 0, 0, 0, 1],
+            ],
+            dtype=np.float32,
+        )
+
+    def predict(self, dt=1):
+        """Predict the position dt frames after the last update
+
+        :param dt: number of frames since the last update
+        """
+        if dt != self.dt:
+            self.dt = dt
+            self.kalman.transitionMatrix = self.transition(dt)
+        prediction = self.kalman.predict()
+        return float(prediction[0, 0]), float(prediction[1, 0])
+
+    def correct(self, point):
+        self.dropout = 0
+        state = self.kalman.correct(np.array(point, dtype=np.float32).reshape(2, 1))
+        return float(state[0, 0]), float(state[1, 0])
+
+    def fill_dropout(self):
+        """Accept the last prediction as the state for a frame without measurement.
+
+        :return: True if the dropout is still short enough to be filled
+        """
+        if self.dropout >= self.max_dropout:
+            return False
+        self.dropout += 1
+        self.kalman.statePost = self.kalman.statePre.copy()
+        self.kalman.errorCovPost = self.kalman.errorCovPre.copy()
+        return True
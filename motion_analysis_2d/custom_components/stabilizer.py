@@ -0,0 +1,98 @@
+import copy
+
+import cv2 as cv
+import numpy as np
+
+
+class Stabilizer:
+    """Cancel global camera translation relative to the first frame of a video.
+
+    Shifts are estimated by phase correlation on a downscaled grayscale copy,
+    against the nearest of a set of keyframes with known shifts. The first
+    keyframe is frame 1. A frame that matches its keyframe poorly becomes a new
+    keyframe, chaining its shift back to frame 1, so slow drift and lighting
+    changes do not lose the lock. Frames can be read in any order.
+    """
+
+    def __init__(
+        self, downsample=4, min_response=0.05, refresh_response=0.3, max_keyframes=64
+    ):
+        self.downsample = downsample
+        self.min_response = min_response
+        self.refresh_response = refresh_response
+        self.max_keyframes = max_keyframes
+
+        self.frame_shape = None
+        self.window = None
+        # frame_no: (downscaled frame, shift from frame 1)
+        self.keyframes = {}
+        self.shift = (0.0, 0.0)
+
+    def reset(self):
+        self.frame_shape = None
+        self.window = None
+        self.keyframes = {}
+        self.shift = (0.0, 0.0)
+
+    def copy(self):
+        """Stabilizer with the same keyframes that can be used in another thread"""
+        stabilizer = copy.copy(self)
+        stabilizer.keyframes = dict(self.keyframes)
+        return stabilizer
+
+    def matches(self, frame):
+        return bool(self.keyframes) and self.frame_shape == frame.shape[:2]
+
+    def set_origin(self, frame):
+        """Use frame 1 of the video as the reference of all shifts"""
+        small = self.prepare(frame)
+        self.frame_shape = frame.shape[:2]
+        self.window = cv.createHanningWindow(small.shape[::-1], cv.CV_32F)
+        self.keyframes = {1: (small, (0.0, 0.0))}
+        self.shift = (0.0, 0.0)
+
+    def prepare(self, frame):
+        gray = frame if frame.ndim == 2 else cv.cvtColor(frame, cv.COLOR_BGR2GRAY)
+        scale = 1 / self.downsample
+        small = cv.resize(gray, None, fx=scale, fy=scale, interpolation=cv.INTER_AREA)
+        return np.float32(small)
+
+    def estimate(self, frame, frame_no):
+        small = self.prepare(frame)
+        key_no = min(self.keyframes, key=lambda k: abs(k - frame_no))
+        reference, key_shift = self.keyframes[key_no]
+        if key_no == frame_no:
+            return key_shift
+
+        (dx, dy), response = cv.phaseCorrelate(reference, small, self.window)
+        if response < self.min_response:
+            # no lock, the keyframe is the best known position
+            return key_shift
+        shift = (
+            key_shift[0] + dx * self.downsample,
+            key_shift[1] + dy * self.downsample,
+        )
+        if response < self.refresh_response:
+            self.add_keyframe(frame_no, small, shift)
+        return shift
+
+    def add_keyframe(self, frame_no, small, shift):
+        if len(self.keyframes) >= self.max_keyframes:
+            farthest = max(
+                (k for k in self.keyframes if k != 1), key=lambda k: abs(k - frame_no)
+            )
+            del self.keyframes[farthest]
+        self.keyframes[frame_no] = (small, shift)
+
+    def stabilize(self, frame, frame_no):
+        self.shift = self.estimate(frame, frame_no)
+        dx, dy = self.shift
+        if dx == 0 and dy == 0:
+            return frame
+        M = np.float32([[1, 0, -dx], [0, 1, -dy]])
+        return cv.warpAffine(
+            frame,
+            M,
+            (frame.shape[1], frame.shape[0]),
+            borderMode=cv.BORDER_REPLICATE,
+        )
@@ -0,0 +1,132 @@
+import numpy as np
+import pyqtgraph as pg
+from pyqtgraph import QtCore, QtGui
+
+
+def polyline_path(lines):
+    """One path from several polylines, with gaps at non-finite points"""
+    lines = [np.asarray(line, dtype=float).reshape(-1, 2) for line in lines]
+    if not lines:
+        return QtGui.QPainterPath()
+    points = np.concatenate(lines)
+    segment = np.repeat(np.arange(len(lines)), [len(line) for line in lines])
+    index = np.arange(len(points))
+
+    finite = np.isfinite(points).all(axis=1)
+    points, segment, index = points[finite], segment[finite], index[finite]
+    if not len(points):
+        return QtGui.QPainterPath()
+    # connect[i] draws a line from point i to point i + 1
+    connect = np.zeros(len(points), dtype=bool)
+    connect[:-1] = (segment[1:] == segment[:-1]) & (np.diff(index) == 1)
+    return pg.arrayToQPath(points[:, 0], points[:, 1], connect=connect)
+
+
+def box_corners(boxes):
+    """(n, 4) x, y, w, h boxes to (n, 5, 2) closed outlines"""
+    x, y, w, h = np.asarray(boxes, dtype=float).reshape(-1, 4).T
+    corner_x = np.stack([x, x + w, x + w, x, x], axis=1)
+    corner_y = np.stack([y, y, y + h, y + h, y], axis=1)
+    return np.stack([corner_x, corner_y], axis=2)
+
+
+class TrackerOverlay(pg.GraphicsObject):
+    """Boxes, targets and labels of all trackers in one item.
+
+    Paths are built per colour from arrays, so the scene holds one item instead
+    of four per tracker. Targets and labels keep their size on screen.
+    """
+
+    def __init__(self, visual_preferences):
+        pg.GraphicsObject.__init__(self)
+
+        self.visual_preferences = visual_preferences
+        self.paths = []
+        self.markers = []
+        self.data_rect = QtCore.QRectF()
+        self.pens = {}
+        self.label_margin = 150
+
+    def pen(self, color, width_key):
+        key = (tuple(color), width_key)
+        if key not in self.pens:
+            self.pens[key] = pg.mkPen(
+                color=color, width=self.visual_preferences[width_key]
+            )
+        return self.pens[key]
+
+    def update_visual_preferences(self):
+        self.pens = {}
+        self.update()
+
+    def set_data(self, boxes, targets, colors, names, visible):
+        """
+        :param boxes: (n, 4) x, y, w, h per tracker, NaN if not available
+        :param targets: (n, 2) target position per tracker, NaN if not available
+        :param colors: colour per tracker
+        :param names: name per tracker
+        :param visible: (n,) bool, trackers to draw
+        """
+        self.prepareGeometryChange()
+        groups = {}
+        for i in np.flatnonzero(visible):
+            groups.setdefault(tuple(colors[i]), []).append(i)
+
+        self.paths = []
+        for color, idx in groups.items():
+            self.paths.append(
+                (
+                    self.pen(color, "tracker_bbox_pen_width"),
+                    polyline_path(box_corners(boxes[idx])),
+                )
+            )
+
+        self.markers = [
+            (self.pen(colors[i], "tracker_target_pen_width"), *targets[i], names[i])
+            for i in np.flatnonzero(visible & np.isfinite(targets).all(axis=1))
+        ]
+
+        rect = QtCore.QRectF()
+        for _, path in self.paths:
+            rect = rect.united(path.boundingRect())
+        for _, x, y, _ in self.markers:
+            rect = rect.united(QtCore.QRectF(x, y, 0, 0))
+        self.data_rect = rect
+        self.update()
+
+    def viewTransformChanged(self):
+        # the margin for targets and labels depends on the zoom
+        self.prepareGeometryChange()
+
+    def boundingRect(self):
+        margin_x = self.label_margin * (self.pixelWidth() or 0)
+        margin_y = self.label_margin * (self.pixelHeight() or 0)
+        return self.data_rect.adjusted(-margin_x, -margin_y, margin_x, margin_y)
+
+    def paint(self, p, *args):
+        p.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        for pen, path in self.paths:
+            p.setPen(pen)
+            p.drawPath(path)
+
+        if not self.markers:
+            return
+        transform = p.transform()
+        p.resetTransform()
+        r = self.visual_preferences["tracker_target_size"] / 2
+        fill = pg.mkBrush(self.visual_preferences["item_name_label_fill_color"])
+        metrics = p.fontMetrics()
+        for pen, x, y, name in self.markers:
+            centre = transform.map(QtCore.QPointF(x, y))
+            p.setPen(pen)
+            p.setBrush(QtCore.Qt.NoBrush)
+            p.drawEllipse(centre, r, r)
+            p.drawLine(centre - QtCore.QPointF(r, 0), centre + QtCore.QPointF(r, 0))
+            p.drawLine(centre - QtCore.QPointF(0, r), centre + QtCore.QPointF(0, r))
+
+            label = QtCore.QRectF(metrics.boundingRect(name)).adjusted(-2, -1, 2, 1)
+            label.moveBottomLeft(centre + QtCore.QPointF(-20, -r))
+            p.fillRect(label, fill)
+            p.setPen(pen.color())
+            p.drawText(label, QtCore.Qt.AlignCenter, name)
+        p.setTransform(transform)
@@ -0,0 +1,204 @@
+import numpy as np
+import pyqtgraph as pg
+from pyqtgraph import QtCore, QtGui
+
+
+class TrajectoryItem(pg.GraphicsObject):
+    """Recent target positions of all trackers in one item.
+
+    Each tracker keeps a ring buffer of its last `length` targets. Stepping
+    forwards appends the new targets instead of slicing the history again, any
+    other jump refills the buffer. Trails are drawn in chunks of
+    length / bands frames, at most `max_chunk`, aligned to the frame number.
+    Whole chunks keep their path until they leave the trail, the buffer is
+    refilled or one of their targets is rewritten. A step only builds the paths
+    of the newest and oldest partial chunk, whatever the trail length.
+    """
+
+    def __init__(self, length=30, width=2, fade=255, bands=4, max_chunk=64):
+        pg.GraphicsObject.__init__(self)
+
+        self.length = length
+        self.width = width
+        self.fade = fade
+        self.bands = bands
+        self.max_chunk = max_chunk
+        self.chunk_size = self.fit_chunk_size()
+
+        self.buffer = np.full((0, length, 2), np.nan)
+        self.heads = np.zeros(0, dtype=int)
+        self.frames = np.zeros(0, dtype=int)
+        self.colors = []
+        self.visible = np.zeros(0, dtype=bool)
+        # per slot, chunk number: (path, bounding rect) of whole chunks
+        self.chunks = []
+        self.pens = {}
+
+        self.paths = []
+        self.rect = QtCore.QRectF()
+
+    def set_style(self, length, width, fade):
+        self.width = width
+        self.fade = fade
+        self.pens = {}
+        if length != self.length:
+            self.length = length
+            self.buffer = np.full((len(self.colors), length, 2), np.nan)
+            self.heads[:] = 0
+            self.frames[:] = -1
+            self.chunks = [{} for _ in self.colors]
+            self.chunk_size = self.fit_chunk_size()
+        self.rebuild()
+
+    def fit_chunk_size(self):
+        # at least a chunk per fade band
+        return int(np.clip(self.length // self.bands, 1, self.max_chunk))
+
+    def add_slot(self, color):
+        self.buffer = np.concatenate(
+            [self.buffer, np.full((1, self.length, 2), np.nan)]
+        )
+        self.heads = np.append(self.heads, 0)
+        self.frames = np.append(self.frames, -1)
+        self.colors.append(color)
+        self.visible = np.append(self.visible, True)
+        self.chunks.append({})
+
+    def remove_slot(self, i):
+        self.buffer = np.delete(self.buffer, i, axis=0)
+        self.heads = np.delete(self.heads, i)
+        self.frames = np.delete(self.frames, i)
+        self.colors.pop(i)
+        self.visible = np.delete(self.visible, i)
+        self.chunks.pop(i)
+        self.rebuild()
+
+    def set_color(self, i, color):
+        self.colors[i] = color
+        self.rebuild()
+
+    def set_visible(self, i, visible):
+        if self.visible[i] == visible:
+            return
+        self.visible[i] = visible
+        self.rebuild()
+
+    def clear(self):
+        self.buffer = np.full((0, self.length, 2), np.nan)
+        self.heads = np.zeros(0, dtype=int)
+        self.frames = np.zeros(0, dtype=int)
+        self.colors = []
+        self.visible = np.zeros(0, dtype=bool)
+        self.chunks = []
+        self.rebuild()
+
+    def update_slot(self, i, frame_i, target_all):
+        """
+        Bring the trail of slot i to the targets before frame_i
+
+        :param i: slot of the tracker
+        :param frame_i: index of the current frame, the trail ends before it
+        :param target_all: (n_frames, 2) targets of the tracker
+        """
+        last = self.frames[i]
+        step = frame_i - last
+        if last >= 0 and 0 <= step < self.length:
+            slots = (self.heads[i] + np.arange(step)) % self.length
+            self.buffer[i, slots] = target_all[last:frame_i]
+            self.heads[i] = (self.heads[i] + step) % self.length
+            self.frames[i] = frame_i
+            self.update_rewritten(i, target_all)
+        else:
+            history = target_all[max(frame_i - self.length, 0) : frame_i]
+            self.buffer[i] = np.nan
+            self.buffer[i, : len(history)] = history
+            self.heads[i] = len(history) % self.length
+            self.chunks[i] = {}
+            self.frames[i] = frame_i
+
+    def update_rewritten(self, i, target_all):
+        """
+        Take targets rewritten since they were buffered, e.g. by range tracking
+        or interpolation, and drop the chunks drawn through them
+
+        One vectorised comparison of the trail, no paths are built.
+        """
+        frame_i = self.frames[i]
+        frames = np.arange(max(frame_i - self.length, 0), frame_i)
+        slots = (self.heads[i] - frame_i + frames) % self.length
+        current = target_all[frames]
+        buffered = self.buffer[i, slots]
+        same = (buffered == current) | (np.isnan(buffered) & np.isnan(current))
+        changed = ~same.all(axis=1)
+        if not changed.any():
+            return
+        self.buffer[i, slots[changed]] = current[changed]
+        # a frame on a chunk border is also the end of the previous chunk
+        for frame in frames[changed]:
+            self.chunks[i].pop(frame // self.chunk_size, None)
+            self.chunks[i].pop((frame - 1) // self.chunk_size, None)
+
+    def chunk_path(self, i, first, last):
+        """Path through the buffered targets first to last of slot i"""
+        frames = np.arange(first, last + 1)
+        points = self.buffer[i, (self.heads[i] - self.frames[i] + frames) % self.length]
+        finite = np.isfinite(points).all(axis=1)
+        connect = finite & np.r_[finite[1:], False]
+        if not connect.any():
+            return None
+        path = pg.arrayToQPath(
+            np.nan_to_num(points[:, 0]), np.nan_to_num(points[:, 1]), connect=connect
+        )
+        return path, path.boundingRect()
+
+    def pen(self, color, alpha):
+        key = (*color[:3], alpha)
+        if key not in self.pens:
+            self.pens[key] = pg.mkPen(color=key, width=self.width)
+        return self.pens[key]
+
+    def rebuild(self):
+        self.prepareGeometryChange()
+        self.paths = []
+        self.rect = QtCore.QRectF()
+        size = self.chunk_size
+        bands = self.bands if self.fade < 255 else 1
+        for i, color in enumerate(self.colors):
+            # the trail holds the targets first to last
+            last = self.frames[i] - 1
+            first = max(last - self.length + 1, 0)
+            cache = self.chunks[i]
+            for k in [k for k in cache if k * size < first]:
+                del cache[k]
+            if not self.visible[i]:
+                continue
+
+            # chunk k runs from frame k * size to the first frame of chunk k + 1
+            for k in range(first // size, (last - 1) // size + 1):
+                start, end = max(k * size, first), min((k + 1) * size, last)
+                whole = start == k * size and end == (k + 1) * size
+                if whole and k in cache:
+                    chunk = cache[k]
+                else:
+                    chunk = self.chunk_path(i, start, end)
+                    if whole:
+                        cache[k] = chunk
+                if chunk is None:
+                    continue
+
+                # a chunk takes the age band of its newest target
+                band = (last - end) * bands // self.length
+                alpha = round(255 - (255 - self.fade) * band / max(bands - 1, 1))
+                path, rect = chunk
+                self.paths.append((self.pen(color, alpha), path))
+                self.rect = self.rect.united(rect)
+        self.update()
+
+    def boundingRect(self):
+        return self.rect
+
+    def paint(self, p, *args):
+        p.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        for pen, path in self.paths:
+            p.setPen(pen)
+            p.drawPath(path)
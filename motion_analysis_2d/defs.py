@@ -52,6 +52,10 @@ def visual_preferences_file():
     return config_dir() / "ma2d_visual.json"
 
 
+def metadata_cache_file():
+    return config_dir() / "ma2d_metadata.json"
+
+
 def log_file() -> Path:
     return config_dir() / f"{project_name}.log"
 
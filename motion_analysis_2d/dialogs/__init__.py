@@ -1,4 +1,7 @@
 from .angle_dialog import AngleDialog
+from .benchmark_dialog import BenchmarkDialog
 from .distance_dialog import DistanceDialog
+from .live_source_dialog import LiveSourceDialog
 from .perspective_dialog import PerspectiveDialog
+from .track_range_dialog import TrackRangeDialog
 from .tracker_dialog import TrackerDialog
@@ -0,0 +1,94 @@
+from motion_analysis_2d.defs import QtCore, QtWidgets
+from motion_analysis_2d.funcs import recommend_tracker
+
+
+class BenchmarkDialog(QtWidgets.QDialog):
+    def __init__(self, name, summary, current_tracker_type="CSRT", max_drift=2.0):
+        super().__init__()
+
+        self.summary = summary
+        self.tracker_type = current_tracker_type
+        self.setWindowFlag(QtCore.Qt.WindowContextHelpButtonHint, False)
+
+        self.resize(420, 300)
+        self.setWindowTitle(f"Evaluate Trackers ({name})")
+        self.main_layout = QtWidgets.QVBoxLayout(self)
+
+        self.table = QtWidgets.QTableWidget(len(summary), 4, self)
+        self.table.setHorizontalHeaderLabels(
+            ["Tracker", "FPS", "Failures", "Drift (px)"]
+        )
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        rows = sorted(summary.items(), key=lambda x: -x[1]["fps"])
+        for row, (tracker_type, stats) in enumerate(rows):
+            for col, text in enumerate(
+                [
+                    tracker_type,
+                    f"{stats['fps']:.0f}",
+                    f"{stats['failures']}",
+                    f"{stats['drift']:.2f}",
+                ]
+            ):
+                self.table.setItem(row, col, QtWidgets.QTableWidgetItem(text))
+        self.table.resizeColumnsToContents()
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.main_layout.addWidget(self.table)
+
+        self.form_layout = QtWidgets.QFormLayout()
+        self.main_layout.addLayout(self.form_layout)
+
+        self.max_drift_spinbox = QtWidgets.QDoubleSpinBox(self)
+        self.max_drift_spinbox.setRange(0, 1000)
+        self.max_drift_spinbox.setSingleStep(0.5)
+        self.max_drift_spinbox.setSuffix(" px")
+        self.max_drift_spinbox.setValue(max_drift)
+        self.max_drift_spinbox.valueChanged.connect(self.update_recommendation)
+        self.form_layout.addRow("Max drift: ", self.max_drift_spinbox)
+
+        self.recommendation_label = QtWidgets.QLabel(self)
+        self.form_layout.addRow("Recommended: ", self.recommendation_label)
+
+        self.ok_button = QtWidgets.QPushButton("Use Selected Tracker")
+        self.ok_button.clicked.connect(self.completed)
+        self.main_layout.addWidget(self.ok_button)
+
+        self.update_recommendation()
+
+    def update_recommendation(self):
+        recommended = recommend_tracker(self.summary, self.max_drift_spinbox.value())
+        self.recommendation_label.setText(recommended or "None")
+        for row in range(self.table.rowCount()):
+            item = self.table.item(row, 0)
+            font = item.font()
+            font.setBold(item.text() == recommended)
+            item.setFont(font)
+            if item.text() == recommended:
+                self.table.selectRow(row)
+
+    def completed(self):
+        row = self.table.currentRow()
+        if row >= 0:
+            self.tracker_type = self.table.item(row, 0).text()
+        self.accept()
+        self.close()
+
+    def get_inputs(self):
+        return self.tracker_type
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication([])
+
+    dialog = BenchmarkDialog(
+        "test",
+        {
+            "CSRT": {"fps": 30, "failures": 0, "drift": 0.5, "max_drift": 1},
+            "KCF": {"fps": 200, "failures": 0, "drift": 1.5, "max_drift": 3},
+        },
+    )
+    dialog.show()
+
+    app.exec()
@@ -0,0 +1,65 @@
+from motion_analysis_2d.defs import QtCore, QtWidgets
+
+
+class LiveSourceDialog(QtWidgets.QDialog):
+    def __init__(self, source="0", simulate=False, max_frames=36000):
+        super().__init__()
+
+        self.source = source
+        self.simulate = simulate
+        self.max_frames = max_frames
+        self.setWindowFlag(QtCore.Qt.WindowContextHelpButtonHint, False)
+
+        self.resize(300, 10)
+        self.setWindowTitle("Open Live Source")
+        self.main_layout = QtWidgets.QVBoxLayout(self)
+
+        self.form_layout = QtWidgets.QFormLayout()
+        self.main_layout.addLayout(self.form_layout)
+
+        self.source_edit = QtWidgets.QLineEdit(self)
+        self.source_edit.setText(source)
+        self.source_edit.setToolTip(
+            "Camera index (0, 1, ...), stream URL (rtsp://...) or video file."
+        )
+        self.form_layout.addRow("Source: ", self.source_edit)
+
+        self.simulate_checkbox = QtWidgets.QCheckBox(self)
+        self.simulate_checkbox.setChecked(simulate)
+        self.simulate_checkbox.setToolTip(
+            "Replay a video file at its native frame rate like a camera."
+        )
+        self.form_layout.addRow("Simulate: ", self.simulate_checkbox)
+
+        self.max_frames_spinbox = QtWidgets.QSpinBox(self)
+        self.max_frames_spinbox.setRange(10, 10000000)
+        self.max_frames_spinbox.setValue(max_frames)
+        self.max_frames_spinbox.setToolTip("Number of frames recorded from the source.")
+        self.form_layout.addRow("Max frames: ", self.max_frames_spinbox)
+
+        self.main_layout.addStretch()
+
+        self.ok_button = QtWidgets.QPushButton("Open")
+        self.ok_button.clicked.connect(self.completed)
+        self.main_layout.addWidget(self.ok_button)
+
+        self.main_layout.addStretch()
+
+    def completed(self):
+        self.source = self.source_edit.text().strip()
+        self.simulate = self.simulate_checkbox.isChecked()
+        self.max_frames = self.max_frames_spinbox.value()
+        self.accept()
+        self.close()
+
+    def get_inputs(self):
+        return self.source, self.simulate, self.max_frames
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication([])
+
+    dialog = LiveSourceDialog()
+    dialog.show()
+
+    app.exec()
@@ -0,0 +1,57 @@
+from motion_analysis_2d.defs import QtCore, QtWidgets
+
+
+class TrackRangeDialog(QtWidgets.QDialog):
+    def __init__(self, start=1, last_frame=1):
+        super().__init__()
+
+        self.start = start
+        self.end = last_frame
+        self.setWindowFlag(QtCore.Qt.WindowContextHelpButtonHint, False)
+
+        self.resize(60, 10)
+        self.setWindowTitle("Track Range")
+        self.main_layout = QtWidgets.QVBoxLayout(self)
+
+        self.form_layout = QtWidgets.QFormLayout()
+        self.main_layout.addLayout(self.form_layout)
+
+        self.start_spinbox = QtWidgets.QSpinBox(self)
+        self.start_spinbox.setRange(1, last_frame)
+        self.start_spinbox.setValue(start)
+        self.start_spinbox.setToolTip("Frame the trackers are positioned on.")
+        self.form_layout.addRow("From frame: ", self.start_spinbox)
+
+        self.end_spinbox = QtWidgets.QSpinBox(self)
+        self.end_spinbox.setRange(1, last_frame)
+        self.end_spinbox.setValue(last_frame)
+        self.end_spinbox.setToolTip(
+            "Frames before the start frame are tracked backwards."
+        )
+        self.form_layout.addRow("To frame: ", self.end_spinbox)
+
+        self.main_layout.addStretch()
+
+        self.ok_button = QtWidgets.QPushButton("Track")
+        self.ok_button.clicked.connect(self.completed)
+        self.main_layout.addWidget(self.ok_button)
+
+        self.main_layout.addStretch()
+
+    def completed(self):
+        self.start = self.start_spinbox.value()
+        self.end = self.end_spinbox.value()
+        self.accept()
+        self.close()
+
+    def get_inputs(self):
+        return self.start, self.end
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication([])
+
+    dialog = TrackRangeDialog(10, 100)
+    dialog.show()
+
+    app.exec()
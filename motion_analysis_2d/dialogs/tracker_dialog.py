@@ -8,12 +8,14 @@ class TrackerDialog(QtWidgets.QDialog):
         default_name="",
         default_color=tab10_rgb["green"],
         default_tracker_type="CSRT",
+        default_predict=False,
     ):
         super().__init__()
 
         self.name = default_name
         self.color = default_color
         self.tracker_type = default_tracker_type
+        self.predict = default_predict
         self.setWindowFlag(QtCore.Qt.WindowContextHelpButtonHint, False)
 
         self.resize(60, 10)
@@ -39,12 +41,20 @@ class TrackerDialog(QtWidgets.QDialog):
                 "Boosting",
                 "MOSSE",
                 "MIL",
+                "Cascade",
                 "Static",
             ]
         )
         self.tracking_combobox.setCurrentText(self.tracker_type)
         self.form_layout.addRow("Tracker: ", self.tracking_combobox)
 
+        self.predict_checkbox = QtWidgets.QCheckBox(self)
+        self.predict_checkbox.setChecked(self.predict)
+        self.predict_checkbox.setToolTip(
+            "Predict target motion to guide re-acquisition and bridge short dropouts."
+        )
+        self.form_layout.addRow("Predict motion: ", self.predict_checkbox)
+
         self.color_button = ColorButton(self)
         self.color_button.set_default_color("green")
         self.color_button.set_rbg(self.color)
@@ -62,11 +72,12 @@ class TrackerDialog(QtWidgets.QDialog):
         self.name = self.name_edit.text()
         self.color = self.color_button.get_rgb()
         self.tracker_type = self.tracking_combobox.currentText()
+        self.predict = self.predict_checkbox.isChecked()
         self.accept()
         self.close()
 
     def get_inputs(self):
-        return self.name, self.color, self.tracker_type
+        return self.name, self.color, self.tracker_type, self.predict
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 import logging
 
+import numpy as np
 import pyqtgraph as pg
 
 from motion_analysis_2d.custom_components import tab10_rgb_cycle, PieItem
@@ -273,12 +274,14 @@ class AngleItem(BaseDisplayItem):
         self._items["end2"].append(props["end2"])
         self._items["color"].append(props["color"])
         self._items["show"].append([True, True, True])
+        self.add_slot((vec1_start_x, vec1_start_y))
 
         logging.debug(f"Angle {props['name']} added to frame display.")
 
     def edit_item_props(self, name, props):
-        i = self._items["name"].index(name)
+        i = self.index_of(name)
         self._items["name"][i] = props["name"]
+        self.reindex()
         self._items["color"][i] = props["color"]
 
         sector_pen = pg.mkPen(
@@ -309,60 +312,52 @@ class AngleItem(BaseDisplayItem):
                     children.add((props["name"], "angle"))
 
     def update_item(self, name, dragged=False):
-        i = self._items["name"].index(name)
-        start1 = self._items["start1"][i]
-        end1 = self._items["end1"][i]
-        start2 = self._items["start2"][i]
-        end2 = self._items["end2"][i]
-        color = self._items["color"][i]
-        vec1 = self._items["vec1"][i]
-        vec2 = self._items["vec2"][i]
-        pie = self._items["pie"][i]
-        label = self._items["label"][i]
-
-        vec1_start_x, vec1_start_y = self.get_pos_from_parent_name(start1)
-        vec1_end_x, vec1_end_y = self.get_pos_from_parent_name(end1)
-        vec2_start_x, vec2_start_y = self.get_pos_from_parent_name(start2)
-        vec2_end_x, vec2_end_y = self.get_pos_from_parent_name(end2)
-
-        (vec1_angle,) = angle_vec(
-            [[vec1_end_x - vec1_start_x, vec1_end_y - vec1_start_y]]
-        )
-        (vec2_angle,) = angle_vec(
-            [[vec2_end_x - vec2_start_x, vec2_end_y - vec2_start_y]]
-        )
-
-        vec1.setData(
-            [vec1_start_x, vec1_end_x],
-            [vec1_start_y, vec1_end_y],
-        )
-        vec2.setData(
-            [vec2_start_x, vec2_end_x],
-            [vec2_start_y, vec2_end_y],
-        )
+        self.update_items([name], dragged=dragged)
+
+    def update_items(self, names, dragged=False):
+        """
+        Follow the parent trackers of several angles, with the angles of all
+        vectors computed at once
+
+        :param names: names of the angles
+        :param dragged: the parents were moved by the user
+        """
+        idx = [self.index_of(name) for name in names]
+        parents = [
+            [self.parent.index_of(self._items[n][i]) for n in self.parent_item_names]
+            for i in idx
+        ]
+        start1, end1, start2, end2 = self.parent.positions[
+            np.array(parents, dtype=int).reshape(-1, 4).T
+        ]
+        vec1_angle, vec2_angle = angle_vec(
+            np.concatenate([end1 - start1, end2 - start2])
+        ).reshape(2, -1)
+        radius = self.visual_preferences["angle_sector_radius"]
+
+        for k, i in enumerate(idx):
+            self._items["vec1"][i].setData(*np.transpose([start1[k], end1[k]]))
+            self._items["vec2"][i].setData(*np.transpose([start2[k], end2[k]]))
+            self._items["pie"][i].setData(
+                center=tuple(start1[k]),
+                radius=radius,
+                start_angle=vec1_angle[k],
+                span_angle=vec2_angle[k] - vec1_angle[k],
+            )
+            self._items["label"][i].setPos(
+                round(start1[k, 0]) + radius, round(start1[k, 1])
+            )
+        self.positions[idx] = start1
 
-        pie.setData(
-            center=(vec1_start_x, vec1_start_y),
-            radius=self.visual_preferences["angle_sector_radius"],
-            start_angle=vec1_angle,
-            span_angle=vec2_angle - vec1_angle,
-        )
-        label.setPos(
-            round(vec1_start_x) + self.visual_preferences["angle_sector_radius"],
-            round(vec1_start_y),
-        )
-        props = {
-            "name": name,
-            "start1": start1,
-            "end1": end1,
-            "start2": start2,
-            "end2": end2,
-        }
         if dragged:
-            self.item_moved("angle", props)
+            for i in idx:
+                props = {
+                    n: self._items[n][i] for n in ("name", *self.parent_item_names)
+                }
+                self.item_moved("angle", props)
 
     def start_edit_item(self, name):
-        i = self._items["name"].index(name)
+        i = self.index_of(name)
         color = self._items["color"][i]
 
         dialog = AngleDialog(default_name=name, default_color=color)
@@ -378,5 +373,4 @@ class AngleItem(BaseDisplayItem):
             self.emit_edit_item(name, props)
 
     def get_pos_from_parent_name(self, name):
-        i = self.parent["name"].index(name)
-        return self.parent["target"][i].pos()
+        return pg.Point(*self.parent.positions[self.parent.index_of(name)])
@@ -1,5 +1,7 @@
 import logging
 
+import numpy as np
+
 from motion_analysis_2d.funcs import prevent_name_collision
 
 
@@ -16,6 +18,11 @@ class BaseDisplayItem:
         self.steps_index = 0
 
         self._items = None
+        # name -> slot in the lists of _items, and one position per slot
+        self._index = {}
+        self.positions = np.empty((0, 2))
+        # children of moved items, updated together by flush_children
+        self.dirty_children = set()
         self.temp_item = None
         self.item_type_name = "base"
 
@@ -101,8 +108,8 @@ class BaseDisplayItem:
     def frame_shape_changed(self):
         pass
 
-    def update_child_item(self, child_type, child_name, **kwargs):
-        self.display.update_child_item(child_type, child_name, **kwargs)
+    def update_child_items(self, child_type, child_names, **kwargs):
+        self.display.update_child_items(child_type, child_names, **kwargs)
 
     def update_parents_of_child(
         self, child_type, child_name, old_parent_name, new_parent_name
@@ -112,7 +119,7 @@ class BaseDisplayItem:
         )
 
     def change_parent(self, name, parent_name, new_parent_name):
-        i = self._items["name"].index(name)
+        i = self.index_of(name)
         for x in self.parent_item_names:
             if self._items[x][i] == parent_name:
                 self._items[x][i] = new_parent_name
@@ -126,6 +133,20 @@ class BaseDisplayItem:
     def clear(self):
         for l in self._items.values():
             l.clear()
+        self._index = {}
+        self.positions = np.empty((0, 2))
+        self.dirty_children = set()
+
+    def index_of(self, name):
+        return self._index[name]
+
+    def reindex(self):
+        self._index = {name: i for i, name in enumerate(self._items["name"])}
+
+    def add_slot(self, position=(np.nan, np.nan)):
+        """Index the item just appended to the lists of _items"""
+        self.positions = np.vstack([self.positions, position])
+        self.reindex()
 
     def prevent_name_collision(self, name):
         return prevent_name_collision(name, self._items["name"])
@@ -137,7 +158,7 @@ class BaseDisplayItem:
         return self._items.items()
 
     def remove_item(self, name):
-        i = self._items["name"].index(name)
+        i = self.index_of(name)
         if all(self._items["show"][i]):
             self.remove_items_from_display(
                 [self._items[x][i] for x in self.display_item_names]
@@ -154,26 +175,28 @@ class BaseDisplayItem:
 
         for item in self._items.values():
             item.pop(i)
+        self.positions = np.delete(self.positions, i, axis=0)
+        self.reindex()
 
         logging.debug(
             f"{self.item_type_name.capitalize()} {name} removed from frame display."
         )
 
     def add_child_to_parent(self, parent_name, name):
-        i = self.parent["name"].index(parent_name)
+        i = self.parent.index_of(parent_name)
         if (name, self.item_type_name) not in self.parent["children"][i]:
             self.parent["children"][i].add((name, self.item_type_name))
         logging.debug(f"Child {(name, self.item_type_name)} added to {parent_name}.")
 
     def remove_child_from_parent(self, parent_name, name):
-        i = self.parent["name"].index(parent_name)
+        i = self.parent.index_of(parent_name)
         self.parent["children"][i].discard((name, self.item_type_name))
         logging.debug(
             f"Child {(name, self.item_type_name)} removed from {parent_name}."
         )
 
     def hide_item(self, name, index=0):
-        i = self._items["name"].index(name)
+        i = self.index_of(name)
         assert index < len(self._items["show"][i]), "Invalid index!"
 
         if not all(self._items["show"][i]):
@@ -189,7 +212,7 @@ class BaseDisplayItem:
             )
 
     def show_item(self, name, index=0):
-        i = self._items["name"].index(name)
+        i = self.index_of(name)
         assert index < len(self._items["show"][i]), "Invalid index!"
 
         if all(self._items["show"][i]):
@@ -207,3 +230,41 @@ class BaseDisplayItem:
 
     def set_data(self, name, data):
         pass
+
+    def set_all_data(self, frame_i, data):
+        """
+        Update many items for one frame
+
+        :param frame_i: index of the frame in the data arrays
+        :param data: {name: data arrays as taken by set_data after frame_i}
+        """
+        for name, item_data in data.items():
+            self.set_data(name, (frame_i, *item_data))
+
+    def update_item(self, name, dragged=False):
+        pass
+
+    def update_items(self, names, dragged=False):
+        """
+        Follow the parents of several items after they moved
+
+        :param names: names of the items
+        :param dragged: the parents were moved by the user
+        """
+        for name in names:
+            self.update_item(name, dragged=dragged)
+
+    def mark_children_dirty(self, children):
+        self.dirty_children.update(children)
+
+    def flush_children(self, dragged=False):
+        children, self.dirty_children = self.dirty_children, set()
+        self.update_children(children, dragged=dragged)
+
+    def update_children(self, children, dragged=False):
+        """Update each child once, also when it depends on several moved items"""
+        names_by_type = {}
+        for child_name, child_type in children:
+            names_by_type.setdefault(child_type, []).append(child_name)
+        for child_type, child_names in names_by_type.items():
+            self.update_child_items(child_type, child_names, dragged=dragged)
@@ -198,12 +198,14 @@ class DistanceItem(BaseDisplayItem):
         self._items["end"].append(props["end"])
         self._items["color"].append(props["color"])
         self._items["show"].append([True, True, True])
+        self.add_slot(((start_pos + end_pos) / 2).toTuple())
 
         logging.debug(f"Distance {props['name']} added to frame display.")
 
     def edit_item_props(self, name, props):
-        i = self._items["name"].index(name)
+        i = self.index_of(name)
         self._items["name"][i] = props["name"]
+        self.reindex()
         self._items["color"][i] = props["color"]
 
         pen = pg.mkPen(
@@ -225,7 +227,7 @@ class DistanceItem(BaseDisplayItem):
                     children.add((props["name"], "distance"))
 
     def update_item(self, name, dragged=False):
-        i = self._items["name"].index(name)
+        i = self.index_of(name)
         start = self._items["start"][i]
         end = self._items["end"][i]
         arrow = self._items["arrow"][i]
@@ -237,6 +239,7 @@ class DistanceItem(BaseDisplayItem):
 
         arrow.setData(start_pos, end_pos)
         label.setPos((start_pos + end_pos) / 2)
+        self.positions[i] = ((start_pos + end_pos) / 2).toTuple()
 
         props = {
             "name": name,
@@ -247,7 +250,7 @@ class DistanceItem(BaseDisplayItem):
             self.item_moved("distance", props)
 
     def start_edit_item(self, name):
-        i = self._items["name"].index(name)
+        i = self.index_of(name)
         color = self._items["color"][i]
 
         dialog = DistanceDialog(default_name=name, default_color=color)
@@ -263,5 +266,4 @@ class DistanceItem(BaseDisplayItem):
             self.emit_edit_item(name, props)
 
     def get_pos_from_parent_name(self, name):
-        i = self.parent["name"].index(name)
-        return self.parent["target"][i].pos()
+        return pg.Point(*self.parent.positions[self.parent.index_of(name)])
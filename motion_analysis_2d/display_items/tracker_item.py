@@ -4,7 +4,11 @@ from functools import partial
 import numpy as np
 import pyqtgraph as pg
 
-from motion_analysis_2d.custom_components import tab10_rgb_cycle
+from motion_analysis_2d.custom_components import (
+    tab10_rgb_cycle,
+    TrackerOverlay,
+    TrajectoryItem,
+)
 from motion_analysis_2d.dialogs import TrackerDialog
 from .base_item_display import BaseDisplayItem
 
@@ -21,16 +25,16 @@ class TrackerItem(BaseDisplayItem):
             "roi": [],
             "label": [],
             "target": [],
-            "traj": [],
             "offset": [],
             "color": [],
             "tracker_type": [],
+            "predict": [],
             "children": [],
             "show": [],
         }
         self.temp_item = None
         self.display_item_types = (pg.ROI, pg.TargetItem)
-        self.display_item_names = ("roi", "target", "traj")
+        self.display_item_names = ("roi", "target")
         self.steps = (
             "Starting...",
             "Select target point.",
@@ -40,13 +44,29 @@ class TrackerItem(BaseDisplayItem):
         )
         self.steps_index = 0
 
+        # during playback all trackers can be drawn by one overlay item
+        self.overlay = TrackerOverlay(self.visual_preferences)
+        self.overlay_active = False
+        self.last_data = None
+
+        # trajectories of all trackers are drawn by one item in both modes
+        self.trajectories = TrajectoryItem(*self.trajectory_style())
+
+    def trajectory_style(self):
+        return (
+            self.visual_preferences["trajectory_length"],
+            self.visual_preferences["trajectory_width"],
+            self.visual_preferences.get("trajectory_fade_transparency", 255),
+        )
+
     def update_visual_preferences(self, preferences, new_item_pen):
         super().update_visual_preferences(preferences, new_item_pen)
+        self.overlay.update_visual_preferences()
+        self.trajectories.set_style(*self.trajectory_style())
         for i in range(len(self._items["name"])):
             color = self._items["color"][i]
             roi = self._items["roi"][i]
             target = self._items["target"][i]
-            traj = self._items["traj"][i]
             label = self._items["label"][i]
 
             bbox_pen = pg.mkPen(
@@ -65,10 +85,6 @@ class TrackerItem(BaseDisplayItem):
                 color=color,
                 width=self.visual_preferences["tracker_bbox_hover_pen_width"],
             )
-            trajectory_pen = pg.mkPen(
-                color=color, width=self.visual_preferences["trajectory_width"]
-            )
-
             roi.setPen(bbox_pen)
             roi.hoverPen = bbox_hover_pen
 
@@ -81,8 +97,6 @@ class TrackerItem(BaseDisplayItem):
                 self.visual_preferences["item_name_label_fill_color"]
             )
 
-            traj.setPen(trajectory_pen)
-
     def start_item_suggestion(self):
         new_roi = pg.ROI(
             (0, 0),
@@ -192,9 +206,16 @@ class TrackerItem(BaseDisplayItem):
         dialog = TrackerDialog(default_color=next(tab10_rgb_cycle))
         dialog.exec()
         if dialog.result():
-            name, color, tracker_type = dialog.get_inputs()
+            name, color, tracker_type, predict = dialog.get_inputs()
             name = self.prevent_name_collision(name)
-            props.update({"name": name, "color": color, "tracker_type": tracker_type})
+            props.update(
+                {
+                    "name": name,
+                    "color": color,
+                    "tracker_type": tracker_type,
+                    "predict": predict,
+                }
+            )
             self.emit_new_item(props)
             self.reset_temp_item()
         else:
@@ -226,10 +247,6 @@ class TrackerItem(BaseDisplayItem):
             color=props["color"],
             width=self.visual_preferences["tracker_bbox_hover_pen_width"],
         )
-        trajectory_pen = pg.mkPen(
-            color=props["color"], width=self.visual_preferences["trajectory_width"]
-        )
-
         roi = pg.ROI(
             props["bbox_pos"],
             size=props["bbox_size"],
@@ -265,27 +282,34 @@ class TrackerItem(BaseDisplayItem):
             color=target_pen.color(),
             fill=self.visual_preferences["item_name_label_fill_color"],
         )
-        traj = pg.PlotDataItem(pen=trajectory_pen)
-        self.add_items_to_display([target, roi, traj])
+        self.add_items_to_display([target, roi])
+        if self.trajectories.scene() is None:
+            self.add_items_to_display([self.trajectories])
 
         self._items["name"].append(props["name"])
         self._items["roi"].append(roi)
         self._items["target"].append(target)
         self._items["label"].append(label)
-        self._items["traj"].append(traj)
         self._items["offset"].append(props["offset"])
         self._items["color"].append(props["color"])
         self._items["tracker_type"].append(props["tracker_type"])
+        self._items["predict"].append(props.get("predict", False))
         self._items["children"].append(set())
         self._items["show"].append([True, True, True])
+        self.add_slot(target_pos)
+        self.trajectories.add_slot(props["color"])
+        if self.overlay_active:
+            self.hide_item(props["name"], 2)
 
         logging.debug(f"Tracker {props['name']} added to frame display.")
 
     def edit_item_props(self, name, props):
-        i = self._items["name"].index(name)
+        i = self.index_of(name)
         self._items["name"][i] = props["name"]
+        self.reindex()
         self._items["color"][i] = props["color"]
         self._items["tracker_type"][i] = props["tracker_type"]
+        self._items["predict"][i] = props.get("predict", False)
 
         bbox_pen = pg.mkPen(
             color=props["color"],
@@ -310,11 +334,7 @@ class TrackerItem(BaseDisplayItem):
         self._items["target"][i].setHoverPen(target_hover_pen)
         self._items["label"][i].setColor(target_pen.color())
         self._items["label"][i].setText(props["name"])
-
-        trajectory_pen = pg.mkPen(
-            color=props["color"], width=self.visual_preferences["trajectory_width"]
-        )
-        self._items["traj"][i].setPen(trajectory_pen)
+        self.trajectories.set_color(i, props["color"])
 
         if props["name"] != name:
             children = self._items["children"][i]
@@ -324,16 +344,36 @@ class TrackerItem(BaseDisplayItem):
                         child_type, child_name, name, props["name"]
                     )
 
+    def remove_item(self, name):
+        i = self.index_of(name)
+        super().remove_item(name)
+        self.trajectories.remove_slot(i)
+
+    def hide_item(self, name, index=0):
+        super().hide_item(name, index)
+        self.update_trajectory_visibility(name)
+
+    def show_item(self, name, index=0):
+        super().show_item(name, index)
+        self.update_trajectory_visibility(name)
+
+    def update_trajectory_visibility(self, name):
+        # the trajectory also stays visible while the overlay is active
+        i = self.index_of(name)
+        show = self._items["show"][i]
+        self.trajectories.set_visible(i, show[0] and show[1])
+
     def frame_shape_changed(self):
         for name in self._items["name"]:
             self.bbox_moved(name)
 
     def bbox_moved(self, name, roi=None):
-        i = self._items["name"].index(name)
+        i = self.index_of(name)
         roi = self._items["roi"][i]
         target = self._items["target"][i]
         offset = self._items["offset"][i]
         tracker_type = self._items["tracker_type"][i]
+        predict = self._items["predict"][i]
         color = self._items["color"][i]
         children = self._items["children"][i]
 
@@ -348,6 +388,7 @@ class TrackerItem(BaseDisplayItem):
             target.blockSignals(True)
             target.setPos(target_pos)
             target.blockSignals(False)
+            self.positions[i] = target_pos
 
         elif self.dragging_mode == "bbox_follows_target":
             offset = [round(a) for a in target.pos() - self.calc_centre_roi(roi)]
@@ -355,9 +396,7 @@ class TrackerItem(BaseDisplayItem):
         else:
             raise Exception("Unknown dragging mode")
 
-        if len(children) > 0:
-            for child_name, child_type in children:
-                self.update_child_item(child_type, child_name, dragged=True)
+        self.update_children(children, dragged=True)
 
         props = {
             "name": name,
@@ -366,19 +405,22 @@ class TrackerItem(BaseDisplayItem):
             "offset": offset,
             "color": color,
             "tracker_type": tracker_type,
+            "predict": predict,
         }
 
         self.item_moved("tracker", props)
 
     def target_moved(self, name, target=None):
-        i = self._items["name"].index(name)
+        i = self.index_of(name)
         target = self._items["target"][i]
         offset = self._items["offset"][i]
         roi = self._items["roi"][i]
         tracker_type = self._items["tracker_type"][i]
+        predict = self._items["predict"][i]
         color = self._items["color"][i]
         children = self._items["children"][i]
 
+        self.positions[i] = target.pos().x(), target.pos().y()
         if self.dragging_mode == "target_follows_bbox":
             bbox_pos = [round(a) for a in roi.pos()]
             bbox_size = [round(a) for a in roi.size()]
@@ -399,9 +441,7 @@ class TrackerItem(BaseDisplayItem):
         else:
             raise Exception("Unknown dragging mode")
 
-        if len(children) > 0:
-            for child_name, child_type in children:
-                self.update_child_item(child_type, child_name, dragged=True)
+        self.update_children(children, dragged=True)
 
         props = {
             "name": name,
@@ -410,6 +450,7 @@ class TrackerItem(BaseDisplayItem):
             "offset": offset,
             "color": color,
             "tracker_type": tracker_type,
+            "predict": predict,
         }
         self.item_moved("tracker", props)
 
@@ -417,9 +458,68 @@ class TrackerItem(BaseDisplayItem):
         frame_i, bbox_all, target_all = data
         self.set_tracker_pos(name, frame_i, bbox_all, target_all)
         self.set_trajectory(name, frame_i, bbox_all, target_all)
+        self.flush_children()
+
+    def set_all_data(self, frame_i, data):
+        self.last_data = (frame_i, data)
+        if self.overlay_active:
+            self.update_overlay(frame_i, data)
+            return
+
+        for name, (bbox_all, target_all) in data.items():
+            self.set_tracker_pos(name, frame_i, bbox_all, target_all)
+            self.set_trajectory(name, frame_i, bbox_all, target_all, rebuild=False)
+        self.trajectories.rebuild()
+        self.flush_children()
+
+    def set_fast_overlay(self, enabled):
+        """Swap the interactive items of all trackers for the overlay"""
+        if enabled == self.overlay_active:
+            return
+        self.overlay_active = enabled
+        if enabled:
+            for name in self._items["name"]:
+                self.hide_item(name, 2)
+            self.add_items_to_display([self.overlay])
+            if self.last_data is not None:
+                self.update_overlay(*self.last_data)
+        else:
+            self.remove_items_from_display([self.overlay])
+            for name in self._items["name"]:
+                self.show_item(name, 2)
+            if self.last_data is not None:
+                self.set_all_data(*self.last_data)
+
+    def update_overlay(self, frame_i, data):
+        n_items = len(self._items["name"])
+        boxes = np.full((n_items, 4), np.nan)
+        for name, (bbox_all, target_all) in data.items():
+            i = self.index_of(name)
+            boxes[i] = bbox_all[frame_i]
+            if not np.isnan(target_all[frame_i]).any():
+                self.positions[i] = target_all[frame_i]
+            self.trajectories.update_slot(i, frame_i, target_all)
+            self.mark_children_dirty(self._items["children"][i])
+        self.trajectories.rebuild()
+
+        missing = np.isnan(boxes).any(axis=1, keepdims=True)
+        self.overlay.set_data(
+            boxes,
+            np.where(missing, np.nan, self.positions),
+            self._items["color"],
+            self._items["name"],
+            np.array([show[0] and show[1] for show in self._items["show"]], bool),
+        )
+        self.flush_children()
+
+    def clear(self):
+        super().clear()
+        self.trajectories.clear()
+        self.overlay_active = False
+        self.last_data = None
 
     def set_tracker_pos(self, name, frame_i, bbox_all, target_all):
-        i = self._items["name"].index(name)
+        i = self.index_of(name)
         roi = self._items["roi"][i]
         target = self._items["target"][i]
         offset = self._items["offset"][i]
@@ -459,44 +559,36 @@ class TrackerItem(BaseDisplayItem):
             ]
             logging.trace(f"Tracker {name} moved.")
 
-        if len(children) > 0:
-            for child_name, child_type in children:
-                self.update_child_item(child_type, child_name, dragged=False)
-
-    def set_trajectory(self, name, frame_i, bbox_all, target_all):
-        i = self._items["name"].index(name)
-        traj = self._items["traj"][i]
-        if frame_i > self.visual_preferences["trajectory_length"]:
-            traj.setData(
-                target_all[
-                    frame_i - self.visual_preferences["trajectory_length"] : frame_i,
-                    0,
-                ],
-                target_all[
-                    frame_i - self.visual_preferences["trajectory_length"] : frame_i,
-                    1,
-                ],
-            )
-        else:
-            traj.setData(target_all[:frame_i, 0], target_all[:frame_i, 1])
+        self.positions[i] = target.pos().x(), target.pos().y()
+        self.mark_children_dirty(children)
+
+    def set_trajectory(self, name, frame_i, bbox_all, target_all, rebuild=True):
+        self.trajectories.update_slot(self.index_of(name), frame_i, target_all)
+        if rebuild:
+            self.trajectories.rebuild()
 
     def start_edit_item(self, name):
-        i = self._items["name"].index(name)
+        i = self.index_of(name)
         color = self._items["color"][i]
         tracker_type = self._items["tracker_type"][i]
+        predict = self._items["predict"][i]
 
         dialog = TrackerDialog(
-            default_name=name, default_color=color, default_tracker_type=tracker_type
+            default_name=name,
+            default_color=color,
+            default_tracker_type=tracker_type,
+            default_predict=predict,
         )
         dialog.exec()
         if dialog.result():
-            new_name, new_color, new_tracker_type = dialog.get_inputs()
+            new_name, new_color, new_tracker_type, new_predict = dialog.get_inputs()
             if new_name != name:
                 new_name = self.prevent_name_collision(new_name)
             props = {
                 "name": new_name,
                 "color": new_color,
                 "tracker_type": new_tracker_type,
+                "predict": new_predict,
             }
             self.emit_edit_item(name, props)
 
@@ -161,6 +161,12 @@ class FrameWidget(QtWidgets.QWidget):
     def set_item_data(self, item_type, name, data):
         self.display_items[item_type].set_data(name, data)
 
+    def set_all_item_data(self, item_type, frame_i, data):
+        self.display_items[item_type].set_all_data(frame_i, data)
+
+    def set_fast_overlay(self, enabled):
+        self.trackers.set_fast_overlay(enabled)
+
     def add_item(self, item_type, item_props):
         if item_type in self.display_items:
             self.display_items[item_type].add_item(item_props)
@@ -344,8 +350,8 @@ class FrameWidget(QtWidgets.QWidget):
         for display_item in self.display_items.values():
             display_item.frame_shape_changed()
 
-    def update_child_item(self, child_type, child_name, **kwargs):
-        self.display_items[child_type].update_item(child_name, **kwargs)
+    def update_child_items(self, child_type, child_names, **kwargs):
+        self.display_items[child_type].update_items(child_names, **kwargs)
 
     def update_parents_of_child(
         self, child_type, child_name, old_parent_name, new_parent_name
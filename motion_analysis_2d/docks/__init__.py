@@ -5,3 +5,4 @@ from .dock_intrinsic import LoadIntrinsicDock
 from .dock_items import ItemsDock
 from .dock_orient import OrientDock
 from .dock_save import SaveDock
+from .dock_tracking import TrackingDock
@@ -2,9 +2,19 @@ from pathlib import Path
 
 import qtawesome as qta
 
-from motion_analysis_2d.custom_components import BaseDock, FileListWidget, tab10_qcolor
+from motion_analysis_2d.custom_components import (
+    BaseDock,
+    FileListWidget,
+    FolderScanner,
+    MetadataProber,
+    tab10_qcolor,
+)
 from motion_analysis_2d.defs import QtCore, QtWidgets, Signal
-from motion_analysis_2d.funcs import check_file_type
+from motion_analysis_2d.funcs import (
+    check_file_type,
+    describe_metadata,
+    is_image_sequence,
+)
 
 
 class FilesDock(BaseDock):
@@ -37,9 +47,16 @@ class FilesDock(BaseDock):
         self.batch_button.toggled.connect(self.batch_button_toggled.emit)
         self.dock_layout.addWidget(self.batch_button)
 
+        self.filter_edit = QtWidgets.QLineEdit(self)
+        self.filter_edit.setPlaceholderText("Filter files")
+        self.filter_edit.setClearButtonEnabled(True)
+        self.gui_save_exceptions.append(self.filter_edit)
+        self.dock_layout.addWidget(self.filter_edit)
+
         self.file_list_widget = FileListWidget(filetypes, self)
         self.file_list_widget.setToolTip("Quick files.\nDrop files here.")
         self.dock_layout.addWidget(self.file_list_widget)
+        self.filter_edit.textChanged.connect(self.file_list_widget.set_filter)
 
         self.files_action_layout = QtWidgets.QBoxLayout(
             QtWidgets.QBoxLayout.LeftToRight
@@ -62,6 +79,16 @@ class FilesDock(BaseDock):
         self.sort_descend_button.clicked.connect(self.file_list_widget.sort_descend)
         self.files_action_layout.addWidget(self.sort_descend_button)
 
+        self.sort_duration_button = QtWidgets.QPushButton(self)
+        self.sort_duration_button.setIcon(qta.icon("mdi.sort-clock-ascending-outline"))
+        self.sort_duration_button.setIconSize(QtCore.QSize(icon_size, icon_size))
+        self.sort_duration_button.setToolTip("Sort by duration, shortest first.")
+        self.sort_duration_button.setFlat(True)
+        self.sort_duration_button.clicked.connect(
+            self.file_list_widget.sort_by_duration
+        )
+        self.files_action_layout.addWidget(self.sort_duration_button)
+
         self.remove_selection_button = QtWidgets.QPushButton(self)
         self.remove_selection_button.setIcon(
             qta.icon("mdi.delete", color=tab10_qcolor["red"])
@@ -84,32 +111,97 @@ class FilesDock(BaseDock):
         self.remove_all_button.clicked.connect(self.file_list_widget.remove_all)
         self.files_action_layout.addWidget(self.remove_all_button)
 
+        self.form_layout = QtWidgets.QFormLayout()
+        self.dock_layout.addLayout(self.form_layout)
+
+        self.sequence_frame_rate_spinbox = QtWidgets.QDoubleSpinBox(self)
+        self.sequence_frame_rate_spinbox.setRange(0.01, 1000000)
+        self.sequence_frame_rate_spinbox.setDecimals(2)
+        self.sequence_frame_rate_spinbox.setValue(30)
+        self.sequence_frame_rate_spinbox.setSuffix(" fps")
+        self.sequence_frame_rate_spinbox.setToolTip(
+            "Frame rate of image sequence folders without a timestamps sidecar.\n"
+            "Applies when a sequence is opened."
+        )
+        self.form_layout.addRow("Sequence rate: ", self.sequence_frame_rate_spinbox)
+
+        self.skip_complete_checkbox = QtWidgets.QCheckBox(self)
+        self.skip_complete_checkbox.setToolTip(
+            "Batch processing skips videos with data for every frame."
+        )
+        self.form_layout.addRow("Skip analysed: ", self.skip_complete_checkbox)
+
+        self.recursive_checkbox = QtWidgets.QCheckBox(self)
+        self.recursive_checkbox.setToolTip("Added folders include their subfolders.")
+        self.form_layout.addRow("Recursive: ", self.recursive_checkbox)
+
+        self.include_edit = QtWidgets.QLineEdit(self)
+        self.include_edit.setPlaceholderText("e.g. trial_*; *.mp4")
+        self.include_edit.setToolTip(
+            "Added folders only add files matching one of these patterns."
+        )
+        self.form_layout.addRow("Include: ", self.include_edit)
+
+        self.exclude_edit = QtWidgets.QLineEdit(self)
+        self.exclude_edit.setPlaceholderText("e.g. calib*; *_old")
+        self.exclude_edit.setToolTip(
+            "Added folders leave out files and subfolders matching these patterns."
+        )
+        self.form_layout.addRow("Exclude: ", self.exclude_edit)
+
+        # folders are scanned in the background, files are added as found
+        self.scanner = FolderScanner(parent=self)
+        self.scanner.found.connect(self.file_list_widget.add_items)
+        self.file_list_widget.folders_dropped.connect(self.add_folders)
+
+        # metadata of the listed files, probed in the background
+        self.metadata = {}
+        self.prober = MetadataProber(parent=self)
+        self.prober.probed.connect(self.metadata_probed)
+        self.file_list_widget.paths_added.connect(self.probe_files)
+
         self.layout_direction_changed.connect(self.change_action_layout)
 
-        self.file_list_widget.itemSelectionChanged.connect(self.item_selection_changed)
-        self.file_list_widget.itemDoubleClicked.connect(self.item_selection_changed)
+        self.file_list_widget.selection_changed.connect(self.item_selection_changed)
+        self.file_list_widget.doubleClicked.connect(self.item_selection_changed)
 
     def next_file(self):
-        row = self.file_list_widget.currentRow()
+        row = self.file_list_widget.current_row()
         row += 1
         max_row = self.file_list_widget.count()
+        while row < max_row and self.skip_file(row):
+            row += 1
         if row < max_row:
-            self.file_list_widget.setCurrentRow(row)
+            self.file_list_widget.set_current_row(row)
 
     def previous_file(self):
-        row = self.file_list_widget.currentRow()
+        row = self.file_list_widget.current_row()
         row -= 1
         if row >= 0:
-            self.file_list_widget.setCurrentRow(row)
+            self.file_list_widget.set_current_row(row)
+
+    def skip_file(self, row):
+        if not (
+            self.batch_button.isChecked() and self.skip_complete_checkbox.isChecked()
+        ):
+            return False
+        path = self.file_list_widget.path_at(row)
+        return self.metadata.get(path, {}).get("complete", False)
+
+    def probe_files(self, paths):
+        self.prober.probe(paths, self.sequence_frame_rate_spinbox.value())
+
+    def metadata_probed(self, path, metadata):
+        self.metadata[path] = metadata
+        self.file_list_widget.file_model.set_metadata(
+            path,
+            describe_metadata(metadata),
+            metadata.get("duration"),
+            metadata.get("complete", False),
+        )
 
     def item_selection_changed(self):
-        item = self.file_list_widget.currentItem()
-        if item is not None:
-            path = self.file_list_widget.full_paths[item.text()]
-            self.video_file_changed.emit(path)
-        else:
-            self.video_file_changed.emit(None)
-            path = None
+        self.video_file_changed.emit(self.file_list_widget.current_path())
 
     def change_action_layout(self, direction):
         if direction == QtWidgets.QBoxLayout.LeftToRight:
@@ -119,9 +211,26 @@ class FilesDock(BaseDock):
 
     def add_files(self, paths):
         self.file_list_widget.add_items(
-            [p for p in paths if check_file_type(p, self.filetypes)]
+            [
+                p
+                for p in paths
+                if check_file_type(p, self.filetypes) or is_image_sequence(p)
+            ]
+        )
+
+    def add_folders(self, folders):
+        self.scanner.scan(
+            folders,
+            self.filetypes,
+            self.recursive_checkbox.isChecked(),
+            self.patterns(self.include_edit),
+            self.patterns(self.exclude_edit),
         )
 
+    @staticmethod
+    def patterns(line_edit):
+        return [p.strip() for p in line_edit.text().split(";") if p.strip()]
+
 
 if __name__ == "__main__":
     app = QtWidgets.QApplication([])
@@ -11,6 +11,7 @@ from motion_analysis_2d.defs import QtCore, QtWidgets, QtGui, Signal
 class ItemsDock(BaseDock):
     edit_item_suggested = Signal(str, str)
     remove_item_suggested = Signal(str, str)
+    evaluate_item_suggested = Signal(str, str)
 
     show_item = Signal(str, str)
     hide_item = Signal(str, str)
@@ -42,6 +43,7 @@ class ItemsDock(BaseDock):
         row.checkbox_toggled.connect(partial(self.checkbox_toggled, item_type))
         row.edit_item_suggested.connect(self.edit_item_suggested.emit)
         row.remove_item_suggested.connect(self.remove_item_suggested.emit)
+        row.evaluate_item_suggested.connect(self.evaluate_item_suggested.emit)
         self.rows[item_type][name] = row
         self.collapsibles[item_type].addWidget(row)
         logging.debug(f"{item_type.capitalize()} {name} added to items dock.")
@@ -79,6 +81,7 @@ class ItemsRow(QtWidgets.QWidget):
     checkbox_toggled = Signal(str, object)
     edit_item_suggested = Signal(str, object)
     remove_item_suggested = Signal(str, object)
+    evaluate_item_suggested = Signal(str, object)
 
     def __init__(self, name, color, item_type="tracker", parent=None):
         super().__init__(parent)
@@ -94,6 +97,10 @@ class ItemsRow(QtWidgets.QWidget):
         delete_action = self.context_menu.addAction("Remove")
         delete_action.setIcon(qta.icon("mdi6.close", color="red"))
         delete_action.triggered.connect(self.emit_remove_item)
+        if item_type == "tracker":
+            evaluate_action = self.context_menu.addAction("Evaluate Trackers")
+            evaluate_action.setIcon(qta.icon("mdi6.speedometer"))
+            evaluate_action.triggered.connect(self.emit_evaluate_item)
 
         self.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.context_menu_requested)
@@ -139,6 +146,9 @@ class ItemsRow(QtWidgets.QWidget):
     def emit_remove_item(self):
         self.remove_item_suggested.emit(self.item_type, self.name)
 
+    def emit_evaluate_item(self):
+        self.evaluate_item_suggested.emit(self.item_type, self.name)
+
 
 if __name__ == "__main__":
     app = QtWidgets.QApplication([])
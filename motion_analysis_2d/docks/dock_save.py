@@ -39,6 +39,14 @@ class SaveDock(BaseDock):
         self.export_button.clicked.connect(self.export_button_clicked)
         row.addWidget(self.export_button)
 
+        self.original_space_checkbox = QtWidgets.QCheckBox(
+            "Export unstabilized coordinates", self
+        )
+        self.original_space_checkbox.setToolTip(
+            "Undo stabilization so coordinates refer to the original video frames."
+        )
+        self.dock_layout.addWidget(self.original_space_checkbox)
+
     def autosave_button_toggled(self):
         self.autosave_toggled.emit(self.autosave_button.isChecked())
 
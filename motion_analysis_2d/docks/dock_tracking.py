@@ -0,0 +1,175 @@
+import os
+
+from motion_analysis_2d.custom_components import BaseDock
+from motion_analysis_2d.defs import QtWidgets, Signal
+
+
+class TrackingDock(BaseDock):
+    settings_updated = Signal()
+    turbo_toggled = Signal()
+    tracking_scales = {"Full": 1.0, "1/2": 0.5, "1/4": 0.25}
+
+    def __init__(self):
+        super().__init__()
+
+        self.setWindowTitle("Tracking")
+
+        self.form_layout = QtWidgets.QFormLayout()
+        self.dock_layout.addLayout(self.form_layout)
+
+        self.motion_gate_checkbox = QtWidgets.QCheckBox(self)
+        self.motion_gate_checkbox.setToolTip(
+            "Skip tracker updates while the region inside the tracking box is still."
+        )
+        self.motion_gate_checkbox.toggled.connect(self.settings_updated.emit)
+        self.form_layout.addRow("Motion gate: ", self.motion_gate_checkbox)
+
+        self.motion_gate_threshold_spinbox = QtWidgets.QDoubleSpinBox(self)
+        self.motion_gate_threshold_spinbox.setRange(0.1, 50)
+        self.motion_gate_threshold_spinbox.setSingleStep(0.5)
+        self.motion_gate_threshold_spinbox.setValue(2)
+        self.motion_gate_threshold_spinbox.setToolTip(
+            "Mean absolute intensity change below which the region counts as still."
+        )
+        self.motion_gate_threshold_spinbox.valueChanged.connect(
+            self.settings_updated.emit
+        )
+        self.form_layout.addRow("Gate threshold: ", self.motion_gate_threshold_spinbox)
+
+        self.motion_gate_max_skip_spinbox = QtWidgets.QSpinBox(self)
+        self.motion_gate_max_skip_spinbox.setRange(1, 1000)
+        self.motion_gate_max_skip_spinbox.setValue(10)
+        self.motion_gate_max_skip_spinbox.setToolTip(
+            "Maximum number of consecutive frames a tracker update can be skipped."
+        )
+        self.motion_gate_max_skip_spinbox.valueChanged.connect(
+            self.settings_updated.emit
+        )
+        self.form_layout.addRow("Gate max skip: ", self.motion_gate_max_skip_spinbox)
+
+        self.stabilize_checkbox = QtWidgets.QCheckBox(self)
+        self.stabilize_checkbox.setToolTip(
+            "Compensate camera shake before tracking. "
+            "The estimated shift is saved for every frame."
+        )
+        self.stabilize_checkbox.toggled.connect(self.settings_updated.emit)
+        self.form_layout.addRow("Stabilize: ", self.stabilize_checkbox)
+
+        self.tracking_scale_combobox = QtWidgets.QComboBox(self)
+        self.tracking_scale_combobox.addItems(self.tracking_scales.keys())
+        self.tracking_scale_combobox.setToolTip(
+            "Resolution trackers run at. Positions are reported at full resolution."
+        )
+        self.tracking_scale_combobox.currentIndexChanged.connect(
+            self.settings_updated.emit
+        )
+        self.form_layout.addRow("Tracking scale: ", self.tracking_scale_combobox)
+
+        self.refine_checkbox = QtWidgets.QCheckBox(self)
+        self.refine_checkbox.setToolTip(
+            "Refine tracker positions to sub-pixel accuracy at full resolution."
+        )
+        self.refine_checkbox.toggled.connect(self.settings_updated.emit)
+        self.form_layout.addRow("Sub-pixel refine: ", self.refine_checkbox)
+
+        self.stride_spinbox = QtWidgets.QSpinBox(self)
+        self.stride_spinbox.setRange(1, 64)
+        self.stride_spinbox.setToolTip(
+            "Track every Nth frame and interpolate the frames in between."
+        )
+        self.stride_spinbox.valueChanged.connect(self.settings_updated.emit)
+        self.form_layout.addRow("Frame stride: ", self.stride_spinbox)
+
+        self.adaptive_stride_checkbox = QtWidgets.QCheckBox(self)
+        self.adaptive_stride_checkbox.setChecked(True)
+        self.adaptive_stride_checkbox.setToolTip(
+            "Reduce the stride on fast motion or uncertain tracking."
+        )
+        self.adaptive_stride_checkbox.toggled.connect(self.settings_updated.emit)
+        self.form_layout.addRow("Adaptive stride: ", self.adaptive_stride_checkbox)
+
+        self.stride_max_step_spinbox = QtWidgets.QDoubleSpinBox(self)
+        self.stride_max_step_spinbox.setRange(0.5, 500)
+        self.stride_max_step_spinbox.setValue(5)
+        self.stride_max_step_spinbox.setSuffix(" px")
+        self.stride_max_step_spinbox.setToolTip(
+            "Largest movement between tracked frames before the stride is reduced."
+        )
+        self.stride_max_step_spinbox.valueChanged.connect(self.settings_updated.emit)
+        self.form_layout.addRow("Stride max step: ", self.stride_max_step_spinbox)
+
+        self.fast_overlay_checkbox = QtWidgets.QCheckBox(self)
+        self.fast_overlay_checkbox.setToolTip(
+            "Draw all trackers as one overlay during playback, "
+            "tracking boxes can be edited when paused."
+        )
+        self.form_layout.addRow("Fast overlay: ", self.fast_overlay_checkbox)
+
+        self.turbo_checkbox = QtWidgets.QCheckBox(self)
+        self.turbo_checkbox.setToolTip(
+            "Stop drawing frames and plots, only show progress and throughput."
+        )
+        self.turbo_checkbox.toggled.connect(self.turbo_toggled.emit)
+        self.form_layout.addRow("Turbo mode: ", self.turbo_checkbox)
+
+        self.auto_turbo_checkbox = QtWidgets.QCheckBox(self)
+        self.auto_turbo_checkbox.setChecked(True)
+        self.auto_turbo_checkbox.setToolTip(
+            "Use turbo mode while the window is minimized or batch is enabled."
+        )
+        self.auto_turbo_checkbox.toggled.connect(self.turbo_toggled.emit)
+        self.form_layout.addRow("Auto turbo: ", self.auto_turbo_checkbox)
+
+        self.evaluation_frames_spinbox = QtWidgets.QSpinBox(self)
+        self.evaluation_frames_spinbox.setRange(10, 10000)
+        self.evaluation_frames_spinbox.setValue(100)
+        self.evaluation_frames_spinbox.setToolTip(
+            "Number of frames from the current frame used to evaluate trackers."
+        )
+        self.form_layout.addRow("Evaluation frames: ", self.evaluation_frames_spinbox)
+
+        self.segments_spinbox = QtWidgets.QSpinBox(self)
+        self.segments_spinbox.setRange(1, 256)
+        self.segments_spinbox.setValue(os.cpu_count() or 1)
+        self.segments_spinbox.setToolTip(
+            "Number of segments tracked at the same time by parallel tracking."
+        )
+        self.form_layout.addRow("Parallel segments: ", self.segments_spinbox)
+
+        self.segment_overlap_spinbox = QtWidgets.QSpinBox(self)
+        self.segment_overlap_spinbox.setRange(1, 1000)
+        self.segment_overlap_spinbox.setValue(30)
+        self.segment_overlap_spinbox.setToolTip(
+            "Number of frames tracked by both neighbouring segments for stitching."
+        )
+        self.form_layout.addRow("Segment overlap: ", self.segment_overlap_spinbox)
+
+        self.stitch_tolerance_spinbox = QtWidgets.QDoubleSpinBox(self)
+        self.stitch_tolerance_spinbox.setRange(0.1, 100)
+        self.stitch_tolerance_spinbox.setValue(3)
+        self.stitch_tolerance_spinbox.setSuffix(" px")
+        self.stitch_tolerance_spinbox.setToolTip(
+            "Largest disagreement in the overlap for two segments to be joined."
+        )
+        self.form_layout.addRow("Stitch tolerance: ", self.stitch_tolerance_spinbox)
+
+        self.dock_layout.addStretch()
+
+    def motion_gate_settings(self):
+        if not self.motion_gate_checkbox.isChecked():
+            return None
+        return {
+            "threshold": self.motion_gate_threshold_spinbox.value(),
+            "max_skip": self.motion_gate_max_skip_spinbox.value(),
+        }
+
+    def tracking_scale(self):
+        return self.tracking_scales[self.tracking_scale_combobox.currentText()]
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication([])
+    widget = TrackingDock()
+    widget.show()
+
+    app.exec()
@@ -4,12 +4,21 @@ from .check_mimetypes import (
     is_json_file,
     get_extensions_for_type,
 )
+from .chunk_tracking import latest_keyframe, split_segments, stitch_segments
+from .folder_scan import scan_folder
+from .frame_stack import stack_metadata, open_frame_stack
 from .geometric_calc import (
     make_offset_polygon,
     distance_from_line,
     offset_at_centre,
     area_quadrilateral,
 )
+from .image_sequence import (
+    natural_key,
+    sequence_frames,
+    is_image_sequence,
+    sequence_timestamps,
+)
 from .intrinsic_calc import (
     find_points,
     calibrate_camera,
@@ -20,6 +29,20 @@ from .load_extrinsic import load_extrinsic, save_perspective_points
 from .load_intrinsic import load_intrinsic
 from .load_settings import load_application_settings
 from .logger_setup import setup_logger
-from .motion_funcs import angle_vec
-from .naming import prevent_name_collision
+from .motion_funcs import angle_vec, adapt_stride, gap_start
+from .naming import prevent_name_collision, disambiguate_paths
 from .save_format import save_tracking_data, load_tracking_data, export_csv
+from .template_match import (
+    crop_patch,
+    centred_patch,
+    search_template,
+    scale_bbox,
+    refine_bbox,
+)
+from .tracker_benchmark import summarise_benchmark, recommend_tracker
+from .video_metadata import (
+    data_file,
+    file_signature,
+    data_file_complete,
+    describe_metadata,
+)
@@ -1,6 +1,9 @@
 import mimetypes
 
 mimetypes.init()
+# raw frame stacks, opened memory-mapped instead of through a codec
+mimetypes.add_type("video/x-npy", ".npy")
+mimetypes.add_type("video/x-raw-frames", ".raw")
 
 
 def guess_file_type(file_path):
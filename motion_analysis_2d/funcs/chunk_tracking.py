@@ -0,0 +1,80 @@
+import numpy as np
+
+
+def split_segments(start, end, n_segments, overlap):
+    """
+    Split a frame range into overlapping segments
+
+    :param start: first frame of the range
+    :param end: last frame of the range
+    :param n_segments: number of segments
+    :param overlap: number of frames each segment runs into the next one
+    :return: list of (first frame, last frame) of each segment
+    """
+    n_segments = int(np.clip(n_segments, 1, max(end - start, 1)))
+    bounds = np.linspace(start, end, n_segments + 1).round().astype(int)
+    return [
+        (int(bounds[i]), int(min(bounds[i + 1] + overlap, end)))
+        for i in range(n_segments)
+    ]
+
+
+def latest_keyframe(bboxes, names, frame_no, start):
+    """
+    Last frame from start to frame_no where every tracker in names has a bbox
+
+    :param bboxes: {name: (n, 4) bbox array indexed by frame number - 1}
+    :param names: trackers that need a bbox
+    :param frame_no: last frame to consider
+    :param start: first frame to consider, every tracker has a bbox there
+    :return: frame number of the keyframe
+    """
+    known = np.ones(frame_no - start + 1, dtype=bool)
+    for name in names:
+        known &= ~np.isnan(bboxes[name][start - 1 : frame_no]).any(axis=1)
+    return start + int(np.flatnonzero(known)[-1]) if known.any() else start
+
+
+def bbox_centre(bbox):
+    return bbox[:, :2] + bbox[:, 2:] / 2
+
+
+def stitch_segments(segments, results, tolerance):
+    """
+    Join per-segment tracking results, switching segments where they agree best
+
+    :param segments: output of split_segments
+    :param results: per segment, {name: (n, 4) bbox array covering the segment}
+    :param tolerance: largest median distance between segments in an overlap
+        for them to count as tracking the same point
+    :return: ({name: bbox array covering the whole range},
+        list of (name, frame) where a segment did not match the previous one
+        and was used from its own seed instead)
+    """
+    start, end = segments[0][0], segments[-1][1]
+    bboxes = {}
+    inconsistent = []
+    for name in results[0].keys():
+        bbox = np.full((end - start + 1, 4), np.nan)
+        first_start, first_end = segments[0]
+        bbox[first_start - start : first_end - start + 1] = results[0][name]
+
+        for (_, prev_end), (seg_start, seg_end), result in zip(
+            segments[:-1], segments[1:], results[1:]
+        ):
+            n_overlap = prev_end - seg_start + 1
+            prev = bbox[seg_start - start : prev_end - start + 1]
+            error = np.linalg.norm(
+                bbox_centre(prev) - bbox_centre(result[name][:n_overlap]), axis=1
+            )
+            valid = ~np.isnan(error)
+            if not valid.any() or np.median(error[valid]) > tolerance:
+                inconsistent.append((name, seg_start))
+                switch = 0
+            else:
+                switch = int(np.nanargmin(error))
+            bbox[seg_start - start + switch : seg_end - start + 1] = result[name][
+                switch:
+            ]
+        bboxes[name] = bbox
+    return bboxes, inconsistent
@@ -0,0 +1,45 @@
+import os
+from fnmatch import fnmatch
+from pathlib import Path
+
+from .check_mimetypes import check_file_type
+from .image_sequence import natural_key, is_image_sequence
+
+
+def matches_any(name, patterns):
+    return any(fnmatch(name, pattern) for pattern in patterns)
+
+
+def scan_folder(folder, filetypes=None, recursive=False, include=None, exclude=None):
+    """
+    Clips of a folder in natural order, yielded as they are found
+
+    Image sequence folders are yielded as one clip.
+
+    :param folder: folder to scan
+    :param filetypes: general types to keep, e.g. ["video"], None keeps all files
+    :param recursive: also scan subfolders that are not image sequences
+    :param include: name patterns, e.g. ["*.mp4"], clips must match one if given
+    :param exclude: name patterns of clips and subfolders to leave out
+    """
+    folder = Path(folder)
+    if is_image_sequence(folder):
+        yield folder
+        return
+    with os.scandir(folder) as it:
+        entries = sorted(it, key=lambda entry: natural_key(entry.name))
+    for entry in entries:
+        if exclude and matches_any(entry.name, exclude):
+            continue
+        path = Path(entry.path)
+        if entry.is_dir():
+            if is_image_sequence(path):
+                if not include or matches_any(entry.name, include):
+                    yield path
+            elif recursive:
+                yield from scan_folder(path, filetypes, recursive, include, exclude)
+        elif entry.is_file():
+            if include and not matches_any(entry.name, include):
+                continue
+            if filetypes is None or check_file_type(path, filetypes):
+                yield path
@@ -0,0 +1,53 @@
+import json
+from pathlib import Path
+
+import numpy as np
+
+
+def stack_metadata(path):
+    """
+    Settings of a raw frame stack from the <name>.json sidecar next to it
+
+    e.g. clip.raw.json: {"width": 640, "height": 480, "channels": 1, "header": 512,
+    "frame_rate": 1000}. Only width and height are required for .raw files.
+    """
+    path = Path(path)
+    sidecar = path.with_name(path.name + ".json")
+    if not sidecar.is_file():
+        return {}
+    with open(sidecar, "r") as f:
+        return json.load(f)
+
+
+def open_frame_stack(path):
+    """
+    Memory-map a uint8 frame stack without reading it
+
+    :param path: .npy file with shape (n, h, w) or (n, h, w, c), or .raw file with
+        a fixed size header followed by frames described by its sidecar
+    :return: (read-only memmap of shape (n, h, w[, c]), frame rate or None)
+    """
+    path = Path(path)
+    metadata = stack_metadata(path)
+    if path.suffix == ".npy":
+        frames = np.load(path, mmap_mode="r")
+    else:
+        if "width" not in metadata or "height" not in metadata:
+            raise ValueError(f"{path.name}.json with width and height is missing.")
+        channels = metadata.get("channels", 1)
+        header = metadata.get("header", 0)
+        frame_shape = (metadata["height"], metadata["width"])
+        if channels > 1:
+            frame_shape += (channels,)
+        no_of_frames = (path.stat().st_size - header) // int(np.prod(frame_shape))
+        frames = np.memmap(
+            path,
+            dtype=np.uint8,
+            mode="r",
+            offset=header,
+            shape=(no_of_frames,) + frame_shape,
+        )
+
+    if frames.dtype != np.uint8 or frames.ndim not in (3, 4):
+        raise ValueError(f"{path.name} is not a stack of uint8 frames.")
+    return frames, metadata.get("frame_rate")
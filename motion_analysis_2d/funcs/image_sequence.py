@@ -0,0 +1,84 @@
+import json
+import logging
+import re
+from pathlib import Path
+
+import numpy as np
+
+from .check_mimetypes import check_file_type
+
+
+def natural_key(path):
+    """Sort key that orders frame_2.png before frame_10.png"""
+    return [
+        int(part) if part.isdigit() else part.lower()
+        for part in re.split(r"(\d+)", Path(path).name)
+    ]
+
+
+def sequence_frames(folder):
+    """Image files of a folder in frame order"""
+    return sorted(
+        (
+            p
+            for p in Path(folder).iterdir()
+            if p.is_file() and check_file_type(p, ["image"])
+        ),
+        key=natural_key,
+    )
+
+
+def is_image_sequence(path, min_frames=2):
+    """Stops looking once min_frames images are found, so large folders are cheap"""
+    path = Path(path)
+    if not path.is_dir():
+        return False
+    count = 0
+    for p in path.iterdir():
+        if p.is_file() and check_file_type(p, ["image"]):
+            count += 1
+            if count >= min_frames:
+                return True
+    return False
+
+
+def sequence_timestamps(folder, n_frames, frame_rate=None):
+    """
+    Timestamps of an image sequence
+
+    A timestamps.csv or timestamps.txt in the folder (time in seconds per frame,
+    last column) takes precedence over a frame_rate in metadata.json, which takes
+    precedence over the given frame rate.
+
+    :param folder: image sequence folder
+    :param n_frames: number of frames in the sequence
+    :param frame_rate: fallback frame rate in frames per second
+    :return: (timestamps in milliseconds, frame rate)
+    """
+    folder = Path(folder)
+    for name in ("timestamps.csv", "timestamps.txt"):
+        sidecar = folder / name
+        if not sidecar.is_file():
+            continue
+        times = np.genfromtxt(sidecar, delimiter=",", ndmin=2)[:, -1]
+        times = times[~np.isnan(times)]
+        if len(times) < n_frames:
+            logging.warning(
+                f"{sidecar} has {len(times)} timestamps for {n_frames} frames, "
+                f"ignoring it."
+            )
+            break
+        times = times[:n_frames] - times[0]
+        steps = np.diff(times)
+        sidecar_rate = 1 / np.median(steps) if len(steps) else frame_rate
+        return times * 1000, sidecar_rate
+
+    metadata = folder / "metadata.json"
+    if metadata.is_file():
+        with open(metadata, "r") as f:
+            info = json.load(f)
+        frame_rate = info.get("frame_rate", info.get("fps", frame_rate))
+
+    if not frame_rate:
+        frame_rate = 1.0
+    return np.arange(n_frames) * 1000 / frame_rate, float(frame_rate)
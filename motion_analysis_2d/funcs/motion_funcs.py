@@ -49,6 +49,42 @@ def angle_between(vec1: np.array, vec2: np.array) -> np.array:
     return angle
 
 
+def gap_start(valid: np.array, frame_no: int) -> int:
+    """
+    Find the first frame of the gap that ends just before frame_no
+
+    :param valid: True for frames (index frame_no - 1) that have data
+    :type valid: 1d numpy array of bool
+    :param frame_no: frame to search backwards from
+    :return: first frame of the gap, frame_no if the previous frame has data
+    :rtype: int
+    """
+    (valid_before,) = np.nonzero(valid[: frame_no - 1])
+    if len(valid_before) == 0:
+        return 1
+    return int(valid_before[-1]) + 2
+
+
+def adapt_stride(
+    stride: int, displacement: float, max_stride: int, max_displacement: float
+) -> int:
+    """
+    Halve the tracking stride on fast motion, double it on slow motion
+
+    :param stride: current number of frames between tracked frames
+    :param displacement: largest target movement between the last tracked frames
+    :param max_stride: upper bound of the stride
+    :param max_displacement: largest acceptable movement between tracked frames
+    :return: new stride
+    :rtype: int
+    """
+    if np.isnan(displacement) or displacement > max_displacement:
+        return max(1, stride // 2)
+    if displacement < max_displacement / 4:
+        return min(max_stride, stride * 2)
+    return stride
+
+
 def filter_lowpass(data, fs, highcut):
     b, a = butter_lowpass(highcut, fs)
     return signal.filtfilt(b, a, data)
@@ -16,3 +16,20 @@ def prevent_name_collision(name, all_names):
 
 def get_end_digits(name):
     return re.compile(r"(.*?)(\d+)$").search(name)
+
+
+def disambiguate_paths(paths):
+    """
+    Shortest "parent/name" keys that tell apart paths with the same name
+
+    All paths get the same number of parent folders, as in a file browser.
+    """
+    if not paths:
+        return []
+    max_depth = max(len(p.parts) for p in paths)
+    depth = 1
+    while True:
+        keys = ["/".join(p.parts[-depth:]) for p in paths]
+        if len(set(keys)) == len(keys) or depth >= max_depth:
+            return keys
+        depth += 1
@@ -111,7 +111,7 @@ def load_tracking_data(path):
     )
 
 
-def export_csv(path, tracking_data, analysis_data, scaling):
+def export_csv(path, tracking_data, analysis_data, scaling, original_space=False):
     header = ["frame_no", "time"]
     targets = []
     angles = []
@@ -120,7 +120,11 @@ def export_csv(path, tracking_data, analysis_data, scaling):
     index = [np.expand_dims(params[x], axis=1) for x in header]
     for name, params in tracking_data.items():
         header.extend([f"{name}-x", f"{name}-y"])
-        targets.append(params["target"] / scaling)
+        target = params["target"]
+        if original_space and "shift" in params:
+            # undo stabilization, unknown shifts are treated as none
+            target = target + np.nan_to_num(params["shift"])
+        targets.append(target / scaling)
     for name, params in analysis_data["angle"].items():
         header.extend([f"{name}-θ"])
         angles.append(np.expand_dims(params["angle"], axis=1))
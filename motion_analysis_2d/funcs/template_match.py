@@ -0,0 +1,118 @@
+import cv2 as cv
+import numpy as np
+
+
+def clip_bbox(bbox, img_shape):
+    x, y, w, h = bbox
+    im_h, im_w = img_shape[:2]
+    x0 = int(np.clip(round(x), 0, im_w))
+    y0 = int(np.clip(round(y), 0, im_h))
+    x1 = int(np.clip(round(x + w), 0, im_w))
+    y1 = int(np.clip(round(y + h), 0, im_h))
+    return x0, y0, x1 - x0, y1 - y0
+
+
+def scale_bbox(bbox, scale):
+    return tuple(float(a) * scale for a in bbox)
+
+
+def crop_patch(img, bbox):
+    x, y, w, h = clip_bbox(bbox, img.shape)
+    return img[y : y + h, x : x + w].copy()
+
+
+def centred_patch(img, bbox, size):
+    """Patch of size (w, h) centred on bbox with sub-pixel interpolation"""
+    x, y, w, h = bbox
+    # getRectSubPix places pixel centres at integer coordinates
+    return cv.getRectSubPix(img, size, (x + w / 2 - 0.5, y + h / 2 - 0.5))
+
+
+def search_template(img, template, bbox, scales=(2, 4, 8), threshold=0.6):
+    """
+    Search for template in windows of increasing size centred on bbox
+
+    :param img: grayscale image to search in
+    :param template: grayscale patch to look for
+    :param bbox: last known bbox (x, y, w, h)
+    :param scales: window sizes as multiples of bbox size, searched in order
+    :param threshold: minimum normalised correlation to accept a match
+    :return: (bbox, score) of the first acceptable match, else (None, best score)
+    """
+    t_h, t_w = template.shape[:2]
+    if t_h == 0 or t_w == 0:
+        return None, 0.0
+
+    x, y, w, h = bbox
+    centre_x, centre_y = x + w / 2, y + h / 2
+    best_score = 0.0
+    for scale in scales:
+        win_w, win_h = max(w * scale, t_w), max(h * scale, t_h)
+        win_x, win_y, win_w, win_h = clip_bbox(
+            (centre_x - win_w / 2, centre_y - win_h / 2, win_w, win_h), img.shape
+        )
+        if win_w < t_w or win_h < t_h:
+            continue
+
+        window = img[win_y : win_y + win_h, win_x : win_x + win_w]
+        result = cv.matchTemplate(window, template, cv.TM_CCOEFF_NORMED)
+        _, score, _, (loc_x, loc_y) = cv.minMaxLoc(result)
+        best_score = max(best_score, score)
+        if score >= threshold:
+            return (win_x + loc_x, win_y + loc_y, t_w, t_h), score
+
+    return None, best_score
+
+
+def subpixel_offset(left, centre, right):
+    denominator = left - 2 * centre + right
+    if denominator == 0:
+        return 0.0
+    return float(np.clip(0.5 * (left - right) / denominator, -0.5, 0.5))
+
+
+def refine_bbox(img, template, bbox, margin=4, threshold=0.6):
+    """
+    Refine bbox position to sub-pixel accuracy by matching template nearby
+
+    :param img: full-resolution grayscale image
+    :param template: grayscale patch of the tracked region
+    :param bbox: coarse bbox (x, y, w, h)
+    :param margin: search distance around bbox in pixels
+    :param threshold: minimum normalised correlation to accept the refinement
+    :return: (refined bbox, score), bbox is unchanged if no acceptable match
+        is found
+    """
+    t_h, t_w = template.shape[:2]
+    if t_h == 0 or t_w == 0:
+        return bbox, 0.0
+
+    x, y, w, h = bbox
+    centre_x, centre_y = x + w / 2, y + h / 2
+    win_x, win_y, win_w, win_h = clip_bbox(
+        (
+            centre_x - t_w / 2 - margin,
+            centre_y - t_h / 2 - margin,
+            t_w + 2 * margin,
+            t_h + 2 * margin,
+        ),
+        img.shape,
+    )
+    if win_w < t_w or win_h < t_h:
+        return bbox, 0.0
+
+    window = img[win_y : win_y + win_h, win_x : win_x + win_w]
+    result = cv.matchTemplate(window, template, cv.TM_CCOEFF_NORMED)
+    _, score, _, (loc_x, loc_y) = cv.minMaxLoc(result)
+    if score < threshold:
+        return bbox, score
+
+    dx, dy = 0.0, 0.0
+    if 0 < loc_x < result.shape[1] - 1:
+        dx = subpixel_offset(*result[loc_y, loc_x - 1 : loc_x + 2])
+    if 0 < loc_y < result.shape[0] - 1:
+        dy = subpixel_offset(*result[loc_y - 1 : loc_y + 2, loc_x])
+
+    centre_x = win_x + loc_x + dx + t_w / 2
+    centre_y = win_y + loc_y + dy + t_h / 2
+    return (centre_x - w / 2, centre_y - h / 2, w, h), score
@@ -0,0 +1,51 @@
+import numpy as np
+
+
+def summarise_benchmark(results):
+    """
+    Compare tracker runs against the per-frame consensus of all runs
+
+    :param results: {tracker_type: {"target": (n, 2) array, NaN where failed,
+        "duration": seconds spent in updates of all frames but the first,
+        "failures": number of failed frames}}
+    :return: {tracker_type: {"fps", "failures", "drift", "max_drift"}}
+    """
+    tracker_types = list(results.keys())
+    targets = np.stack([results[t]["target"] for t in tracker_types])
+    valid = ~np.isnan(targets).any(axis=2)
+    consensus = np.full(targets.shape[1:], np.nan)
+    has_data = valid.any(axis=0)
+    consensus[has_data] = np.nanmedian(targets[:, has_data], axis=0)
+
+    summary = {}
+    for tracker_type, target in zip(tracker_types, targets):
+        n_updates = len(target) - 1
+        duration = results[tracker_type]["duration"]
+        error = np.linalg.norm(target - consensus, axis=1)
+        error = error[~np.isnan(error)]
+        summary[tracker_type] = {
+            "fps": n_updates / duration if duration > 0 else np.inf,
+            "failures": results[tracker_type]["failures"],
+            "drift": float(error.mean()) if len(error) else np.nan,
+            "max_drift": float(error.max()) if len(error) else np.nan,
+        }
+    return summary
+
+
+def recommend_tracker(summary, max_drift, max_failures=0):
+    """
+    Pick the fastest tracker that stays within the accuracy target
+
+    :param summary: output of summarise_benchmark
+    :param max_drift: largest acceptable mean drift from consensus in pixels
+    :param max_failures: largest acceptable number of failed frames
+    :return: tracker type, or None if no tracker qualifies
+    """
+    candidates = [
+        (stats["fps"], tracker_type)
+        for tracker_type, stats in summary.items()
+        if stats["failures"] <= max_failures and stats["drift"] <= max_drift
+    ]
+    if not candidates:
+        return None
+    return max(candidates)[1]
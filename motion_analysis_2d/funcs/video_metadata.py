@@ -0,0 +1,65 @@
+import json
+from pathlib import Path
+
+import numpy as np
+
+
+def data_file(path):
+    """Tracking data file saved next to a clip"""
+    path = Path(path)
+    return path.parent / (path.stem + ".json")
+
+
+def file_signature(path):
+    """
+    (size, modification time) of a clip and its data file, to detect changes
+
+    Folders use the number of entries as size.
+    """
+    path = Path(path)
+    signature = []
+    for p in (path, data_file(path)):
+        if p.is_dir():
+            signature += [len(list(p.iterdir())), p.stat().st_mtime_ns]
+        elif p.is_file():
+            signature += [p.stat().st_size, p.stat().st_mtime_ns]
+        else:
+            signature += [None, None]
+    return signature
+
+
+def data_file_complete(path, no_of_frames):
+    """Whether the data file next to a clip has tracking data for every frame"""
+    track_file = data_file(path)
+    if not track_file.is_file() or no_of_frames <= 0:
+        return False
+    try:
+        with open(track_file, "r", encoding="utf-8") as f:
+            tracking_data = json.load(f)["tracking_data"]
+    except (OSError, ValueError, KeyError):
+        return False
+    if not tracking_data:
+        return False
+    for data in tracking_data.values():
+        time = np.array(data["time"], dtype=float)
+        if len(time) < no_of_frames or np.isnan(time[:no_of_frames]).any():
+            return False
+    return True
+
+
+def describe_metadata(metadata):
+    """One line summary of probed clip metadata for the file list"""
+    if metadata.get("error"):
+        return f"Could not be read: {metadata['error']}"
+    parts = [
+        f"{metadata['width']}x{metadata['height']}",
+        f"{metadata['frame_rate']:.2f} fps",
+        f"{metadata['frames']} frames ({metadata['duration']:.1f} s)",
+    ]
+    if metadata.get("codec"):
+        parts.append(metadata["codec"])
+    if metadata.get("keyframe_spacing"):
+        parts.append(f"keyframe every {metadata['keyframe_spacing']:g} frames")
+    if metadata.get("complete"):
+        parts.append("data complete")
+    return ", ".join(parts)
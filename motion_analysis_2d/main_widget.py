@@ -1,6 +1,9 @@
 import logging
-from queue import Queue
-from time import sleep
+import multiprocessing
+from functools import partial
+from queue import Empty, Queue
+from pathlib import Path
+from time import perf_counter, strftime
 
 import numpy as np
 
@@ -23,12 +26,14 @@ from motion_analysis_2d.docks import (
     SaveDock,
     ItemsDock,
     DataPlotDock,
+    TrackingDock,
 )
 from motion_analysis_2d.funcs import (
     setup_logger,
     save_tracking_data,
     load_tracking_data,
     export_csv,
+    gap_start,
 )
 from motion_analysis_2d.preferences_pane import (
     load_preferences,
@@ -36,7 +41,18 @@ from motion_analysis_2d.preferences_pane import (
     visual_preferences,
 )
 from motion_analysis_2d.splashscreen import SplashScreen
-from motion_analysis_2d.workers import StreamWorker, TrackingWorker
+from motion_analysis_2d.dialogs import (
+    BenchmarkDialog,
+    LiveSourceDialog,
+    TrackRangeDialog,
+)
+from motion_analysis_2d.workers import (
+    StreamWorker,
+    TrackingWorker,
+    BenchmarkWorker,
+    ChunkTrackingWorker,
+    tracker_types,
+)
 
 
 class MainWidget(QtWidgets.QMainWindow):
@@ -85,6 +101,7 @@ class MainWidget(QtWidgets.QMainWindow):
         self.media_controls.previous_frame.connect(self.move_frame_backwards)
         self.media_controls.seek_bar_moved.connect(self.seek_bar_moved)
         self.media_controls.track_enabled.connect(self.track_enabled)
+        self.media_controls.reverse_toggled.connect(self.reverse_toggled)
         self.media_controls.setDisabled(True)
         self.main_layout.addWidget(self.media_controls, 1, 0, 1, 2)
 
@@ -99,6 +116,7 @@ class MainWidget(QtWidgets.QMainWindow):
             "Intrinsic": LoadIntrinsicDock(),
             "Extrinsic": LoadExtrinsicDock(),
             "Save": SaveDock(),
+            "Tracking": TrackingDock(),
             "Items": ItemsDock(),
             "DataPlot": DataPlotDock(),
         }
@@ -108,8 +126,8 @@ class MainWidget(QtWidgets.QMainWindow):
         self.addDockWidget(QtCore.Qt.BottomDockWidgetArea, self.docks["DataPlot"])
         self.docks["Files"].video_file_changed.connect(self.video_file_changed)
         self.docks["Files"].batch_button_toggled.connect(self.batch_toggled)
-        self.docks["Intrinsic"].settings_updated.connect(self.frame_shape_changed)
-        self.docks["Extrinsic"].settings_updated.connect(self.frame_shape_changed)
+        self.docks["Intrinsic"].settings_updated.connect(self.corrections_changed)
+        self.docks["Extrinsic"].settings_updated.connect(self.corrections_changed)
         self.docks["Extrinsic"].add_perspective_started.connect(
             self.start_add_perspective
         )
@@ -117,13 +135,16 @@ class MainWidget(QtWidgets.QMainWindow):
             self.new_settings_ended
         )
         self.docks["Extrinsic"].add_perspective_button.setDisabled(True)
-        self.docks["Orient"].settings_updated.connect(self.frame_shape_changed)
+        self.docks["Orient"].settings_updated.connect(self.corrections_changed)
         self.docks["Items"].show_item.connect(self.show_item)
         self.docks["Items"].hide_item.connect(self.hide_item)
         self.docks["Items"].edit_item_suggested.connect(self.edit_item_suggested)
         self.docks["Items"].remove_item_suggested.connect(self.remove_item)
+        self.docks["Items"].evaluate_item_suggested.connect(self.evaluate_trackers)
         self.docks["Save"].autosave_toggled.connect(self.autosave_toggled)
         self.docks["Save"].export_clicked.connect(self.export_data)
+        self.docks["Tracking"].settings_updated.connect(self.tracking_settings_changed)
+        self.docks["Tracking"].turbo_toggled.connect(self.update_turbo)
         self.docks["DataPlot"].frame_line_dragged.connect(
             self.media_controls.seek_bar.setValue
         )
@@ -133,15 +154,24 @@ class MainWidget(QtWidgets.QMainWindow):
         self.menu_bar = MenuBar(self)
         self.setMenuBar(self.menu_bar)
         self.menu_bar.open_video_file.connect(self.docks["Files"].add_files)
-        self.menu_bar.open_video_folder.connect(self.docks["Files"].add_files)
+        self.menu_bar.open_video_folder.connect(self.docks["Files"].add_folders)
+        self.menu_bar.open_live_source.connect(self.open_live_source_suggested)
         self.menu_bar.update_shortcuts.connect(self.update_shortcuts)
         self.menu_bar.update_visual_preferences.connect(self.update_visual_preferences)
+        self.menu_bar.track_range.connect(self.track_range_suggested)
+        self.menu_bar.track_backwards.connect(self.track_backwards_suggested)
+        self.menu_bar.track_parallel.connect(self.track_parallel_suggested)
 
         # thread for streaming input
         self.stream_thread = QtCore.QThread()
         self.stream_worker = None
         self.stream_queue = Queue(maxsize=1)
         self.streaming = False
+        self.range_progress_dialog = None
+        self.range_bounds = (0, 0)
+        # (token, callback) run once the stream is idle, see when_idle
+        self.idle_callbacks = []
+        self.idle_token = 0
 
         # thread for track_blocks processing
         self.tracking_thread = QtCore.QThread()
@@ -152,15 +182,42 @@ class MainWidget(QtWidgets.QMainWindow):
         self.tracking_worker.add_tracker_failed.connect(self.add_tracker_failed)
         self.tracking_worker.reached_end.connect(self.reached_end)
         self.tracking_worker.tracking_failed.connect(self.tracking_failed)
+        self.tracking_worker.finished.connect(
+            self.tracking_thread.quit, QtCore.Qt.DirectConnection
+        )
         self.tracking_worker.finished.connect(self.tracking_finished)
+        self.tracking_worker.result_ready.connect(self.frame_result_ready)
+        self.tracking_worker.stream_idle.connect(self.stream_idle)
         self.tracking_thread.started.connect(self.tracking_worker.run)
         self.tracking_thread.start()
 
+        # thread for evaluating tracker types
+        self.benchmark_thread = None
+        self.benchmark_worker = None
+
+        # thread for tracking segments of a video in parallel
+        self.chunk_thread = None
+        self.chunk_worker = None
+
         self.splashscreen.set_progress(70)
 
-        # periodically update display widgets
-        self.camera_frame_update_timer = QtCore.QTimer()
-        self.camera_frame_update_timer.timeout.connect(self.update_frame_view)
+        # redraw display widgets on new frame results, at most once per refresh
+        self.frame_result = None
+        self.last_frame_view = 0.0
+        self.frame_view_timer = QtCore.QTimer()
+        self.frame_view_timer.setSingleShot(True)
+        self.frame_view_timer.timeout.connect(self.update_frame_view)
+
+        # in turbo mode only progress and throughput are shown
+        self.turbo = False
+        self.turbo_sample = (perf_counter(), 0)
+        self.turbo_progress_bar = QtWidgets.QProgressBar(self)
+        self.turbo_progress_bar.setMaximumWidth(200)
+        self.turbo_label = QtWidgets.QLabel(self)
+        self.statusBar().addPermanentWidget(self.turbo_label)
+        self.statusBar().addPermanentWidget(self.turbo_progress_bar)
+        self.turbo_progress_bar.hide()
+        self.turbo_label.hide()
 
         # periodically autosave data if enabled
         self.autosave_timer = QtCore.QTimer()
@@ -209,10 +266,12 @@ class MainWidget(QtWidgets.QMainWindow):
         self.visual_preferences = self.load_visual_preferences()
         self.frame_widget.update_visual_preferences(self.visual_preferences)
 
-    def video_file_changed(self, path):
+    def video_file_changed(self, path, live_source=None):
         self.play_video(False)
 
-        self.camera_frame_update_timer.stop()
+        self.frame_view_timer.stop()
+        self.frame_result = None
+        self.idle_callbacks = []
         self.edit_controls.set_normal_mode()
         self.edit_controls.setDisabled(True)
         self.media_controls.set_seek_bar_value(0)
@@ -227,39 +286,81 @@ class MainWidget(QtWidgets.QMainWindow):
 
         self.close_video()
         self.frame_widget.clear()
-        with self.stream_queue.mutex:
-            self.stream_queue.queue.clear()
+        self.clear_stream_queue()
         self.tracking_worker.clear_data()
 
         if path is not None:
-            self.start_stream(path)
+            self.start_stream(path, live_source)
             self.edit_controls.setDisabled(False)
             self.media_controls.setDisabled(False)
             self.media_controls.track_button_toggled()
             self.docks["Extrinsic"].add_perspective_button.setDisabled(False)
             self.frame_widget.update_scaling(self.docks["Extrinsic"].scaling)
             self.docks["DataPlot"].set_frame_line_draggable(True)
-            self.camera_frame_update_timer.start(30)
-
-            while self.tracking_worker.no_of_frames == 0:
-                QtCore.QCoreApplication.processEvents()
-                sleep(0.2)
 
-            track_file = path.parent / (path.stem + ".json")
-            if track_file.is_file():
-                logging.info(f"Loaded data file {track_file.name}")
-                self.load_data(track_file)
+    def stream_opened(self):
+        """Continue opening a video once its first frame is processed"""
+        path = self.stream_worker.path
+        track_file = path.parent / (path.stem + ".json")
+        if self.stream_worker.live_source is None and track_file.is_file():
+            logging.info(f"Loaded data file {track_file.name}")
+            self.load_data(track_file)
 
-            self.frame_widget.auto_range()
-            if self.docks["Files"].batch_button.isChecked():
-                self.play_video(True)
+        self.frame_widget.auto_range()
+        if self.docks["Files"].batch_button.isChecked():
+            self.play_video(True)
 
     def close_video(self):
         if self.streaming:
             self.stream_worker.set_stop()
-            while self.streaming:  # wait till capture is closed
-                sleep(0.1)
-                QtCore.QCoreApplication.processEvents()
+            self.stream_thread.wait()  # till capture is closed
+            self.stream_finished()
+
+    def clear_stream_queue(self):
+        while True:
+            try:
+                self.stream_queue.get_nowait()
+            except Empty:
+                return
+
+    def when_idle(self, callback):
+        """Run callback once the stream has stopped and its frames are handled
+
+        The stream queues a token behind its last frame, the tracking worker
+        hands it back when it gets there. The GUI keeps running meanwhile.
+        """
+        if self.stream_worker is None:
+            callback()
+            return
+        self.idle_token += 1
+        self.idle_callbacks.append((self.idle_token, callback))
+        self.stream_worker.request_idle(self.idle_token)
+
+    def stream_idle(self, token):
+        while self.idle_callbacks and self.idle_callbacks[0][0] <= token:
+            _, callback = self.idle_callbacks.pop(0)
+            callback()
+
+    def open_live_source_suggested(self):
+        dialog = LiveSourceDialog()
+        if not dialog.exec():
+            return
+        source, simulate, max_frames = dialog.get_inputs()
+        if simulate:
+            path = Path(source)
+            if not path.is_file():
+                self.error_dialog(f"{source} is not a video file!")
+                return
+        else:
+            # data of cameras and streams is saved next to the session file
+            path = Path.home() / f"live_{strftime('%Y%m%d_%H%M%S')}"
+        self.video_file_changed(path, (source, simulate, max_frames))
+
+    def seekable_stream(self):
+        if self.stream_worker.live_source is None:
+            return True
+        self.error_dialog("Not available for live sources!")
+        return False
 
     def next_video(self):
         logging.debug("Go to next video")
@@ -274,25 +375,47 @@ class MainWidget(QtWidgets.QMainWindow):
             self.play_video(False)
             self.next_video()
 
-    def start_stream(self, path):
+    def start_stream(self, path, live_source=None):
         self.stream_worker = StreamWorker(
             path,
             self.stream_queue,
             self.docks["Intrinsic"],
             self.docks["Extrinsic"],
             self.docks["Orient"],
+            sequence_frame_rate=self.docks["Files"].sequence_frame_rate_spinbox.value(),
+            live_source=live_source,
         )
         self.stream_worker.moveToThread(self.stream_thread)
         self.stream_thread.started.connect(self.stream_worker.stream)
         self.stream_worker.stream_props.connect(self.set_stream_props)
-        self.stream_worker.finished.connect(self.stream_finished)
+        self.stream_worker.failed.connect(self.stream_failed)
+        self.stream_worker.finished.connect(
+            self.stream_thread.quit, QtCore.Qt.DirectConnection
+        )
+        self.stream_worker.range_progress.connect(self.track_range_progressed)
+        self.stream_worker.range_finished.connect(self.track_range_finished)
+        self.stream_worker.set_reverse(self.media_controls.reverse_button.isChecked())
+        self.stream_worker.set_stride(self.tracking_worker.stride)
+        self.stream_worker.set_stabilization(
+            self.docks["Tracking"].stabilize_checkbox.isChecked()
+        )
+        # the stream loop never returns to its event loop, so set it directly
+        self.tracking_worker.stride_changed.connect(
+            self.stream_worker.set_stride, QtCore.Qt.DirectConnection
+        )
+        self.tracking_worker.retrack_requested.connect(
+            self.stream_worker.seek_back, QtCore.Qt.DirectConnection
+        )
         self.stream_thread.start()
         self.streaming = True
 
     def set_stream_props(self, frame_rate, no_of_frames):
+        if self.sender() is not self.stream_worker:
+            return  # from a stream closed before its props arrived
         self.tracking_worker.set_props(no_of_frames)
         self.media_controls.set_seeking_props(no_of_frames - 2)
         self.docks["DataPlot"].set_frame_bound((0, no_of_frames - 2))
+        self.when_idle(self.stream_opened)
 
     def play_video(self, play):
         if self.stream_worker is not None:
@@ -302,6 +425,9 @@ class MainWidget(QtWidgets.QMainWindow):
                 self.media_controls.blockSignals(True)
 
                 self.stream_worker.set_play()
+                self.frame_widget.set_fast_overlay(
+                    self.docks["Tracking"].fast_overlay_checkbox.isChecked()
+                )
                 self.docks["DataPlot"].set_frame_line_draggable(False)
                 self.edit_controls.blockSignals(True)
                 self.edit_controls.set_normal_mode()
@@ -320,6 +446,7 @@ class MainWidget(QtWidgets.QMainWindow):
 
                 self.docks["DataPlot"].set_frame_line_draggable(True)
                 self.stream_worker.set_pause()
+                self.frame_widget.set_fast_overlay(False)
                 self.media_controls.set_tracking(False)
 
     def toggle_play(self):
@@ -337,15 +464,213 @@ class MainWidget(QtWidgets.QMainWindow):
     def set_autosave(self, autosave: bool):
         self.docks["Save"].autosave_button.setChecked(autosave)
 
+    def stream_failed(self, error):
+        if self.sender() is not self.stream_worker:
+            return
+        self.close_video()
+        self.error_dialog(f"Opening the video failed!\n{error}")
+
     def stream_finished(self):
-        self.stream_thread.exit()
         self.stream_worker = None
         self.streaming = False
 
     def tracking_finished(self):
-        self.tracking_thread.exit()
         self.tracking_worker = None
 
+    def tracking_settings_changed(self):
+        self.tracking_worker.set_motion_gate(
+            self.docks["Tracking"].motion_gate_settings()
+        )
+        self.tracking_worker.set_tracking_scale(
+            self.docks["Tracking"].tracking_scale(),
+            self.docks["Tracking"].refine_checkbox.isChecked(),
+        )
+        self.tracking_worker.set_stride(
+            self.docks["Tracking"].stride_spinbox.value(),
+            self.docks["Tracking"].adaptive_stride_checkbox.isChecked(),
+            self.docks["Tracking"].stride_max_step_spinbox.value(),
+        )
+        if self.stream_worker is not None and self.stream_worker.set_stabilization(
+            self.docks["Tracking"].stabilize_checkbox.isChecked()
+        ):
+            self.play_video(False)
+            self.when_idle(self.stabilization_changed)
+
+    def stabilization_changed(self):
+        self.reload_current_frame()
+        # trackers restart on the current frame as it is stabilized now
+        self.when_idle(self.tracking_worker.reset_trackers)
+
+    def track_range_suggested(self):
+        if self.stream_worker is None or self.range_progress_dialog is not None:
+            return
+        if not self.seekable_stream():
+            return
+        dialog = TrackRangeDialog(
+            max(self.tracking_worker.frame_no, 1), self.tracking_worker.no_of_frames
+        )
+        if dialog.exec():
+            self.start_track_range(*dialog.get_inputs())
+
+    def track_backwards_suggested(self):
+        if self.stream_worker is None or self.range_progress_dialog is not None:
+            return
+        if not self.seekable_stream():
+            return
+        if not self.tracking_worker.tracking_data:
+            return
+        frame_no = self.tracking_worker.frame_no
+        if frame_no <= 1:
+            self.info_dialog("Track Backwards", "Already at the first frame.")
+            return
+        valid = np.all(
+            [
+                ~np.isnan(data["bbox"]).any(axis=1)
+                for data in self.tracking_worker.tracking_data.values()
+            ],
+            axis=0,
+        )
+        if not valid[frame_no - 1]:
+            self.error_dialog(f"Not all trackers are placed at frame {frame_no}!")
+            return
+        end = gap_start(valid, frame_no)
+        if end == frame_no:
+            self.info_dialog(
+                "Track Backwards", f"Frame {frame_no - 1} is already tracked."
+            )
+            return
+        self.start_track_range(frame_no, end)
+
+    def start_track_range(self, start, end):
+        self.play_video(False)
+        self.when_idle(partial(self.move_to_range_start, start, end))
+
+    def move_to_range_start(self, start, end):
+        if self.stream_worker.move_frame_to(start) is None:
+            self.error_dialog(f"Could not read frame {start}!")
+            return
+        self.when_idle(partial(self.begin_track_range, start, end))
+
+    def begin_track_range(self, start, end):
+        self.tracking_worker.reset_trackers()
+
+        self.range_bounds = (start, end)
+        self.range_progress_dialog = QtWidgets.QProgressDialog(
+            f"Tracking frames {start} to {end}...", "Cancel", 0, abs(end - start), self
+        )
+        self.range_progress_dialog.setWindowTitle("Track Range")
+        self.range_progress_dialog.setWindowModality(QtCore.Qt.WindowModal)
+        self.range_progress_dialog.setMinimumDuration(0)
+        self.range_progress_dialog.canceled.connect(self.cancel_track_range)
+
+        self.media_controls.setDisabled(True)
+        self.edit_controls.setDisabled(True)
+        self.stream_worker.start_range(start, end)
+
+    def track_parallel_suggested(self):
+        if self.stream_worker is None or self.chunk_worker is not None:
+            return
+        if not self.seekable_stream():
+            return
+        if not self.tracking_worker.trackers:
+            return
+        dialog = TrackRangeDialog(
+            max(self.tracking_worker.frame_no, 1), self.tracking_worker.no_of_frames
+        )
+        if not dialog.exec():
+            return
+        start, end = sorted(dialog.get_inputs())
+        for name, data in self.tracking_worker.tracking_data.items():
+            if np.isnan(data["bbox"][start - 1]).any():
+                self.error_dialog(f"{name} has no position at frame {start}!")
+                return
+        self.play_video(False)
+
+        self.chunk_thread = QtCore.QThread()
+        self.chunk_worker = ChunkTrackingWorker(
+            self.stream_worker.path,
+            self.stream_worker.frame_processor(),
+            start,
+            end,
+            {
+                name: tracker_type
+                for name, (_, _, tracker_type) in self.tracking_worker.trackers.items()
+            },
+            {
+                name: data["bbox"].copy()
+                for name, data in self.tracking_worker.tracking_data.items()
+            },
+            self.docks["Tracking"].segments_spinbox.value(),
+            self.docks["Tracking"].segment_overlap_spinbox.value(),
+            self.docks["Tracking"].stitch_tolerance_spinbox.value(),
+            frame_rate=self.stream_worker.sequence_frame_rate,
+        )
+        self.chunk_worker.moveToThread(self.chunk_thread)
+        self.chunk_thread.started.connect(self.chunk_worker.run)
+        self.chunk_worker.progress.connect(self.statusBar().showMessage)
+        self.chunk_worker.finished.connect(self.track_parallel_finished)
+        self.chunk_worker.failed.connect(self.track_parallel_failed)
+        self.chunk_thread.start()
+        self.statusBar().showMessage(f"Tracking frames {start} to {end} in parallel...")
+
+    def track_parallel_finished(self, result):
+        self.stop_chunk_tracking()
+        self.tracking_worker.set_range_data(
+            result["start"], result["bbox"], result["time"], result["shift"]
+        )
+        self.update_frame_view()
+        if result["inconsistent"]:
+            self.info_dialog(
+                "Parallel Tracking",
+                "Segments did not agree, these were started from their own seed:\n"
+                + "\n".join(
+                    f"{name} at frame {frame_no}"
+                    for name, frame_no in result["inconsistent"]
+                ),
+            )
+
+    def track_parallel_failed(self, error):
+        self.stop_chunk_tracking()
+        self.error_dialog(f"Parallel tracking failed!\n{error}")
+
+    def stop_chunk_tracking(self):
+        self.statusBar().clearMessage()
+        self.chunk_thread.quit()
+        self.chunk_thread.wait()
+        self.chunk_worker = None
+        self.chunk_thread = None
+
+    def track_range_progressed(self, frame_no, fps):
+        if self.range_progress_dialog is None:
+            return
+        start, end = self.range_bounds
+        remaining = abs(end - frame_no) / fps if fps > 0 else 0
+        self.range_progress_dialog.setLabelText(
+            f"Tracking frames {start} to {end}\n"
+            f"{fps:.1f} fps, {remaining:.0f} s remaining"
+        )
+        self.range_progress_dialog.setValue(abs(frame_no - start))
+
+    def cancel_track_range(self):
+        if self.stream_worker is not None:
+            self.stream_worker.stop_range()
+
+    def track_range_finished(self, frame_no, completed):
+        if self.range_progress_dialog is not None:
+            dialog, self.range_progress_dialog = self.range_progress_dialog, None
+            dialog.close()
+        self.media_controls.setDisabled(False)
+        self.edit_controls.setDisabled(False)
+        self.update_frame_view()
+        if completed:
+            logging.info(f"Range tracking finished at frame {frame_no}.")
+        else:
+            logging.info(f"Range tracking stopped at frame {frame_no}.")
+
+    def reverse_toggled(self, reverse):
+        if self.stream_worker is not None:
+            self.stream_worker.set_reverse(reverse)
+
     def track_enabled(self, track):
         if track:
             if self.media_controls.play_button.isChecked():
@@ -357,46 +682,89 @@ class MainWidget(QtWidgets.QMainWindow):
         if self.stream_worker is not None:
             self.stream_worker.set_tracking(track)
 
+    def frame_view_interval(self):
+        # only preview occasionally while tracking at full speed
+        if self.turbo or self.range_progress_dialog is not None:
+            return 500
+        return 1000 / (self.screen().refreshRate() or 60)
+
+    def update_turbo(self):
+        tracking_dock = self.docks["Tracking"]
+        turbo = tracking_dock.turbo_checkbox.isChecked() or (
+            tracking_dock.auto_turbo_checkbox.isChecked()
+            and (self.isMinimized() or self.docks["Files"].batch_button.isChecked())
+        )
+        if turbo == self.turbo:
+            return
+        self.turbo = turbo
+        self.turbo_sample = (perf_counter(), self.tracking_worker.frame_no)
+        self.turbo_progress_bar.setVisible(turbo)
+        self.turbo_label.setVisible(turbo)
+        logging.info(f"Turbo mode {'on' if turbo else 'off'}.")
+        if not turbo:
+            self.update_frame_view()
+
+    def update_turbo_status(self, frame_no):
+        now = perf_counter()
+        last_time, last_frame_no = self.turbo_sample
+        fps = abs(frame_no - last_frame_no) / max(now - last_time, 1e-6)
+        self.turbo_sample = (now, frame_no)
+
+        self.turbo_progress_bar.setMaximum(max(self.tracking_worker.no_of_frames, 1))
+        self.turbo_progress_bar.setValue(frame_no)
+        self.turbo_label.setText(f"Turbo: {fps:.1f} fps")
+
+    def frame_result_ready(self):
+        if self.frame_view_timer.isActive():
+            return  # the pending redraw takes the latest result
+        wait = self.last_frame_view + self.frame_view_interval() / 1000 - perf_counter()
+        self.frame_view_timer.start(max(round(1000 * wait), 0))
+
     def update_frame_view(self):
-        if self.stream_worker is not None:
-            i = self.tracking_worker.frame_no - 1
-            self.frame_widget.update_frame(
-                self.tracking_worker.frame,
-                self.tracking_worker.frame_no,
-                self.tracking_worker.timestamp / 1000,
+        self.last_frame_view = perf_counter()
+        previous = self.frame_result
+        if result := self.tracking_worker.take_result(full=previous is None):
+            result.merge(previous)
+            self.frame_result = result
+        result = self.frame_result
+        if self.stream_worker is None or result is None or result.frame is None:
+            return
+        if self.turbo:
+            self.update_turbo_status(result.frame_no)
+            return
+
+        self.frame_widget.update_frame(
+            result.frame, result.frame_no, result.timestamp / 1000
+        )
+        self.frame_widget.set_all_item_data(
+            "tracker",
+            result.frame_no - 1,
+            {
+                name: (tracking_data["bbox"], tracking_data["target"])
+                for name, tracking_data in result.tracking_data.items()
+            },
+        )
+        for name, tracking_data in result.tracking_data.items():
+            self.docks["DataPlot"].update_tracker(
+                name,
+                tracking_data["target"] / self.docks["Extrinsic"].scaling,
+                frames=tracking_data["frame_no"],
+            )
+        for name, angle_data in result.analysis_data["angle"].items():
+            self.docks["DataPlot"].update_angle(
+                name,
+                angle_data["angle"],
+                frames=angle_data["frame_no"],
+            )
+        for name, distance_data in result.analysis_data["distance"].items():
+            self.docks["DataPlot"].update_distance(
+                name,
+                distance_data["distance"] / self.docks["Extrinsic"].scaling,
+                frames=distance_data["frame_no"],
             )
-            for name, tracking_data in self.tracking_worker.tracking_data.items():
-                self.frame_widget.set_item_data(
-                    "tracker",
-                    name,
-                    (
-                        i,
-                        tracking_data["bbox"],
-                        tracking_data["target"],
-                    ),
-                )
-                self.docks["DataPlot"].update_tracker(
-                    name,
-                    tracking_data["target"] / self.docks["Extrinsic"].scaling,
-                    frames=tracking_data["frame_no"],
-                )
-            for name, angle_data in self.tracking_worker.analysis_data["angle"].items():
-                self.docks["DataPlot"].update_angle(
-                    name,
-                    angle_data["angle"],
-                    frames=angle_data["frame_no"],
-                )
-            for name, distance_data in self.tracking_worker.analysis_data[
-                "distance"
-            ].items():
-                self.docks["DataPlot"].update_distance(
-                    name,
-                    distance_data["distance"] / self.docks["Extrinsic"].scaling,
-                    frames=distance_data["frame_no"],
-                )
 
-            self.media_controls.set_seek_bar_value(self.tracking_worker.frame_no)
-            self.docks["DataPlot"].move_frame_line(self.tracking_worker.frame_no)
+        self.media_controls.set_seek_bar_value(result.frame_no)
+        self.docks["DataPlot"].move_frame_line(result.frame_no)
 
     def move_frame_forwards(self):
         if self.stream_worker is not None:
@@ -406,18 +774,24 @@ class MainWidget(QtWidgets.QMainWindow):
         if self.stream_worker is not None:
             self.stream_worker.move_frame_backwards()
 
+    def corrections_changed(self):
+        if self.stream_worker is not None:
+            # frame 1 is corrected differently, stabilization starts over
+            self.stream_worker.reset_stabilizer()
+        self.frame_shape_changed()
+
     def frame_shape_changed(self):
         if self.stream_worker is not None:
             self.play_video(False)
-            while not self.stream_queue.empty():
-                sleep(0.1)
-
-            self.frame_widget.update_scaling(self.docks["Extrinsic"].scaling)
-            frame_no, timestamp, frame = self.stream_worker.read_current_frame()
-            self.frame_widget.frame_shape_changed((frame, frame_no, timestamp / 1000))
+            self.when_idle(self.reload_current_frame)
         else:
             self.load_image()
 
+    def reload_current_frame(self):
+        self.frame_widget.update_scaling(self.docks["Extrinsic"].scaling)
+        frame_no, timestamp, frame = self.stream_worker.read_current_frame()
+        self.frame_widget.frame_shape_changed((frame, frame_no, timestamp / 1000))
+
     def seek_bar_moved(self, frame_no):
         if self.stream_worker is not None:
             self.stream_worker.move_frame_to(frame_no)
@@ -425,10 +799,7 @@ class MainWidget(QtWidgets.QMainWindow):
 
     def edit_mode_changed(self, mode):
         self.play_video(False)
-        while not self.stream_queue.empty():
-            sleep(0.1)
-
-        self.frame_widget.set_mouse_mode(mode)
+        self.when_idle(partial(self.frame_widget.set_mouse_mode, mode))
 
     def set_normal_mode(self):
         self.edit_controls.set_normal_mode()
@@ -447,9 +818,9 @@ class MainWidget(QtWidgets.QMainWindow):
 
     def edit_item_props(self, item_type, name, props):
         self.play_video(False)
-        while not self.stream_queue.empty():
-            sleep(0.1)
+        self.when_idle(partial(self.change_item_props, item_type, name, props))
 
+    def change_item_props(self, item_type, name, props):
         self.frame_widget.edit_item_props(item_type, name, props)
         self.docks["Items"].edit_row(item_type, name, props)
         self.docks["DataPlot"].edit_item(item_type, name, props)
@@ -457,9 +828,9 @@ class MainWidget(QtWidgets.QMainWindow):
 
     def remove_item(self, item_type, name):
         self.play_video(False)
-        while not self.stream_queue.empty():
-            sleep(0.1)
+        self.when_idle(partial(self.delete_item, item_type, name))
 
+    def delete_item(self, item_type, name):
         self.tracking_worker.remove_item(item_type, name)
         self.frame_widget.remove_item(item_type, name)
         self.docks["Items"].remove_row(item_type, name)
@@ -481,11 +852,15 @@ class MainWidget(QtWidgets.QMainWindow):
                 msg,
             )
             logging.info(msg)
-            self.stream_worker.move_frame_to(frame_no - 2, track=False)
+            self.stream_worker.move_frame_to(
+                frame_no - 2 * self.tracking_worker.direction, track=False
+            )
             self.next_video()
         else:
             self.error_dialog(f"Tracking failed for {name} at frame {frame_no}!")
-            self.stream_worker.move_frame_to(frame_no - 2, track=False)
+            self.stream_worker.move_frame_to(
+                frame_no - 2 * self.tracking_worker.direction, track=False
+            )
 
     def add_tracker_failed(self, name, error):
         self.error_dialog(f"Could not initialise tracker for ({name})!\n{error}")
@@ -493,6 +868,63 @@ class MainWidget(QtWidgets.QMainWindow):
         self.docks["Items"].remove_row("tracker", name)
         self.docks["DataPlot"].remove_item("tracker", name)
 
+    def evaluate_trackers(self, item_type, name):
+        if self.stream_worker is None or self.benchmark_worker is not None:
+            return
+        if not self.seekable_stream():
+            return
+        frame_no = self.tracking_worker.frame_no
+        bbox = self.tracking_worker.tracking_data[name]["bbox"][frame_no - 1]
+        if np.isnan(bbox).any():
+            self.error_dialog(f"{name} has no position at frame {frame_no}!")
+            return
+        self.play_video(False)
+
+        idx = self.frame_widget.trackers.index_of(name)
+        self.benchmark_thread = QtCore.QThread()
+        self.benchmark_worker = BenchmarkWorker(
+            self.stream_worker.path,
+            self.stream_worker.frame_processor(),
+            frame_no,
+            self.docks["Tracking"].evaluation_frames_spinbox.value(),
+            bbox,
+            self.frame_widget.trackers["offset"][idx],
+            [t for t in tracker_types if t != "Static"],
+        )
+        self.benchmark_worker.moveToThread(self.benchmark_thread)
+        self.benchmark_thread.started.connect(self.benchmark_worker.run)
+        self.benchmark_worker.progress.connect(self.statusBar().showMessage)
+        self.benchmark_worker.finished.connect(partial(self.benchmark_finished, name))
+        self.benchmark_worker.failed.connect(self.benchmark_failed)
+        self.benchmark_thread.start()
+
+    def benchmark_finished(self, name, summary):
+        self.stop_benchmark()
+        trackers = self.frame_widget.trackers
+        if name not in trackers["name"]:
+            return
+        idx = trackers.index_of(name)
+        dialog = BenchmarkDialog(name, summary, trackers["tracker_type"][idx])
+        if dialog.exec():
+            props = {
+                "name": name,
+                "color": trackers["color"][idx],
+                "tracker_type": dialog.get_inputs(),
+                "predict": trackers["predict"][idx],
+            }
+            self.edit_item_props("tracker", name, props)
+
+    def benchmark_failed(self, error):
+        self.stop_benchmark()
+        self.error_dialog(f"Could not evaluate trackers!\n{error}")
+
+    def stop_benchmark(self):
+        self.statusBar().clearMessage()
+        self.benchmark_thread.quit()
+        self.benchmark_thread.wait()
+        self.benchmark_worker = None
+        self.benchmark_thread = None
+
     def reset_trackers(self):
         self.tracking_worker.reset_trackers()
 
@@ -508,7 +940,7 @@ class MainWidget(QtWidgets.QMainWindow):
                 {
                     k: v
                     for k, v in self.frame_widget.trackers.items()
-                    if k in ["name", "offset", "color", "tracker_type"]
+                    if k in ["name", "offset", "color", "tracker_type", "predict"]
                 },
                 {
                     "angle": {
@@ -578,11 +1010,14 @@ class MainWidget(QtWidgets.QMainWindow):
 
         self.media_controls.seek_bar.setValue(current_frame)
         self.tracking_worker.set_tracking_data(tracking_data)
-        for name, offset, color, tracker_type in zip(
+        for name, offset, color, tracker_type, predict in zip(
             tracker_properties["name"],
             tracker_properties["offset"],
             tracker_properties["color"],
             tracker_properties["tracker_type"],
+            tracker_properties.get(
+                "predict", [False] * len(tracker_properties["name"])
+            ),
         ):
             bbox = tracking_data[name]["bbox"][current_frame - 1]
             if np.isnan(bbox).any():
@@ -600,6 +1035,7 @@ class MainWidget(QtWidgets.QMainWindow):
                     "offset": offset,
                     "color": color,
                     "tracker_type": tracker_type,
+                    "predict": predict,
                 },
             )
 
@@ -660,11 +1096,14 @@ class MainWidget(QtWidgets.QMainWindow):
                             absolute
                         )
 
-                for name, offset, color, tracker_type in zip(
+                for name, offset, color, tracker_type, predict in zip(
                     tracker_properties["name"],
                     tracker_properties["offset"],
                     tracker_properties["color"],
                     tracker_properties["tracker_type"],
+                    tracker_properties.get(
+                        "predict", [False] * len(tracker_properties["name"])
+                    ),
                 ):
                     bbox = tracking_data[name]["bbox"][1]
                     if np.isnan(bbox).any():
@@ -682,6 +1121,7 @@ class MainWidget(QtWidgets.QMainWindow):
                             "offset": offset,
                             "color": color,
                             "tracker_type": tracker_type,
+                            "predict": predict,
                         },
                     )
                 angle_props = analysis_properties["angle"]
@@ -725,6 +1165,7 @@ class MainWidget(QtWidgets.QMainWindow):
                     self.tracking_worker.tracking_data,
                     self.tracking_worker.analysis_data,
                     self.docks["Extrinsic"].scaling,
+                    self.docks["Save"].original_space_checkbox.isChecked(),
                 )
             except Exception as e:
                 self.error_dialog(str(e))
@@ -762,6 +1203,12 @@ class MainWidget(QtWidgets.QMainWindow):
     def batch_toggled(self, checked):
         if checked:
             self.set_autosave(True)
+        self.update_turbo()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QtCore.QEvent.WindowStateChange:
+            self.update_turbo()
 
     def gui_save(self, settings):
         for dock in self.docks.values():
@@ -785,11 +1232,17 @@ class MainWidget(QtWidgets.QMainWindow):
         """save before closing"""
         self.docks["Save"].autosave_button_toggled()
         self.close_video()
+        self.docks["Files"].prober.shutdown()
+        self.docks["Files"].scanner.shutdown()
+        if self.chunk_worker is not None:
+            self.chunk_worker.cancel()
+            self.stop_chunk_tracking()
+        if self.benchmark_worker is not None:
+            self.benchmark_worker.cancel()
+            self.stop_benchmark()
 
         self.tracking_worker.set_stop()
-        while self.tracking_thread.isRunning():  # wait till threads have exited
-            sleep(0.1)
-            QtCore.QCoreApplication.processEvents()
+        self.tracking_thread.wait()  # till the tracking loop has exited
 
         settings = QtCore.QSettings(str(self.settings_file), QtCore.QSettings.IniFormat)
         self.gui_save(settings)
@@ -816,6 +1269,9 @@ class MainWidget(QtWidgets.QMainWindow):
 
 
 def main():
+    # worker processes of tracker evaluation and parallel tracking start the
+    # frozen executable again, this hands them to their task instead of the GUI
+    multiprocessing.freeze_support()
     setup_logger(logging.INFO)
 
     app = QtWidgets.QApplication([])
@@ -10,6 +10,7 @@ visual_preferences = {
     "crosshair_pen_width": 1,
     "trajectory_length": 30,
     "trajectory_width": 2,
+    "trajectory_fade_transparency": 255,
     "frame_label_text_color": [255, 255, 255],
     "frame_label_fill_color": [0, 0, 0, 150],
     "instruction_label_text_color": [255, 255, 255],
@@ -1,2 +1,5 @@
+from .tracker_factory import create_tracker, tracker_types, tracker_products
+from .worker_benchmark import BenchmarkWorker
+from .worker_chunk import ChunkTrackingWorker
 from .worker_stream import StreamWorker
 from .worker_tracking import TrackingWorker
@@ -0,0 +1,37 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# set in each pool process, tasks stop between frames once it is set
+cancel_event = None
+
+
+def init_process(event):
+    global cancel_event
+    cancel_event = event
+
+
+def cancelled():
+    return cancel_event is not None and cancel_event.is_set()
+
+
+class CancellablePool:
+    """ProcessPoolExecutor whose running tasks can be asked to stop early.
+
+    Tasks poll cancelled() between frames and return what they have so far.
+    """
+
+    def __init__(self):
+        self.event = multiprocessing.Event()
+
+    def executor(self, max_workers=None):
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=init_process,
+            initargs=(self.event,),
+        )
+
+    def cancel(self):
+        self.event.set()
+
+    def is_cancelled(self):
+        return self.event.is_set()
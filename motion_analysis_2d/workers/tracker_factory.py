@@ -0,0 +1,44 @@
+from functools import partial
+
+import cv2 as cv
+
+from motion_analysis_2d.custom_components import StaticTracker, CascadeTracker
+
+tracker_types = (
+    "CSRT",
+    "MedianFlow",
+    "KCF",
+    "Boosting",
+    "MOSSE",
+    "MIL",
+    "Cascade",
+    "Static",
+)
+
+# image a tracker type is fed, if not the processed colour frame
+tracker_products = {"MOSSE": "gray", "Cascade": "gray"}
+
+
+def create_tracker(tracker_type):
+    if tracker_type == "CSRT":
+        tracker = cv.TrackerCSRT_create()
+    elif tracker_type == "KCF":
+        tracker = cv.TrackerKCF_create()
+    elif tracker_type == "MedianFlow":
+        tracker = cv.legacy.TrackerMedianFlow_create()
+    elif tracker_type == "Boosting":
+        tracker = cv.legacy.TrackerBoosting_create()
+    elif tracker_type == "MOSSE":
+        tracker = cv.legacy.TrackerMOSSE_create()
+    elif tracker_type == "MIL":
+        tracker = cv.legacy.TrackerMIL_create()
+    elif tracker_type == "Cascade":
+        tracker = CascadeTracker(
+            partial(create_tracker, "MOSSE"),
+            partial(create_tracker, "CSRT"),
+        )
+    elif tracker_type == "Static":
+        tracker = StaticTracker()
+    else:
+        raise NotImplementedError
+    return tracker
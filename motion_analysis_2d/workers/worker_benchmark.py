@@ -0,0 +1,133 @@
+import logging
+import tempfile
+from concurrent.futures import as_completed
+from pathlib import Path
+from time import perf_counter
+
+import cv2 as cv
+import numpy as np
+
+from motion_analysis_2d.custom_components import FrameProducts, open_capture
+from motion_analysis_2d.defs import QtCore, Signal
+from motion_analysis_2d.funcs import summarise_benchmark
+from .process_pool import CancellablePool, cancelled
+from .tracker_factory import create_tracker, tracker_products
+from .worker_tracking import bbox_to_target
+
+
+class BenchmarkWorker(QtCore.QObject):
+    finished = Signal(object)
+    failed = Signal(str)
+    progress = Signal(str)
+
+    def __init__(
+        self,
+        path,
+        processor,
+        start_frame,
+        no_of_frames,
+        bbox,
+        offset,
+        tracker_types,
+    ):
+        super().__init__()
+
+        self.path = path
+        self.processor = processor
+        self.start_frame = start_frame
+        self.no_of_frames = no_of_frames
+        self.bbox = tuple(float(a) for a in bbox)
+        self.offset = tuple(offset)
+        self.tracker_types = tracker_types
+        self.pool = CancellablePool()
+
+    def run(self):
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                frames_path = Path(temp_dir) / "frames.npy"
+                self.progress.emit("Reading frames...")
+                self.save_frames(frames_path)
+
+                results = {}
+                with self.pool.executor() as executor:
+                    futures = {
+                        executor.submit(
+                            evaluate_tracker,
+                            tracker_type,
+                            frames_path,
+                            self.bbox,
+                            self.offset,
+                        ): tracker_type
+                        for tracker_type in self.tracker_types
+                    }
+                    for future in as_completed(futures):
+                        tracker_type = futures[future]
+                        try:
+                            results[tracker_type] = future.result()
+                        except Exception as e:
+                            logging.warning(f"Evaluating {tracker_type} failed. {e}")
+                        self.progress.emit(f"{tracker_type} evaluated.")
+
+            if self.pool.is_cancelled():
+                logging.info("Tracker evaluation cancelled.")
+                return
+            if not results:
+                raise RuntimeError("No tracker could be evaluated.")
+            summary = summarise_benchmark(results)
+            logging.info(f"Tracker evaluation finished: {summary}")
+            self.finished.emit(summary)
+
+        except Exception as e:
+            logging.warning(f"Tracker evaluation failed. {e}")
+            self.failed.emit(str(e))
+
+    def cancel(self):
+        """Stop reading and the running evaluations, nothing is emitted after"""
+        self.pool.cancel()
+
+    def save_frames(self, frames_path):
+        cap = open_capture(self.path)
+        cap.set(cv.CAP_PROP_POS_FRAMES, self.start_frame - 1)
+        frames = []
+        for frame_no in range(self.start_frame, self.start_frame + self.no_of_frames):
+            if self.pool.is_cancelled():
+                break
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frames.append(self.processor(frame, frame_no))
+        cap.release()
+
+        if len(frames) < 2:
+            raise RuntimeError("Not enough frames to evaluate trackers.")
+        np.save(frames_path, np.stack(frames))
+
+
+def evaluate_tracker(tracker_type, frames_path, bbox, offset):
+    frames = np.load(frames_path, mmap_mode="r")
+    target = np.full((len(frames), 2), np.nan, dtype=float)
+    failures = 0
+
+    # fed the same image as in the tracking worker, converted outside the timing
+    product = tracker_products.get(tracker_type, "frame")
+    tracker = create_tracker(tracker_type)
+    tracker.init(
+        FrameProducts(np.asarray(frames[0])).get(product),
+        tuple(int(round(a)) for a in bbox),
+    )
+    target[0] = bbox_to_target(*bbox, *offset)
+
+    duration = 0.0
+    for i in range(1, len(frames)):
+        if cancelled():
+            break
+        frame = FrameProducts(np.asarray(frames[i])).get(product)
+        start = perf_counter()
+        ret, new_bbox = tracker.update(frame)
+        duration += perf_counter() - start
+        if ret:
+            target[i] = bbox_to_target(*new_bbox, *offset)
+        else:
+            failures += 1
+
+    return {"target": target, "duration": duration, "failures": failures}
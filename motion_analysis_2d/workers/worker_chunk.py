@@ -0,0 +1,257 @@
+import logging
+from concurrent.futures import as_completed
+
+import cv2 as cv
+import numpy as np
+
+from motion_analysis_2d.custom_components import FrameProducts, open_capture
+from motion_analysis_2d.defs import QtCore, Signal
+from motion_analysis_2d.funcs import latest_keyframe, split_segments, stitch_segments
+from .process_pool import CancellablePool, cancelled
+from .tracker_factory import create_tracker, tracker_products
+
+
+class ChunkTrackingWorker(QtCore.QObject):
+    finished = Signal(object)
+    failed = Signal(str)
+    progress = Signal(str)
+
+    def __init__(
+        self,
+        path,
+        processor,
+        start,
+        end,
+        tracker_types,
+        bboxes,
+        n_segments,
+        overlap,
+        tolerance,
+        coarse_scale=0.25,
+        coarse_stride=4,
+        frame_rate=None,
+    ):
+        super().__init__()
+
+        self.path = path
+        self.processor = processor
+        self.start = start
+        self.end = end
+        self.tracker_types = tracker_types
+        self.bboxes = bboxes
+        self.n_segments = n_segments
+        self.overlap = overlap
+        self.tolerance = tolerance
+        self.coarse_scale = coarse_scale
+        self.coarse_stride = coarse_stride
+        self.frame_rate = frame_rate
+        self.pool = CancellablePool()
+
+    def run(self):
+        try:
+            segments = split_segments(
+                self.start, self.end, self.n_segments, self.overlap
+            )
+
+            results = [None] * len(segments)
+            with self.pool.executor(len(segments)) as executor:
+                futures = {
+                    executor.submit(
+                        seed_and_track_segment,
+                        self.path,
+                        self.processor,
+                        seg_start,
+                        seg_end,
+                        self.tracker_types,
+                        *self.find_seeds(seg_start),
+                        self.coarse_scale,
+                        self.coarse_stride,
+                        self.frame_rate,
+                    ): i
+                    for i, (seg_start, seg_end) in enumerate(segments)
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    results[futures[future]] = future.result()
+                    self.progress.emit(f"{done} of {len(segments)} segments tracked.")
+            if self.pool.is_cancelled():
+                logging.info("Parallel tracking cancelled.")
+                return
+
+            bboxes, inconsistent = stitch_segments(
+                segments, [result["bbox"] for result in results], self.tolerance
+            )
+            times = np.full(self.end - self.start + 1, np.nan)
+            shifts = np.full((self.end - self.start + 1, 2), np.nan)
+            for (seg_start, seg_end), result in zip(segments, results):
+                frames = slice(seg_start - self.start, seg_end - self.start + 1)
+                times[frames] = result["time"]
+                shifts[frames] = result["shift"]
+            for name, frame_no in inconsistent:
+                logging.warning(
+                    f"Segments of {name} do not agree at frame {frame_no}, "
+                    f"the segment was started from its own seed."
+                )
+            self.finished.emit(
+                {
+                    "start": self.start,
+                    "bbox": bboxes,
+                    "time": times,
+                    "shift": shifts,
+                    "inconsistent": inconsistent,
+                }
+            )
+
+        except Exception as e:
+            logging.warning(f"Parallel tracking failed. {e}")
+            self.failed.emit(str(e))
+
+    def cancel(self):
+        """Stop the running segments, nothing is emitted after"""
+        self.pool.cancel()
+
+    def find_seeds(self, frame_no):
+        """
+        Seeds of the segment starting at frame_no from existing data
+
+        :return: (bboxes of the trackers known at frame_no, latest keyframe
+            where the others are known, their bboxes at the keyframe)
+        """
+        seeds = {
+            name: bbox[frame_no - 1]
+            for name, bbox in self.bboxes.items()
+            if not np.isnan(bbox[frame_no - 1]).any()
+        }
+        missing = [name for name in self.tracker_types if name not in seeds]
+        key_frame = latest_keyframe(self.bboxes, missing, frame_no, self.start)
+        key_bboxes = {name: self.bboxes[name][key_frame - 1] for name in missing}
+        return seeds, key_frame, key_bboxes
+
+
+def read_frames(path, processor, start, end, frame_rate=None, stride=1):
+    """
+    Read and process every stride-th frame from start to end, and end itself
+
+    The frames between are only grabbed, they are neither retrieved nor
+    processed.
+    """
+    cap = open_capture(path, frame_rate)
+    cap.set(cv.CAP_PROP_POS_FRAMES, start - 1)
+    pos = start
+    try:
+        for frame_no in [*range(start, end, stride), end]:
+            for _ in range(frame_no - pos):
+                if not cap.grab():
+                    return
+            ret, frame = cap.read()
+            if not ret:
+                return
+            pos = frame_no + 1
+            frame = processor(frame, frame_no)
+            yield frame_no, cap.get(cv.CAP_PROP_POS_MSEC), FrameProducts(
+                frame, processor.shift
+            )
+    finally:
+        cap.release()
+
+
+def seed_and_track_segment(
+    path,
+    processor,
+    start,
+    end,
+    tracker_types,
+    seeds,
+    key_frame,
+    key_bboxes,
+    coarse_scale=0.25,
+    coarse_stride=4,
+    frame_rate=None,
+):
+    """
+    Track a segment in a separate process, the trackers without a seed are
+    first carried from the keyframe to the start by a coarse MOSSE pass on
+    every coarse_stride-th frame at coarse_scale
+    """
+    seeds = dict(seeds)
+    if key_bboxes:
+        coarse = track_segment(
+            path,
+            processor,
+            key_frame,
+            start,
+            {name: "MOSSE" for name in key_bboxes},
+            key_bboxes,
+            coarse_scale,
+            frame_rate,
+            coarse_stride,
+        )
+        for name, bbox in coarse["bbox"].items():
+            if np.isnan(bbox[-1]).any():
+                continue
+            # keep the known box size, move it to the coarse centre
+            _, _, w, h = key_bboxes[name]
+            centre = bbox[-1, :2] + bbox[-1, 2:] / 2
+            seeds[name] = np.array([centre[0] - w / 2, centre[1] - h / 2, w, h])
+    return track_segment(
+        path, processor, start, end, tracker_types, seeds, frame_rate=frame_rate
+    )
+
+
+def track_segment(
+    path,
+    processor,
+    start,
+    end,
+    tracker_types,
+    seeds,
+    scale=1.0,
+    frame_rate=None,
+    stride=1,
+):
+    """
+    Track frames start to end in a separate process, NaN after a failure and
+    on the frames skipped by stride
+    """
+    n_frames = end - start + 1
+    bboxes = {name: np.full((n_frames, 4), np.nan) for name in tracker_types}
+    times = np.full(n_frames, np.nan)
+    shifts = np.full((n_frames, 2), np.nan)
+    trackers = {}
+
+    for frame_no, timestamp, products in read_frames(
+        path, processor, start, end, frame_rate, stride
+    ):
+        if cancelled():
+            break
+        i = frame_no - start
+        times[i] = timestamp
+        if products.shift is not None:
+            shifts[i] = products.shift
+        if i == 0:
+            for name, bbox in seeds.items():
+                if name not in tracker_types:
+                    continue
+                tracker_type = tracker_types[name]
+                init_bbox = np.round(np.asarray(bbox, dtype=float) * scale)
+                init_bbox = init_bbox.astype(np.int32)
+                init_bbox[2:] = np.maximum(init_bbox[2:], 1)
+                tracker = create_tracker(tracker_type)
+                tracker.init(
+                    products.get(tracker_products.get(tracker_type, "frame"), scale),
+                    init_bbox,
+                )
+                trackers[name] = tracker
+                bboxes[name][0] = bbox
+            continue
+
+        for name, tracker in list(trackers.items()):
+            tracker_type = tracker_types[name]
+            ret, bbox = tracker.update(
+                products.get(tracker_products.get(tracker_type, "frame"), scale)
+            )
+            if ret:
+                bboxes[name][i] = np.asarray(bbox, dtype=float) / scale
+            else:
+                del trackers[name]
+
+    return {"bbox": bboxes, "time": times, "shift": shifts}
@@ -1,14 +1,26 @@
-from time import sleep
+import logging
+import threading
+from time import perf_counter
 
 import cv2 as cv
 
+from motion_analysis_2d.custom_components import (
+    FrameProcessor,
+    FrameProducts,
+    Stabilizer,
+    open_capture,
+    open_live_capture,
+)
 from motion_analysis_2d.defs import QtCore, Signal
 
 
 class StreamWorker(QtCore.QObject):
     stream_props = Signal(float, int)
     finished = Signal()
+    failed = Signal(str)
     progress = Signal()
+    range_progress = Signal(int, float)
+    range_finished = Signal(int, bool)
 
     def __init__(
         self,
@@ -18,6 +30,8 @@ class StreamWorker(QtCore.QObject):
         extrinsic_cal,
         orient,
         *args,
+        sequence_frame_rate=None,
+        live_source=None,
         **kwargs,
     ):
         super().__init__()
@@ -28,6 +42,12 @@ class StreamWorker(QtCore.QObject):
         self.intrinsic_cal = intrinsic_cal
         self.extrinsic_cal = extrinsic_cal
         self.orient = orient
+        self.sequence_frame_rate = sequence_frame_rate
+        self.live_source = live_source
+        # kept while stabilization is off, so shifts keep their origin
+        self.stabilizer = Stabilizer()
+        self.stabilize = False
+        self.first_frame = None
 
         self.frame_no = 0
         self.timestamp = 0
@@ -35,36 +55,101 @@ class StreamWorker(QtCore.QObject):
         self.no_of_frames = 0
         self.frame = None
 
+        # raw frames decoded forwards once and served backwards
+        self.reverse_buffer = []
+        self.reverse_buffer_size = 24
+        self.reversed = False
+
+        self.range_start = 0
+        self.range_end = None
+        self.range_cancel = False
+        self.range_start_time = 0
+        self.range_report_time = 0
+
         self.stop_flag = False
         self.play_flag = False
+        self.reverse_flag = False
         self.track_flag = False
+        self.stride = 1
+        # frame to go back to before reading on, see seek_back
+        self.seek_frame = None
+        # wakes the paused stream loop when it has something to do
+        self.wake = threading.Event()
+        # latest idle token asked for by the GUI and latest one queued
+        self.idle_token = 0
+        self.idle_confirmed = 0
         self.mutex = QtCore.QMutex()
 
     def stream(self):
         self.stop_flag = False
-        self.cap = cv.VideoCapture(str(self.path))
+        try:
+            self.cap = self.open()
+        except Exception as e:
+            # finished still quits the thread, closing the video does not block
+            logging.warning(f"Opening {self.path} failed. {e}")
+            self.failed.emit(str(e))
+            self.finished.emit()
+            self.deleteLater()
+            return
 
         self.frame_rate = self.cap.get(cv.CAP_PROP_FPS)
         self.no_of_frames = int(self.cap.get(cv.CAP_PROP_FRAME_COUNT))
-        self.stream_props.emit(self.frame_rate, self.no_of_frames)
 
+        # frame 1 is the origin of stabilization shifts
+        ret, frame = self.cap.read()
+        self.first_frame = frame if ret else None
+        self.set_position(0)
+
+        # the first frame is queued before the GUI is told the stream is open
         self.read_single_frame()
-        self.cap.set(cv.CAP_PROP_POS_FRAMES, 0)
+        self.set_position(0)
+        self.stream_props.emit(self.frame_rate, self.no_of_frames)
 
         while not self.stop_flag:
-            if self.play_flag:
-                self.read_single_frame()
+            if self.seek_frame is not None:
+                frame_no, self.seek_frame = self.seek_frame, None
+                self.move_frame_to(frame_no)
+            elif self.range_end is not None:
+                self.track_range_step()
+            elif self.play_flag and self.reverse_flag:
+                self.read_reverse_frame()
+            elif self.play_flag:
+                self.read_single_frame(skip=self.stride - 1 if self.track_flag else 0)
             else:
-                sleep(0.3)
+                self.confirm_idle()
+                self.wake.wait(0.3)
+                self.wake.clear()
 
+        if self.range_end is not None:
+            self.range_end = None
+            self.range_finished.emit(self.frame_no, False)
+        if self.live_source is not None:
+            logging.info(
+                f"Live source dropped {self.cap.dropped} of {self.cap.grabbed} frames."
+            )
         self.cap.release()
         self.finished.emit()
         self.stop_flag = False
         self.deleteLater()
 
-    def read_single_frame(self, track=None):
+    def open(self):
+        if self.live_source is not None:
+            cap = open_live_capture(*self.live_source)
+        else:
+            cap = open_capture(self.path, self.sequence_frame_rate)
+        if not cap.isOpened():
+            cap.release()
+            raise OSError(f"{self.path} cannot be read.")
+        return cap
+
+    def read_single_frame(self, track=None, skip=0):
         if track is None:
             track = self.track_flag
+        if self.reversed:
+            self.set_position(self.frame_no)
+        for _ in range(skip):
+            if not self.cap.grab():
+                return
 
         ret, frame = self.cap.read()
         if not ret:
@@ -79,7 +164,7 @@ class StreamWorker(QtCore.QObject):
             (
                 self.frame_no,
                 self.timestamp,
-                self.frame,
+                FrameProducts(self.frame, self.shift(), self.capture_time()),
                 track,
             )
         )
@@ -90,35 +175,198 @@ class StreamWorker(QtCore.QObject):
             self.frame,
         )
 
-    def process_frame(self, frame):
+    def read_reverse_frame(self, track=None):
+        if track is None:
+            track = self.track_flag
+        if self.frame_no <= 1 or self.live_source is not None:
+            return
+
+        if not self.reverse_buffer or self.reverse_buffer[-1][0] != self.frame_no - 1:
+            self.fill_reverse_buffer(self.frame_no - 1)
+            if not self.reverse_buffer:
+                return
+        frame_no, timestamp, frame = self.reverse_buffer.pop()
+
+        self.mutex.lock()
+        self.frame_no = frame_no
+        self.timestamp = timestamp
+        self.frame = self.process_frame(frame)
+
+        self.stream_queue.put(
+            (
+                self.frame_no,
+                self.timestamp,
+                FrameProducts(self.frame, self.shift(), self.capture_time()),
+                track,
+            )
+        )
+        self.mutex.unlock()
+        return (
+            self.frame_no,
+            self.timestamp,
+            self.frame,
+        )
+
+    def fill_reverse_buffer(self, last_frame_no):
+        first_frame_no = max(1, last_frame_no - self.reverse_buffer_size + 1)
+        self.set_position(first_frame_no - 1)
+        self.reversed = True
+        for _ in range(first_frame_no, last_frame_no + 1):
+            ret, frame = self.cap.read()
+            if not ret:
+                break
+            self.reverse_buffer.append(
+                (
+                    int(self.cap.get(cv.CAP_PROP_POS_FRAMES)),
+                    self.cap.get(cv.CAP_PROP_POS_MSEC),
+                    frame,
+                )
+            )
+
+    def set_position(self, frame_idx):
+        self.reverse_buffer = []
+        self.reversed = False
+        self.cap.set(cv.CAP_PROP_POS_FRAMES, frame_idx)
+
+    def start_range(self, start, end):
+        self.range_start = start
+        self.range_start_time = self.range_report_time = perf_counter()
+        self.range_cancel = False
+        self.range_end = end
+        self.wake.set()
+
+    def stop_range(self):
+        self.range_cancel = True
+
+    def track_range_step(self):
+        backwards = self.range_end < self.range_start
+        if not self.range_cancel and self.frame_no != self.range_end:
+            if backwards:
+                read = self.read_reverse_frame(track=True)
+            else:
+                skip = min(self.stride - 1, self.range_end - self.frame_no - 1)
+                read = self.read_single_frame(track=True, skip=skip)
+            if read is not None:
+                self.report_range_progress()
+                return
+
+        completed = self.frame_no == self.range_end
+        self.range_end = None
+        self.range_finished.emit(self.frame_no, completed)
+
+    def report_range_progress(self, interval=0.25):
+        now = perf_counter()
+        if now - self.range_report_time < interval and self.frame_no != self.range_end:
+            return
+        self.range_report_time = now
+        elapsed = max(now - self.range_start_time, 1e-6)
+        self.range_progress.emit(
+            self.frame_no, abs(self.frame_no - self.range_start) / elapsed
+        )
+
+    def correct_frame(self, frame):
         frame = self.intrinsic_cal.undistort_map(frame)
         frame = self.orient.orient_img(frame)
-        frame = self.extrinsic_cal.change_perspective(frame)
+        return self.extrinsic_cal.change_perspective(frame)
+
+    def process_frame(self, frame):
+        frame = self.correct_frame(frame)
+        if self.stabilize and self.first_frame is not None:
+            self.prepare_stabilizer(frame)
+            frame = self.stabilizer.stabilize(frame, self.frame_no)
         return frame
 
+    def prepare_stabilizer(self, frame):
+        """Set frame 1 as origin when there is none for frames of this size"""
+        if not self.stabilizer.matches(frame):
+            self.stabilizer.set_origin(self.correct_frame(self.first_frame))
+
+    def reset_stabilizer(self):
+        self.mutex.lock()
+        self.stabilizer.reset()
+        self.mutex.unlock()
+
+    def capture_time(self):
+        return getattr(self.cap, "capture_time", None)
+
+    def shift(self):
+        return self.stabilizer.shift if self.stabilize else None
+
+    def set_stabilization(self, stabilize):
+        if stabilize == self.stabilize:
+            return False
+        self.stabilize = stabilize
+        return True
+
+    def frame_processor(self):
+        undistort_maps, warp = None, None
+        if self.intrinsic_cal.cal_ok and self.intrinsic_cal.map_x is not None:
+            undistort_maps = (self.intrinsic_cal.map_x, self.intrinsic_cal.map_y)
+        if self.extrinsic_cal.cal_ok and self.extrinsic_cal.M is not None:
+            warp = (self.extrinsic_cal.M, self.extrinsic_cal.output_size)
+        stabilizer = None
+        if self.stabilize and self.first_frame is not None:
+            # a copy, the stream keeps using its own
+            self.mutex.lock()
+            self.prepare_stabilizer(self.correct_frame(self.first_frame))
+            stabilizer = self.stabilizer.copy()
+            self.mutex.unlock()
+        return FrameProcessor(
+            undistort_maps,
+            self.orient.rotation,
+            self.orient.flip,
+            warp,
+            stabilizer,
+        )
+
     def move_frame_forwards(self, track=None):
         return self.read_single_frame(track=track)
 
     def move_frame_backwards(self, track=None):
-        self.cap.set(cv.CAP_PROP_POS_FRAMES, self.frame_no - 2)
-        return self.read_single_frame(track=track)
+        return self.read_reverse_frame(track=track)
 
     def read_current_frame(self, track=None):
-        self.cap.set(cv.CAP_PROP_POS_FRAMES, self.frame_no - 1)
+        self.set_position(self.frame_no - 1)
         return self.read_single_frame(track=track)
 
     def move_frame_to(self, frame_no, track=False):
-        self.cap.set(cv.CAP_PROP_POS_FRAMES, frame_no - 1)
+        self.set_position(frame_no - 1)
         return self.read_single_frame(track=track)
 
+    def seek_back(self, frame_no):
+        """Read frame_no again untracked, the stream then goes on from it"""
+        self.seek_frame = frame_no
+        self.wake.set()
+
+    def request_idle(self, token):
+        """Ask for token to be queued once the stream has stopped reading"""
+        self.idle_token = token
+        self.wake.set()
+
+    def confirm_idle(self):
+        # queued behind every frame read so far
+        token = self.idle_token
+        if token > self.idle_confirmed:
+            self.idle_confirmed = token
+            self.stream_queue.put(token)
+
     def set_stop(self):
         self.stop_flag = True
+        self.wake.set()
 
     def set_play(self):
         self.play_flag = True
+        self.wake.set()
 
     def set_pause(self):
         self.play_flag = False
+        self.range_cancel = True
+
+    def set_reverse(self, reverse):
+        self.reverse_flag = reverse
+
+    def set_stride(self, stride):
+        self.stride = stride
 
     def set_tracking(self, track):
         self.track_flag = track
@@ -1,13 +1,26 @@
 import logging
 from queue import Empty
-from time import sleep
+from time import sleep, perf_counter
 
-import cv2 as cv
 import numpy as np
 
-from motion_analysis_2d.custom_components import StaticTracker
+from motion_analysis_2d.custom_components import (
+    MotionPredictor,
+    MotionGate,
+    CascadeTracker,
+    FrameResult,
+)
 from motion_analysis_2d.defs import QtCore, Signal
-from motion_analysis_2d.funcs import angle_vec
+from motion_analysis_2d.funcs import (
+    angle_vec,
+    adapt_stride,
+    crop_patch,
+    centred_patch,
+    search_template,
+    scale_bbox,
+    refine_bbox,
+)
+from .tracker_factory import create_tracker, tracker_products
 
 
 class TrackingWorker(QtCore.QObject):
@@ -15,6 +28,10 @@ class TrackingWorker(QtCore.QObject):
     tracking_failed = Signal(str, int)
     reached_end = Signal()
     add_tracker_failed = Signal(str, object)
+    stride_changed = Signal(int)
+    retrack_requested = Signal(int)
+    result_ready = Signal()
+    stream_idle = Signal(int)
 
     def __init__(
         self,
@@ -23,15 +40,41 @@ class TrackingWorker(QtCore.QObject):
         super().__init__()
 
         self.trackers = {}
+        self.templates = {}
+        self.predictors = {}
+        self.motion_gates = {}
+        self.motion_gate_settings = None
+        self.tracking_scale = 1.0
+        self.refine = False
         self.tracking_data = {}
         self.analysis_data = {"angle": {}, "distance": {}}
 
         self.stream_queue = stream_queue
 
         self.frame = None
+        self.products = None
         self.frame_no = 0
         self.timestamp = 0
         self.no_of_frames = 0
+        self.direction = 1
+
+        self.stride = 1
+        self.max_stride = 1
+        self.adaptive_stride = False
+        self.max_displacement = 5.0
+        # frame the stream was sent back to, frames read before it are dropped
+        self.retrack_frame = None
+
+        self.reacquire_scales = (2, 4, 8)
+        self.reacquire_threshold = 0.6
+        # refinements at least this good replace the template
+        self.template_refresh = 0.9
+
+        # whether the GUI has a frame result to take, see publish_result
+        self.result_pending = False
+        self.result_notified = False
+        # (start, stop) of the rows written since the last result, None for all
+        self.dirty = None
 
         self.stop_flag = False
         self.mutex = QtCore.QMutex()
@@ -44,6 +87,12 @@ class TrackingWorker(QtCore.QObject):
         self.analysis_data = {"angle": {}, "distance": {}}
         self.tracking_data = {}
         self.trackers = {}
+        self.templates = {}
+        self.predictors = {}
+        self.motion_gates = {}
+        self.result_pending = False
+        self.dirty = None
+        self.retrack_frame = None
         logging.debug("Tracking data cleared.")
 
     def add_item(self, item_type, item_props):
@@ -54,6 +103,7 @@ class TrackingWorker(QtCore.QObject):
                 item_props["bbox_size"],
                 item_props["offset"],
                 item_props["tracker_type"],
+                item_props.get("predict", False),
             )
         elif item_type == "angle":
             self.add_angle(
@@ -86,7 +136,9 @@ class TrackingWorker(QtCore.QObject):
         elif item_type == "distance":
             self.edit_distance(name, props)
 
-    def add_tracker(self, name, bbox_pos, bbox_size, offset, tracker_type="Static"):
+    def add_tracker(
+        self, name, bbox_pos, bbox_size, offset, tracker_type="Static", predict=False
+    ):
         self.mutex.lock()
         if self.tracking_data.get(name) is None:
             self.tracking_data[name] = {
@@ -94,6 +146,7 @@ class TrackingWorker(QtCore.QObject):
                 "time": np.full(self.no_of_frames, np.nan, dtype=float),
                 "bbox": np.full((self.no_of_frames, 4), np.nan, dtype=float),
                 "target": np.full((self.no_of_frames, 2), np.nan, dtype=float),
+                "reacquired": np.zeros(self.no_of_frames, dtype=bool),
             }
             logging.debug(f"New tracking data for {name} added.")
 
@@ -102,22 +155,49 @@ class TrackingWorker(QtCore.QObject):
         self.tracking_data[name]["time"][self.frame_no - 1] = self.timestamp
         self.tracking_data[name]["bbox"][self.frame_no - 1] = bbox
         self.tracking_data[name]["target"][self.frame_no - 1] = target
+        if self.products is not None and self.products.shift is not None:
+            self.data_array(name, "shift", np.nan, 2)[
+                self.frame_no - 1
+            ] = self.products.shift
 
         try:
             if tracker := self.tracking_data.get(name) is not None:
                 del tracker
 
             tracker = self.create_tracker(tracker_type)
-            tracker.init(self.frame, bbox)
+            self.init_tracker(tracker, tracker_type, self.products, bbox)
             self.trackers[name] = (tracker, offset, tracker_type)
+            self.templates[name] = crop_patch(self.products.gray, bbox)
+            self.set_predictor(name, predict, target)
             logging.debug(f"Tracker for {name} created.")
 
         except Exception as e:
             self.tracking_data.pop(name, None)
             self.trackers.pop(name, None)
+            self.templates.pop(name, None)
+            self.predictors.pop(name, None)
             self.add_tracker_failed.emit(name, e)
             logging.warning(f"Create tracker failed for {name}.")
         self.mutex.unlock()
+        self.publish_result()
+
+    def set_predictor(self, name, predict, target):
+        if not predict:
+            self.predictors.pop(name, None)
+            return
+
+        predictor = MotionPredictor()
+        predictor.init(target)
+        self.predictors[name] = predictor
+        self.data_array(name, "target_filtered", np.nan, 2)
+        self.data_array(name, "predicted", False)
+
+    def data_array(self, name, key, fill, width=None):
+        data = self.tracking_data[name]
+        if key not in data:
+            n = len(data["frame_no"])
+            data[key] = np.full(n if width is None else (n, width), fill)
+        return data[key]
 
     def edit_tracker(self, name, props):
         self.mutex.lock()
@@ -125,6 +205,10 @@ class TrackingWorker(QtCore.QObject):
         if props["name"] != name:
             self.tracking_data[props["name"]] = self.tracking_data[name]
             self.trackers[props["name"]] = self.trackers[name]
+            self.templates[props["name"]] = self.templates.pop(name, None)
+            if name in self.predictors:
+                self.predictors[props["name"]] = self.predictors.pop(name)
+            self.motion_gates.pop(name, None)
             del self.tracking_data[name]
             del self.trackers[name]
 
@@ -134,12 +218,19 @@ class TrackingWorker(QtCore.QObject):
         if (~np.isnan(bbox)).any():
             try:
                 tracker = self.create_tracker(props["tracker_type"])
-                tracker.init(self.frame, bbox.astype(np.int32))
+                self.init_tracker(
+                    tracker, props["tracker_type"], self.products, bbox.astype(np.int32)
+                )
             except Exception as e:
                 self.add_tracker_failed.emit(name, e)
                 logging.warning(f"Create tracker failed for {name}.")
             else:
                 self.trackers[props["name"]] = (tracker, offset, props["tracker_type"])
+                self.set_predictor(
+                    props["name"],
+                    props.get("predict", False),
+                    self.tracking_data[props["name"]]["target"][self.frame_no - 1],
+                )
 
         if props["name"] != name:
             for angle in self.analysis_data["angle"].values():
@@ -151,6 +242,7 @@ class TrackingWorker(QtCore.QObject):
                     if parent_name == name:
                         distance["trackers"][i] = props["name"]
         self.mutex.unlock()
+        self.publish_result()
 
     def add_angle(self, name, start1, end1, start2, end2):
         self.mutex.lock()
@@ -173,6 +265,7 @@ class TrackingWorker(QtCore.QObject):
         angle_data[name]["angle"] = vec2_angle - vec1_angle
         logging.debug(f"Angle data for {name} updated.")
         self.mutex.unlock()
+        self.publish_result()
 
     def edit_angle(self, name, props):
         self.mutex.lock()
@@ -182,6 +275,7 @@ class TrackingWorker(QtCore.QObject):
             ]
             del self.analysis_data["angle"][name]
         self.mutex.unlock()
+        self.publish_result()
 
     def add_distance(self, name, start, end):
         self.mutex.lock()
@@ -199,6 +293,7 @@ class TrackingWorker(QtCore.QObject):
         )
         logging.debug(f"Distance data for {name} updated.")
         self.mutex.unlock()
+        self.publish_result()
 
     def edit_distance(self, name, props):
         self.mutex.lock()
@@ -208,94 +303,143 @@ class TrackingWorker(QtCore.QObject):
             ][name]
             del self.analysis_data["distance"][name]
         self.mutex.unlock()
+        self.publish_result()
+
+    def set_motion_gate(self, settings):
+        self.mutex.lock()
+        self.motion_gate_settings = settings
+        self.motion_gates = {}
+        self.mutex.unlock()
+        logging.debug(f"Motion gate set to {settings}.")
+
+    def set_tracking_scale(self, scale, refine):
+        self.mutex.lock()
+        changed = scale != self.tracking_scale
+        self.tracking_scale = scale
+        self.refine = refine
+        self.mutex.unlock()
+        logging.debug(f"Tracking scale set to {scale}, refine {refine}.")
+        if changed:
+            self.reset_trackers()
+
+    def tracker_input(self, tracker_type, products):
+        return products.get(
+            tracker_products.get(tracker_type, "frame"), self.tracking_scale
+        )
+
+    def init_tracker(self, tracker, tracker_type, products, bbox):
+        if self.tracking_scale != 1:
+            bbox = np.round(scale_bbox(bbox, self.tracking_scale)).astype(np.int32)
+            bbox[2:] = np.maximum(bbox[2:], 1)
+        tracker.init(self.tracker_input(tracker_type, products), bbox)
+
+    def update_tracker(self, tracker, tracker_type, products):
+        ret, bbox = tracker.update(self.tracker_input(tracker_type, products))
+        if ret and self.tracking_scale != 1:
+            bbox = scale_bbox(bbox, 1 / self.tracking_scale)
+        return ret, bbox
+
+    def refine_tracker(self, name, products, bbox):
+        """Refine bbox against the template, refreshed from good refinements"""
+        template = self.templates[name]
+        bbox, score = refine_bbox(products.gray, template, bbox)
+        if score >= self.template_refresh:
+            self.templates[name] = centred_patch(
+                products.gray, bbox, template.shape[1::-1]
+            )
+        return bbox
 
     def reset_trackers(self):
         self.mutex.lock()
+        for gate in self.motion_gates.values():
+            gate.reset()
         for name, (_, offset, tracker_type) in self.trackers.items():
             bbox = self.tracking_data[name]["bbox"][self.frame_no - 1]
             if (~np.isnan(bbox)).any():
                 try:
                     tracker = self.create_tracker(tracker_type)
-                    tracker.init(self.frame, bbox.astype(np.int32))
+                    self.init_tracker(
+                        tracker, tracker_type, self.products, bbox.astype(np.int32)
+                    )
                 except Exception as e:
                     self.add_tracker_failed.emit(name, e)
                     logging.warning(f"Create tracker failed for {name}.")
                 else:
                     self.trackers[name] = (tracker, offset, tracker_type)
+                    if predictor := self.predictors.get(name):
+                        predictor.init(
+                            self.tracking_data[name]["target"][self.frame_no - 1]
+                        )
         self.mutex.unlock()
 
     def remove_tracker(self, name):
         self.mutex.lock()
         self.tracking_data.pop(name, None)
         self.trackers.pop(name, None)
+        self.templates.pop(name, None)
+        self.predictors.pop(name, None)
+        self.motion_gates.pop(name, None)
         self.mutex.unlock()
+        self.publish_result()
         logging.debug(f"Tracker {name} remove from tracking worker.")
 
     def remove_angle(self, name):
         self.mutex.lock()
         self.analysis_data["angle"].pop(name, None)
         self.mutex.unlock()
+        self.publish_result()
         logging.debug(f"Angle {name} remove from tracking worker.")
 
     def remove_distance(self, name):
         self.mutex.lock()
         self.analysis_data["distance"].pop(name, None)
         self.mutex.unlock()
+        self.publish_result()
         logging.debug(f"Distance {name} remove from tracking worker.")
 
-    def create_tracker(self, tracker_type):
-        if tracker_type == "CSRT":
-            tracker = cv.TrackerCSRT_create()
-        elif tracker_type == "KCF":
-            tracker = cv.TrackerKCF_create()
-        elif tracker_type == "MedianFlow":
-            tracker = cv.legacy.TrackerMedianFlow_create()
-        elif tracker_type == "Boosting":
-            tracker = cv.legacy.TrackerBoosting_create()
-        elif tracker_type == "MOSSE":
-            tracker = cv.legacy.TrackerMOSSE_create()
-        elif tracker_type == "MIL":
-            tracker = cv.legacy.TrackerMIL_create()
-        elif tracker_type == "Static":
-            tracker = StaticTracker()
-        else:
-            raise NotImplementedError
-        return tracker
+    @staticmethod
+    def create_tracker(tracker_type):
+        return create_tracker(tracker_type)
 
     def run(self):
         self.stop_flag = False
         while not self.stop_flag:
             try:
-                (frame_no, timestamp, frame, track) = self.stream_queue.get(
-                    block=True, timeout=1
-                )
-                if track:
-                    succeed = self.run_trackers(frame_no, timestamp, frame)
+                item = self.stream_queue.get(block=True, timeout=1)
+                if isinstance(item, int):
+                    # idle token, every frame queued before it is handled
+                    self.stream_idle.emit(item)
+                    continue
+                frame_no, timestamp, products, track = item
+                if self.retrack_frame is not None:
+                    if frame_no != self.retrack_frame:
+                        continue
+                    self.retrack_frame = None
+                    self.set_current_frame(frame_no, timestamp, products)
+                    self.reset_trackers()
+                    rows = ()
+                elif track:
+                    succeed = self.run_trackers(frame_no, timestamp, products)
+                    rows = (frame_no - 1, frame_no)
                     if not succeed:
                         sleep(0.5)
                         while not self.stream_queue.empty():
-                            (
-                                frame_no,
-                                timestamp,
-                                frame,
-                                track,
-                            ) = self.stream_queue.get()
+                            item = self.stream_queue.get()
+                            if isinstance(item, int):
+                                self.stream_idle.emit(item)
+                                break
+                            frame_no, timestamp, products, track = item
                             if track:
                                 sleep(0.5)
                             else:
-                                self.frame_no, self.timestamp, self.frame = (
-                                    frame_no,
-                                    timestamp,
-                                    frame,
-                                )
+                                self.set_current_frame(frame_no, timestamp, products)
                                 break
                 else:
-                    self.frame_no, self.timestamp, self.frame = (
-                        frame_no,
-                        timestamp,
-                        frame,
-                    )
+                    self.set_current_frame(frame_no, timestamp, products)
+                    rows = ()
+                self.publish_result(rows)
                 if frame_no >= self.no_of_frames != 0:
+                    self.log_tracker_statistics()
                     self.reached_end.emit()
 
             except Empty:
@@ -305,34 +449,347 @@ class TrackingWorker(QtCore.QObject):
         self.stop_flag = False
         self.deleteLater()
 
-    def run_trackers(self, frame_no, timestamp, frame):
+    def set_current_frame(self, frame_no, timestamp, products):
+        self.mutex.lock()
+        self.frame_no, self.timestamp = frame_no, timestamp
+        self.frame, self.products = products.frame, products
+        self.mutex.unlock()
+
+    def publish_result(self, rows=None):
+        """
+        Mark the state as changed, the GUI is notified once until it takes it
+
+        :param rows: (start, stop) of the data rows written, () for none and
+            None for all of them, or if items changed
+        """
+        self.mutex.lock()
+        self.mark_dirty(rows)
+        self.result_pending = True
+        notify = not self.result_notified
+        self.result_notified = True
+        self.mutex.unlock()
+        if notify:
+            self.result_ready.emit()
+
+    def mark_dirty(self, rows=None):
+        """Add rows to those the GUI has to copy again, call with the mutex held"""
+        if rows is None:
+            self.dirty = None
+        elif rows and self.dirty == ():
+            self.dirty = rows
+        elif rows and self.dirty is not None:
+            self.dirty = (min(self.dirty[0], rows[0]), max(self.dirty[1], rows[1]))
+
+    def take_result(self, full=False):
+        """
+        Copy of the latest state if it changed since the last call, else None
+
+        Only the rows written since the last call are copied unless full is
+        set, see FrameResult.merge. Copied under the mutex at the drawing rate
+        of the GUI, rows are never written while they are read.
+        """
+        self.mutex.lock()
+        result = None
+        if self.result_pending or full:
+            result = FrameResult(
+                self.frame_no,
+                self.timestamp,
+                self.frame,
+                self.tracking_data,
+                self.analysis_data,
+                None if full else self.dirty,
+            )
+            self.dirty = ()
+        self.result_pending = False
+        self.result_notified = False
+        self.mutex.unlock()
+        return result
+
+    def set_direction(self, frame_no):
+        direction = -1 if frame_no < self.frame_no else 1
+        if direction == self.direction:
+            return
+        self.direction = direction
+        for gate in self.motion_gates.values():
+            gate.reset()
+        for name, predictor in self.predictors.items():
+            target = self.tracking_data[name]["target"][self.frame_no - 1]
+            if not np.isnan(target).any():
+                predictor.init(target)
+        logging.debug(f"Tracking direction set to {direction}.")
+
+    def set_stride(self, max_stride, adaptive, max_displacement):
+        self.max_stride = max_stride
+        self.adaptive_stride = adaptive
+        self.max_displacement = max_displacement
+        self.update_stride(max_stride)
+
+    def update_stride(self, stride):
+        if stride != self.stride:
+            self.stride = stride
+            self.stride_changed.emit(stride)
+            logging.debug(f"Tracking stride set to {stride}.")
+
+    def run_trackers(self, frame_no, timestamp, products):
         succeed = True
+        confident = True
+        step = frame_no - self.frame_no
+        self.set_direction(frame_no)
+        prev_idx = self.frame_no - 1
         for name, (tracker, offset, tracker_type) in self.trackers.items():
-            ret, bbox = tracker.update(frame)
+            predictor = self.predictors.get(name)
+            prediction = (
+                predictor.predict(max(abs(step), 1)) if predictor is not None else None
+            )
+            predicted = reacquired = False
+
+            gate = self.get_motion_gate(name)
+            bboxes = self.tracking_data[name]["bbox"]
+            prev_bbox = bboxes[prev_idx] if 0 <= prev_idx < len(bboxes) else None
+            if (
+                gate is not None
+                and prev_bbox is not None
+                and not np.isnan(prev_bbox).any()
+                and gate.check(products.gray, prev_bbox)
+            ):
+                ret, bbox = True, tuple(prev_bbox)
+            else:
+                ret, bbox = self.update_tracker(tracker, tracker_type, products)
+                if ret and self.refine and name in self.templates:
+                    bbox = self.refine_tracker(name, products, bbox)
+                if gate is not None:
+                    if ret:
+                        gate.set_reference(products.gray, bbox)
+                    else:
+                        gate.reset()
+
+            if not ret:
+                confident = False
+                ret, bbox = self.reacquire_tracker(name, frame_no, products, prediction)
+                reacquired = ret
+            if not ret and prediction is not None and predictor.fill_dropout():
+                bbox = self.bbox_from_prediction(name, frame_no, prediction, offset)
+                ret = predicted = bbox is not None
+            if isinstance(tracker, CascadeTracker) and tracker.fell_back:
+                confident = False
 
             if ret:
-                bbox = bbox
                 target = bbox_to_target(*bbox, *offset)
 
                 self.mutex.lock()
                 self.tracking_data[name]["time"][frame_no - 1] = timestamp
                 self.tracking_data[name]["bbox"][frame_no - 1] = bbox
                 self.tracking_data[name]["target"][frame_no - 1] = target
+                if products.shift is not None:
+                    self.data_array(name, "shift", np.nan, 2)[
+                        frame_no - 1
+                    ] = products.shift
+                if "interpolated" in self.tracking_data[name]:
+                    self.tracking_data[name]["interpolated"][frame_no - 1] = False
+                if not reacquired:
+                    # a retracked frame is no longer a re-acquisition
+                    self.data_array(name, "reacquired", False)[frame_no - 1] = False
+                if products.capture_time is not None:
+                    # capture to result latency of live sources in ms
+                    self.data_array(name, "latency", np.nan)[frame_no - 1] = 1000 * (
+                        perf_counter() - products.capture_time
+                    )
+                if predictor is not None:
+                    filtered = prediction if predicted else predictor.correct(target)
+                    self.data_array(name, "target_filtered", np.nan, 2)[
+                        frame_no - 1
+                    ] = filtered
+                    self.data_array(name, "predicted", False)[frame_no - 1] = predicted
+                if isinstance(tracker, CascadeTracker):
+                    self.data_array(name, "fallback", False)[
+                        frame_no - 1
+                    ] = tracker.fell_back
                 self.mutex.unlock()
+                if predicted:
+                    logging.info(
+                        f"Tracker {name} filled by prediction at frame {frame_no}."
+                    )
             else:
                 self.tracking_failed.emit(name, frame_no)
                 succeed = False
                 break
         else:
+            self.mutex.lock()
             self.update_angle(frame_no)
             self.update_distance(frame_no)
+            self.mutex.unlock()
+            smooth = True
+            if step > 0 and self.adaptive_stride:
+                smooth = self.adapt_stride(frame_no - step, frame_no, confident)
+            if 1 < step <= self.max_stride:
+                if smooth:
+                    self.interpolate_gap(frame_no - step, frame_no)
+                else:
+                    self.retrack_gap(frame_no - step)
+
+        self.set_current_frame(frame_no, timestamp, products)
+        return succeed
 
+    def interpolate_gap(self, first, last):
+        """Linearly fill the frames skipped between two tracked frames"""
+        frames = np.arange(first + 1, last)
+        weights = ((frames - first) / (last - first)).reshape(-1, 1)
+        gap = slice(first, last - 1)
         self.mutex.lock()
-        self.frame_no = frame_no
-        self.frame = frame
-        self.timestamp = timestamp
+        for name in self.trackers:
+            data = self.tracking_data[name]
+            for key in ("time", "bbox", "target", "shift"):
+                if key not in data:
+                    continue
+                start, end = data[key][first - 1], data[key][last - 1]
+                w = weights if np.ndim(start) else weights[:, 0]
+                data[key][gap] = start + (end - start) * w
+            self.data_array(name, "interpolated", False)[gap] = True
+            self.data_array(name, "reacquired", False)[gap] = False
+        for frame_no in frames:
+            self.update_angle(frame_no)
+            self.update_distance(frame_no)
+        self.mark_dirty((first, last - 1))
         self.mutex.unlock()
-        return succeed
+
+    def retrack_gap(self, first):
+        """Send the stream back to first to track the skipped frames one by one"""
+        self.retrack_frame = first
+        self.retrack_requested.emit(first)
+        logging.info(f"Motion too fast for the stride, tracking again from {first}.")
+
+    def adapt_stride(self, first, last, confident):
+        """
+        Set the stride from the motion between two tracked frames
+
+        :return: False if the motion was too fast to skip the frames between
+        """
+        if not confident:
+            self.update_stride(1)
+            return False
+        displacement = max(
+            (
+                np.linalg.norm(
+                    self.tracking_data[name]["target"][last - 1]
+                    - self.tracking_data[name]["target"][first - 1]
+                )
+                for name in self.trackers
+            ),
+            default=0.0,
+        )
+        self.update_stride(
+            adapt_stride(
+                self.stride, displacement, self.max_stride, self.max_displacement
+            )
+        )
+        return displacement <= self.max_displacement
+
+    def tracker_statistics(self):
+        stats = {}
+        for name, (tracker, _, _) in self.trackers.items():
+            if isinstance(tracker, CascadeTracker):
+                stats[name] = {
+                    "frames": tracker.frames,
+                    "fallbacks": tracker.fallbacks,
+                }
+            if gate := self.motion_gates.get(name):
+                stats.setdefault(name, {})["gate_skipped"] = gate.total_skipped
+            latency = self.tracking_data[name].get("latency")
+            if latency is not None and not np.isnan(latency).all():
+                stats.setdefault(name, {})["latency"] = (
+                    np.nanmedian(latency),
+                    np.nanmax(latency),
+                )
+        return stats
+
+    def log_tracker_statistics(self):
+        for name, stats in self.tracker_statistics().items():
+            if stats.get("frames"):
+                logging.info(
+                    f"Tracker {name} fell back on {stats['fallbacks']} of "
+                    f"{stats['frames']} frames "
+                    f"({100 * stats['fallbacks'] / stats['frames']:.1f} %)."
+                )
+            if "gate_skipped" in stats:
+                logging.info(
+                    f"Tracker {name} skipped {stats['gate_skipped']} updates "
+                    f"by motion gate."
+                )
+            if "latency" in stats:
+                logging.info(
+                    f"Tracker {name} latency median {stats['latency'][0]:.1f} ms, "
+                    f"max {stats['latency'][1]:.1f} ms."
+                )
+
+    def get_motion_gate(self, name):
+        if self.motion_gate_settings is None:
+            return None
+        if name not in self.motion_gates:
+            self.motion_gates[name] = MotionGate(**self.motion_gate_settings)
+        return self.motion_gates[name]
+
+    def reacquire_tracker(self, name, frame_no, products, prediction=None):
+        template = self.templates.get(name)
+        if prediction is not None:
+            _, offset, _ = self.trackers[name]
+            search_bbox = self.bbox_from_prediction(name, frame_no, prediction, offset)
+        else:
+            search_bbox = self.last_known_bbox(name, frame_no)
+        if template is None or search_bbox is None:
+            return False, None
+
+        bbox, score = search_template(
+            products.gray,
+            template,
+            search_bbox,
+            self.reacquire_scales,
+            self.reacquire_threshold,
+        )
+        if bbox is None:
+            logging.info(
+                f"Re-acquisition failed for {name} at frame {frame_no} "
+                f"(best score {score:.2f})."
+            )
+            return False, None
+
+        _, offset, tracker_type = self.trackers[name]
+        try:
+            tracker = self.create_tracker(tracker_type)
+            self.init_tracker(tracker, tracker_type, products, bbox)
+        except Exception as e:
+            logging.warning(f"Re-initialising tracker failed for {name}. {e}")
+            return False, None
+
+        self.trackers[name] = (tracker, offset, tracker_type)
+        self.mutex.lock()
+        self.data_array(name, "reacquired", False)[frame_no - 1] = True
+        self.mutex.unlock()
+        logging.info(
+            f"Tracker {name} re-acquired at frame {frame_no} (score {score:.2f})."
+        )
+        return True, bbox
+
+    def bbox_from_prediction(self, name, frame_no, prediction, offset):
+        last_bbox = self.last_known_bbox(name, frame_no)
+        if last_bbox is None:
+            return None
+        _, _, w, h = last_bbox
+        return (
+            prediction[0] - offset[0] - w / 2,
+            prediction[1] - offset[1] - h / 2,
+            w,
+            h,
+        )
+
+    def last_known_bbox(self, name, frame_no):
+        if self.direction < 0:
+            bboxes = self.tracking_data[name]["bbox"][frame_no:][::-1]
+        else:
+            bboxes = self.tracking_data[name]["bbox"][: frame_no - 1]
+        (valid,) = np.nonzero(~np.isnan(bboxes).any(axis=1))
+        if len(valid) == 0:
+            return None
+        return bboxes[valid[-1]]
 
     def update_angle(self, frame_no):
         angle_data = self.analysis_data["angle"]
@@ -363,11 +820,39 @@ class TrackingWorker(QtCore.QObject):
                 - self.tracking_data[start]["target"][frame_no - 1]
             )
 
+    def set_range_data(self, start, bboxes, times, shifts=None):
+        self.mutex.lock()
+        for name, bbox in bboxes.items():
+            if name not in self.trackers:
+                continue
+            _, offset, _ = self.trackers[name]
+            data = self.tracking_data[name]
+            n = min(len(bbox), len(data["bbox"]) - start + 1)
+            frames = slice(start - 1, start - 1 + n)
+            valid = ~np.isnan(bbox[:n]).any(axis=1)
+            data["time"][frames][valid] = times[:n][valid]
+            data["bbox"][frames][valid] = bbox[:n][valid]
+            data["target"][frames][valid] = (
+                bbox[:n, :2][valid] + bbox[:n, 2:][valid] / 2 + offset
+            )
+            if shifts is not None and not np.isnan(shifts).all():
+                shift = self.data_array(name, "shift", np.nan, 2)
+                shift[frames][valid] = shifts[:n][valid]
+            self.data_array(name, "reacquired", False)[frames][valid] = False
+        for frame_no in range(start, min(start + len(times), self.no_of_frames + 1)):
+            self.update_angle(frame_no)
+            self.update_distance(frame_no)
+        self.mutex.unlock()
+        self.publish_result((start - 1, start - 1 + len(times)))
+
     def set_stop(self):
         self.stop_flag = True
 
     def set_tracking_data(self, data):
+        self.mutex.lock()
         self.tracking_data.update(data)
+        self.mutex.unlock()
+        self.publish_result()
 
 
 def bbox_to_target(x, y, wx, wy, offset_x, offset_y):
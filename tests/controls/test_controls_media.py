@@ -28,15 +28,20 @@ def test_controls_edit(qtbot):
         else:
             assert not widget.track_button.isChecked()
 
+    def reverse_toggled(output):
+        assert output == widget.reverse_button.isChecked()
+
     widget.play.connect(play)
     widget.previous_frame.connect(previous_frame)
     widget.next_frame.connect(next_frame)
     widget.seek_bar_moved.connect(seek_bar_moved)
     widget.track_enabled.connect(track_enabled)
+    widget.reverse_toggled.connect(reverse_toggled)
 
     for _ in range(3):
         widget.play_button.click()
         widget.track_button.click()
+        widget.reverse_button.click()
 
     widget.previous_button.click()
     widget.next_button.click()
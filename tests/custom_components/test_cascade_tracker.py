@@ -0,0 +1,69 @@
+import numpy as np
+
+from motion_analysis_2d.custom_components import CascadeTracker
+
+
+class HoldTracker:
+    """Reports the bbox it was initialised with, like a lost fast tracker"""
+
+    def init(self, frame, bbox):
+        self.bbox = tuple(bbox)
+
+    def update(self, frame):
+        return True, self.bbox
+
+
+class FixedTracker:
+    def __init__(self, bbox):
+        self.bbox = bbox
+
+    def init(self, frame, bbox):
+        pass
+
+    def update(self, frame):
+        return True, self.bbox
+
+
+def make_texture(seed, shape=(100, 100)):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 255, shape, dtype=np.uint8)
+
+
+def test_cascade_stays_fast_when_confident():
+    cascade = CascadeTracker(HoldTracker, lambda: FixedTracker((0, 0, 20, 20)))
+    frame = make_texture(0)
+    cascade.init(frame, (20, 20, 20, 20))
+
+    assert cascade.update(frame) == (True, (20, 20, 20, 20))
+    assert not cascade.fell_back
+    assert (cascade.frames, cascade.fallbacks) == (1, 0)
+
+
+def test_cascade_falls_back_and_recovers():
+    cascade = CascadeTracker(HoldTracker, lambda: FixedTracker((30, 20, 20, 20)))
+    frame = make_texture(0)
+    cascade.init(frame, (20, 20, 20, 20))
+
+    # the content moved, the fast tracker did not follow
+    moved = np.roll(frame, 10, axis=1)
+    assert cascade.update(moved) == (True, (30, 20, 20, 20))
+    assert cascade.fell_back
+
+    # the fast tracker restarts where the fallback found the target
+    assert cascade.update(moved) == (True, (30, 20, 20, 20))
+    assert not cascade.fell_back
+    assert (cascade.frames, cascade.fallbacks) == (2, 1)
+
+
+def test_cascade_refreshes_template_after_fallback():
+    cascade = CascadeTracker(HoldTracker, lambda: FixedTracker((20, 20, 20, 20)))
+    cascade.init(make_texture(0), (20, 20, 20, 20))
+
+    # a lasting change in appearance only falls back once
+    changed = make_texture(1)
+    cascade.update(changed)
+    assert cascade.fell_back
+    for _ in range(3):
+        cascade.update(changed)
+        assert not cascade.fell_back
+    assert (cascade.frames, cascade.fallbacks) == (4, 1)
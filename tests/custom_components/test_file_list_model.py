@@ -0,0 +1,30 @@
+from pathlib import Path
+
+from motion_analysis_2d.custom_components import FileListModel
+
+
+def test_file_list_names(qtbot, tmp_path):
+    paths = [tmp_path / "day1" / "trial.mp4", tmp_path / "day2" / "trial.mp4"]
+    other = tmp_path / "day1" / "other.mp4"
+    model = FileListModel()
+
+    model.add_paths([paths[0], other])
+    assert model.rowCount() == 2
+    assert model.keys[paths[0]] == "trial.mp4"
+    assert model.data(model.index(0)) == "other.mp4"
+
+    # only the files with the same name get their folder
+    model.add_paths([paths[1]])
+    assert model.keys[paths[0]] == "day1/trial.mp4"
+    assert model.keys[paths[1]] == "day2/trial.mp4"
+    assert model.keys[other] == "other.mp4"
+
+    # adding a listed file again moves it to the top
+    model.add_paths([paths[0]])
+    assert model.paths == [paths[0], paths[1], other]
+    assert model.index_of(other).row() == 2
+
+    model.remove_paths([paths[1]])
+    assert model.keys[paths[0]] == "trial.mp4"
+    assert model.data(model.index(1), FileListModel.PathRole) == other
+    assert not model.index_of(Path("missing.mp4")).isValid()
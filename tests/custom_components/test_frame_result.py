@@ -0,0 +1,54 @@
+import numpy as np
+
+from motion_analysis_2d.custom_components import FrameResult
+
+
+def test_frame_result_copy():
+    tracking_data = {
+        "a": {
+            "frame_no": np.arange(3) + 1,
+            "bbox": np.zeros((3, 4)),
+            "target": np.zeros((3, 2)),
+            "time": np.zeros(3),
+        }
+    }
+    analysis_data = {
+        "angle": {"b": {"frame_no": np.arange(3) + 1, "angle": np.zeros(3)}},
+        "distance": {},
+    }
+    analysis_data["angle"]["b"]["trackers"] = ["a", "a", "a", "a"]
+    result = FrameResult(2, 40.0, None, tracking_data, analysis_data)
+
+    tracking_data["c"] = tracking_data["a"]
+    assert list(result.tracking_data) == ["a"]
+    assert "time" not in result.tracking_data["a"]
+    assert list(result.analysis_data["angle"]["b"]) == ["frame_no", "angle"]
+
+    # rows written after the snapshot do not reach it
+    tracking_data["a"]["target"][1] = 5
+    analysis_data["angle"]["b"]["angle"][1] = 5
+    assert (result.tracking_data["a"]["target"][1] == 0).all()
+    assert result.analysis_data["angle"]["b"]["angle"][1] == 0
+
+
+def test_frame_result_merge():
+    tracking_data = {
+        "a": {
+            "frame_no": np.arange(5) + 1,
+            "bbox": np.zeros((5, 4)),
+            "target": np.zeros((5, 2)),
+        }
+    }
+    analysis_data = {"angle": {}, "distance": {}}
+    previous = FrameResult(1, 0.0, None, tracking_data, analysis_data)
+
+    tracking_data["a"]["target"][1:3] = 5
+    tracking_data["a"]["target"][4] = 7
+    result = FrameResult(3, 80.0, None, tracking_data, analysis_data, (1, 3))
+    assert len(result.tracking_data["a"]["target"]) == 2
+
+    # rows outside the partial copy keep their previous values
+    result.merge(previous)
+    assert result.rows is None
+    assert result.tracking_data["a"]["target"] is previous.tracking_data["a"]["target"]
+    assert (result.tracking_data["a"]["target"][:, 0] == [0, 5, 5, 0, 0]).all()
@@ -0,0 +1,11 @@
+from motion_analysis_2d.custom_components import FrameStackCapture
+
+
+def test_capture_without_sidecar_is_not_opened(tmp_path):
+    path = tmp_path / "clip.raw"
+    path.write_bytes(bytes(20))
+
+    cap = FrameStackCapture(path)
+
+    assert not cap.isOpened()
+    assert cap.read() == (False, None)
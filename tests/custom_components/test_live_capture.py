@@ -0,0 +1,43 @@
+from time import sleep
+
+import cv2 as cv
+import numpy as np
+
+from motion_analysis_2d.custom_components.live_capture import open_live_capture
+
+
+def make_video(path, no_of_frames=40, frame_rate=100):
+    writer = cv.VideoWriter(
+        str(path), cv.VideoWriter_fourcc(*"MJPG"), frame_rate, (32, 24)
+    )
+    for i in range(no_of_frames):
+        writer.write(np.full((24, 32, 3), i * 5, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+def test_simulated_live_capture(tmp_path):
+    path = make_video(tmp_path / "clip.avi")
+    cap = open_live_capture(str(path), simulate=True)
+
+    ret, _ = cap.read()
+    assert ret
+    first = cap.get(cv.CAP_PROP_POS_FRAMES)
+
+    # a slow consumer only gets the newest frame, older ones are dropped
+    sleep(0.1)
+    ret, _ = cap.read()
+    assert ret
+    assert cap.get(cv.CAP_PROP_POS_FRAMES) - first > 1
+    assert cap.dropped > 0
+
+    # frames arrive at the native frame rate of the file
+    frame_no = cap.get(cv.CAP_PROP_POS_FRAMES)
+    assert np.isclose(cap.get(cv.CAP_PROP_POS_MSEC), (frame_no - 1) * 10, atol=15)
+    assert not cap.set(cv.CAP_PROP_POS_FRAMES, 0)
+
+    while cap.read()[0]:
+        pass
+    assert cap.grabbed == 40
+    assert cap.get(cv.CAP_PROP_FRAME_COUNT) == 40
+    cap.release()
@@ -0,0 +1,50 @@
+import numpy as np
+
+from motion_analysis_2d.custom_components import MotionGate
+
+
+def make_frame(seed=0, shape=(80, 80)):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 255, shape, dtype=np.uint8)
+
+
+def test_motion_gate_skips_still_region():
+    gate = MotionGate(threshold=2.0, downsample=1)
+    frame = make_frame()
+    bbox = (20, 20, 16, 16)
+    assert not gate.check(frame, bbox)  # no reference yet
+
+    gate.set_reference(frame, bbox)
+    noisy = np.clip(frame.astype(int) + 1, 0, 255).astype(np.uint8)
+    assert gate.check(noisy, bbox)
+    assert (gate.skipped, gate.total_skipped) == (1, 1)
+
+
+def test_motion_gate_passes_motion():
+    gate = MotionGate(threshold=2.0, downsample=1)
+    frame = make_frame()
+    bbox = (20, 20, 16, 16)
+    gate.set_reference(frame, bbox)
+
+    assert not gate.check(np.roll(frame, 3, axis=1), bbox)
+    assert gate.skipped == 0
+
+
+def test_motion_gate_forces_refresh():
+    gate = MotionGate(max_skip=3)
+    frame = make_frame()
+    bbox = (20, 20, 16, 16)
+    gate.set_reference(frame, bbox)
+
+    assert [gate.check(frame, bbox) for _ in range(4)] == [True, True, True, False]
+    # a real update sets the reference and skipping starts again
+    gate.set_reference(frame, bbox)
+    assert gate.check(frame, bbox)
+
+
+def test_motion_gate_reset():
+    gate = MotionGate()
+    frame = make_frame()
+    gate.set_reference(frame, (20, 20, 16, 16))
+    gate.reset()
+    assert not gate.check(frame, (20, 20, 16, 16))
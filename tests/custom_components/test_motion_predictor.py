@@ -0,0 +1,15 @@
+import pytest
+
+from motion_analysis_2d.custom_components import MotionPredictor
+
+
+def test_predict_scales_with_step():
+    predictor = MotionPredictor()
+    predictor.init((0, 0))
+    for frame in range(1, 21):
+        predictor.predict()
+        predictor.correct((2.0 * frame, 0.0))
+
+    x, y = predictor.predict(4)
+    assert x == pytest.approx(48, abs=0.1)
+    assert y == pytest.approx(0, abs=0.1)
@@ -0,0 +1,29 @@
+import numpy as np
+
+from motion_analysis_2d.custom_components import Stabilizer
+
+
+def make_scene(shape=(240, 320), seed=0):
+    rng = np.random.default_rng(seed)
+    scene = rng.random((shape[0] // 8, shape[1] // 8))
+    return np.uint8(255 * np.kron(scene, np.ones((8, 8))))
+
+
+def test_stabilizer_origin():
+    scene = make_scene()
+    stabilizer = Stabilizer(downsample=1)
+    stabilizer.set_origin(scene)
+
+    shifted = np.roll(scene, (4, 8), axis=(0, 1))
+    stabilizer.stabilize(shifted, 50)
+    assert np.allclose(stabilizer.shift, (8, 4), atol=0.5)
+
+    # frame 1 stays the origin
+    stabilizer.stabilize(scene, 1)
+    assert stabilizer.shift == (0.0, 0.0)
+
+    # keyframes of a copy do not change the original
+    copied = stabilizer.copy()
+    copied.add_keyframe(80, stabilizer.prepare(shifted), (8.0, 4.0))
+    assert 80 in copied.keyframes
+    assert 80 not in stabilizer.keyframes
@@ -0,0 +1,71 @@
+import numpy as np
+
+from motion_analysis_2d.custom_components import TrajectoryItem
+
+
+def test_trajectory_ring_buffer(qtbot):
+    item = TrajectoryItem(length=4)
+    item.add_slot((255, 0, 0))
+    target_all = np.arange(20, dtype=float).reshape(10, 2)
+
+    item.update_slot(0, 3, target_all)
+    assert item.heads[0] == 3
+    assert np.allclose(item.buffer[0, :3], target_all[:3])
+
+    # stepping forwards wraps around in the buffer
+    item.update_slot(0, 6, target_all)
+    assert item.heads[0] == 2
+    assert np.allclose(item.buffer[0, [2, 3, 0, 1]], target_all[2:6])
+
+    # rewritten targets replace the buffered ones
+    item.update_slot(0, 9, target_all[::-1].copy())
+    assert item.heads[0] == 1
+    assert np.allclose(item.buffer[0, [1, 2, 3, 0]], target_all[::-1][5:9])
+
+    # chunks of length / bands frames, one per segment here
+    item.rebuild()
+    assert len(item.paths) == 3
+
+    # a jump backwards refills the buffer
+    item.update_slot(0, 2, target_all)
+    assert item.heads[0] == 2
+    assert np.allclose(item.buffer[0, :2], target_all[:2])
+
+
+def test_trajectory_chunk_size(qtbot):
+    assert TrajectoryItem(length=30).chunk_size == 7
+    assert TrajectoryItem(length=5000).chunk_size == 64
+
+
+def test_trajectory_chunk_cache(qtbot):
+    item = TrajectoryItem(length=100, max_chunk=16)
+    item.add_slot((255, 0, 0))
+    target_all = np.stack([np.arange(300.0), np.zeros(300)], axis=1)
+
+    # the trail holds targets 50 to 149, chunks 4 to 8 are whole
+    item.update_slot(0, 150, target_all)
+    item.rebuild()
+    assert sorted(item.chunks[0]) == [4, 5, 6, 7, 8]
+    assert len(item.paths) == 7
+    cached = item.chunks[0][5]
+
+    # stepping forwards keeps whole chunks and drops those that left the trail
+    for frame_i in range(151, 171):
+        item.update_slot(0, frame_i, target_all)
+        item.rebuild()
+    assert sorted(item.chunks[0]) == [5, 6, 7, 8, 9]
+    assert item.chunks[0][5] is cached
+
+    # only the chunk through rewritten targets is built again
+    rewritten = item.chunks[0][6]
+    target_all[100:110, 1] = 5
+    item.update_slot(0, 170, target_all)
+    item.rebuild()
+    assert item.chunks[0][6] is not rewritten
+    assert item.chunks[0][5] is cached
+    assert np.allclose(item.buffer[0, (item.heads[0] - 70) % 100], (100, 5))
+
+    # a jump refills the buffer and its chunks
+    item.update_slot(0, 10, target_all)
+    item.rebuild()
+    assert item.chunks[0] == {}
@@ -10,3 +10,92 @@ def test_add_tracker(qtbot):
     widget.update_frame(black_img, 0, 0)
 
     assert (widget.im_item.image == black_img).all()
+
+
+def tracker_props(name, x):
+    return {
+        "name": name,
+        "bbox_pos": (x, 10),
+        "bbox_size": (10, 10),
+        "offset": (0, 0),
+        "color": (255, 0, 0),
+        "tracker_type": "CSRT",
+    }
+
+
+def test_tracker_registry(qtbot):
+    widget = FrameWidget()
+    widget.update_frame(np.zeros([100, 100, 3], dtype=np.uint8), 0, 0)
+    for name, x in [("a", 10), ("b", 30), ("c", 50)]:
+        widget.add_item("tracker", tracker_props(name, x))
+
+    widget.remove_item("tracker", "b")
+    assert widget.trackers.index_of("c") == 1
+    assert np.allclose(widget.trackers.positions, [[15, 15], [55, 15]])
+
+    bbox = np.full((2, 4), np.nan)
+    target = np.full((2, 2), np.nan)
+    bbox[1] = (60, 60, 10, 10)
+    target[1] = (65, 65)
+    widget.set_all_item_data("tracker", 1, {"a": (bbox, target)})
+    assert np.allclose(widget.trackers.positions[0], (65, 65))
+
+
+def test_fast_overlay(qtbot):
+    widget = FrameWidget()
+    widget.update_frame(np.zeros([100, 100, 3], dtype=np.uint8), 0, 0)
+    widget.add_item("tracker", tracker_props("a", 10))
+    roi = widget.trackers["roi"][0]
+    bbox = np.array([[10, 10, 10, 10], [20, 20, 10, 10]], dtype=float)
+    target = np.array([[15, 15], [25, 25]], dtype=float)
+
+    widget.set_fast_overlay(True)
+    widget.set_all_item_data("tracker", 1, {"a": (bbox, target)})
+    assert roi.scene() is None
+    assert widget.trackers.overlay.scene() is not None
+    assert len(widget.trackers.overlay.markers) == 1
+    assert widget.trackers.trajectories.scene() is not None
+
+    widget.set_fast_overlay(False)
+    assert roi.scene() is not None
+    assert widget.trackers.overlay.scene() is None
+    assert np.allclose(roi.pos(), (20, 20))
+
+
+def test_angle_updated_once(qtbot):
+    widget = FrameWidget()
+    widget.update_frame(np.zeros([100, 100, 3], dtype=np.uint8), 0, 0)
+    for name, x in [("a", 10), ("b", 30), ("c", 50), ("d", 70)]:
+        widget.add_item("tracker", tracker_props(name, x))
+    widget.add_item(
+        "angle",
+        {
+            "name": "angle",
+            "start1": "a",
+            "end1": "b",
+            "start2": "c",
+            "end2": "d",
+            "color": (255, 0, 0),
+        },
+    )
+
+    updates = []
+    update_items = widget.angles.update_items
+    widget.angles.update_items = lambda names, **kwargs: (
+        updates.append(names),
+        update_items(names, **kwargs),
+    )
+
+    bbox = np.full((2, 4), np.nan)
+    target = np.full((2, 2), np.nan)
+    data = {}
+    for name, pos in [("a", (0, 0)), ("b", (10, 0)), ("c", (0, 0)), ("d", (0, 10))]:
+        bbox[1] = (*pos, 10, 10)
+        target[1] = pos
+        data[name] = (bbox.copy(), target.copy())
+    widget.set_all_item_data("tracker", 1, data)
+
+    assert updates == [["angle"]]
+    pie = widget.angles["pie"][0]
+    assert pie.start_angle == 0
+    assert pie.span_angle == -90 * 16
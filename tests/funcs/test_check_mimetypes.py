@@ -6,6 +6,8 @@ guess_file_type_testdata = [
     ("a.jpg", "image/jpeg"),
     ("a.mp4", "video/mp4"),
     ("a.json", "application/json"),
+    ("a.npy", "video/x-npy"),
+    ("a.raw", "video/x-raw-frames"),
 ]
 
 check_file_type_testdata = [
@@ -13,6 +15,8 @@ check_file_type_testdata = [
     ("a.mp4", ["video"], True),
     ("a.mp4", ["application"], False),
     ("a.json", ["application"], True),
+    ("a.npy", ["video"], True),
+    ("a.raw", ["video"], True),
 ]
 
 
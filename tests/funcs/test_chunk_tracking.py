@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from motion_analysis_2d.funcs.chunk_tracking import (
+    latest_keyframe,
+    split_segments,
+    stitch_segments,
+)
+
+split_segments_testdata = [
+    (1, 100, 1, 10, [(1, 100)]),
+    (1, 100, 3, 5, [(1, 39), (34, 72), (67, 100)]),
+    (1, 3, 8, 1, [(1, 3), (2, 3)]),
+]
+
+
+@pytest.mark.parametrize("start, end, n, overlap, expected", split_segments_testdata)
+def test_split_segments(start, end, n, overlap, expected):
+    assert split_segments(start, end, n, overlap) == expected
+
+
+def make_track(first, last, shift=0.0):
+    frames = np.arange(first, last + 1, dtype=float)
+    return np.stack(
+        [
+            frames + shift,
+            np.zeros_like(frames),
+            np.full_like(frames, 4),
+            np.full_like(frames, 4),
+        ],
+        axis=1,
+    )
+
+
+def test_stitch_segments_consistent():
+    segments = split_segments(1, 30, 3, 4)
+    results = [{"a": make_track(s, e)} for s, e in segments]
+
+    bboxes, inconsistent = stitch_segments(segments, results, tolerance=1)
+    assert inconsistent == []
+    assert np.allclose(bboxes["a"], make_track(1, 30))
+
+
+def test_stitch_segments_inconsistent():
+    segments = split_segments(1, 30, 3, 4)
+    results = [{"a": make_track(s, e)} for s, e in segments]
+    results[1]["a"] = make_track(*segments[1], shift=20)
+
+    bboxes, inconsistent = stitch_segments(segments, results, tolerance=1)
+    assert inconsistent == [("a", segments[1][0]), ("a", segments[2][0])]
+    expected = make_track(1, 30)
+    expected[segments[1][0] - 1 : segments[2][0] - 1, 0] += 20
+    assert np.allclose(bboxes["a"], expected)
+
+
+def test_latest_keyframe():
+    bboxes = {"a": make_track(1, 30), "b": make_track(1, 30)}
+    bboxes["a"][19:] = np.nan
+    bboxes["b"][9:] = np.nan
+    assert latest_keyframe(bboxes, ["a"], 25, 1) == 19
+    assert latest_keyframe(bboxes, ["a", "b"], 25, 1) == 9
+    assert latest_keyframe(bboxes, [], 25, 1) == 25
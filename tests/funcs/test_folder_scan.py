@@ -0,0 +1,38 @@
+from motion_analysis_2d.funcs.folder_scan import scan_folder
+
+
+def make_tree(root):
+    for name in [
+        "trial_10.mp4",
+        "trial_2.mp4",
+        "notes.txt",
+        "calib.mp4",
+        "day2/trial_1.mp4",
+        "seq/frame_1.png",
+        "seq/frame_2.png",
+    ]:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"")
+
+
+def test_scan_folder(tmp_path):
+    make_tree(tmp_path)
+
+    names = [p.name for p in scan_folder(tmp_path, ["video"])]
+    assert names == ["calib.mp4", "seq", "trial_2.mp4", "trial_10.mp4"]
+
+    names = [
+        p.name
+        for p in scan_folder(tmp_path, ["video"], recursive=True, exclude=["calib*"])
+    ]
+    assert names == ["trial_1.mp4", "seq", "trial_2.mp4", "trial_10.mp4"]
+
+    paths = list(scan_folder(tmp_path, recursive=True, include=["trial_*"]))
+    assert [p.relative_to(tmp_path).as_posix() for p in paths] == [
+        "day2/trial_1.mp4",
+        "trial_2.mp4",
+        "trial_10.mp4",
+    ]
+
+    assert list(scan_folder(tmp_path / "seq")) == [tmp_path / "seq"]
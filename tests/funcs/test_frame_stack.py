@@ -0,0 +1,41 @@
+import json
+
+import numpy as np
+import pytest
+
+from motion_analysis_2d.funcs.frame_stack import open_frame_stack
+
+
+def test_open_npy_stack(tmp_path):
+    path = tmp_path / "clip.npy"
+    stack = np.arange(5 * 4 * 3 * 3, dtype=np.uint8).reshape(5, 4, 3, 3)
+    np.save(path, stack)
+
+    frames, frame_rate = open_frame_stack(path)
+
+    assert isinstance(frames, np.memmap)
+    assert np.array_equal(frames[3], stack[3])
+    assert frame_rate is None
+
+
+def test_open_raw_stack(tmp_path):
+    path = tmp_path / "clip.raw"
+    stack = np.arange(6 * 4 * 5, dtype=np.uint8).reshape(6, 4, 5)
+    path.write_bytes(b"\xff" * 16 + stack.tobytes())
+    (tmp_path / "clip.raw.json").write_text(
+        json.dumps({"width": 5, "height": 4, "header": 16, "frame_rate": 500})
+    )
+
+    frames, frame_rate = open_frame_stack(path)
+
+    assert frames.shape == (6, 4, 5)
+    assert np.array_equal(frames[5], stack[5])
+    assert frame_rate == 500
+
+
+def test_open_raw_stack_without_sidecar(tmp_path):
+    path = tmp_path / "clip.raw"
+    path.write_bytes(bytes(20))
+
+    with pytest.raises(ValueError):
+        open_frame_stack(path)
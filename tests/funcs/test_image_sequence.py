@@ -0,0 +1,57 @@
+import json
+
+import numpy as np
+
+from motion_analysis_2d.funcs.image_sequence import (
+    natural_key,
+    sequence_frames,
+    is_image_sequence,
+    sequence_timestamps,
+)
+
+
+def make_sequence(folder, names):
+    folder.mkdir(exist_ok=True)
+    for name in names:
+        (folder / name).write_bytes(b"")
+    return folder
+
+
+def test_sequence_frames(tmp_path):
+    folder = make_sequence(
+        tmp_path / "seq", ["frame_10.png", "frame_2.png", "frame_1.png", "notes.txt"]
+    )
+
+    assert [p.name for p in sequence_frames(folder)] == [
+        "frame_1.png",
+        "frame_2.png",
+        "frame_10.png",
+    ]
+    assert natural_key("a2.tif") < natural_key("a10.tif")
+
+
+def test_is_image_sequence(tmp_path):
+    folder = make_sequence(tmp_path / "seq", ["0001.tif", "0002.tif"])
+    single = make_sequence(tmp_path / "single", ["0001.tif"])
+
+    assert is_image_sequence(folder)
+    assert not is_image_sequence(single)
+    assert not is_image_sequence(folder / "0001.tif")
+
+
+def test_sequence_timestamps(tmp_path):
+    folder = make_sequence(tmp_path / "seq", ["0001.png", "0002.png", "0003.png"])
+
+    times, frame_rate = sequence_timestamps(folder, 3, frame_rate=100)
+    assert np.allclose(times, [0, 10, 20])
+    assert frame_rate == 100
+
+    (folder / "metadata.json").write_text(json.dumps({"frame_rate": 1000}))
+    times, frame_rate = sequence_timestamps(folder, 3, frame_rate=100)
+    assert np.allclose(times, [0, 1, 2])
+    assert frame_rate == 1000
+
+    (folder / "timestamps.csv").write_text("frame,time\n1,5.0\n2,5.5\n3,6.0\n")
+    times, frame_rate = sequence_timestamps(folder, 3, frame_rate=100)
+    assert np.allclose(times, [0, 500, 1000])
+    assert np.isclose(frame_rate, 2)
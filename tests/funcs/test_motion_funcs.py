@@ -5,6 +5,8 @@ from scipy import fft
 from motion_analysis_2d.funcs.motion_funcs import (
     angle_vec,
     angle_between,
+    adapt_stride,
+    gap_start,
     filter_lowpass,
 )
 
@@ -41,6 +43,37 @@ def test_angle_between(vec1, vec2, expected):
     assert np.allclose(angle, expected)
 
 
+adapt_stride_testdata = [
+    (4, 10.0, 8, 5.0, 2),
+    (1, 10.0, 8, 5.0, 1),
+    (4, np.nan, 8, 5.0, 2),
+    (4, 0.5, 8, 5.0, 8),
+    (8, 0.5, 8, 5.0, 8),
+    (4, 3.0, 8, 5.0, 4),
+]
+
+
+@pytest.mark.parametrize(
+    "stride, displacement, max_stride, max_displacement, expected",
+    adapt_stride_testdata,
+)
+def test_adapt_stride(stride, displacement, max_stride, max_displacement, expected):
+    assert adapt_stride(stride, displacement, max_stride, max_displacement) == expected
+
+
+gap_start_testdata = [
+    (np.array([True, True, False, False, True]), 5, 3),
+    (np.array([True, True, True, False, True]), 4, 4),
+    (np.array([False, False, False, True]), 4, 1),
+    (np.array([True, False, False, False]), 1, 1),
+]
+
+
+@pytest.mark.parametrize("valid, frame_no, expected", gap_start_testdata)
+def test_gap_start(valid, frame_no, expected):
+    assert gap_start(valid, frame_no) == expected
+
+
 def test_filter_lowpass():
     number_of_samples = 10000
     sampling_period = 0.001
@@ -1,6 +1,8 @@
+from pathlib import PurePosixPath
+
 import pytest
 
-from motion_analysis_2d.funcs.naming import prevent_name_collision
+from motion_analysis_2d.funcs.naming import disambiguate_paths, prevent_name_collision
 
 current_names = [
     "test1",
@@ -31,3 +33,13 @@ testdata = [
 @pytest.mark.parametrize("name, all_names, expected", testdata)
 def test_prevent_name_collision(name, all_names, expected):
     assert prevent_name_collision(name, all_names) == expected
+
+
+def test_disambiguate_paths():
+    paths = [
+        PurePosixPath("/data/day1/a/trial.mp4"),
+        PurePosixPath("/data/day2/a/trial.mp4"),
+    ]
+    assert disambiguate_paths(paths[:1]) == ["trial.mp4"]
+    assert disambiguate_paths(paths) == ["day1/a/trial.mp4", "day2/a/trial.mp4"]
+    assert disambiguate_paths([]) == []
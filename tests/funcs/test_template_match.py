@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from motion_analysis_2d.funcs.template_match import (
+    clip_bbox,
+    crop_patch,
+    centred_patch,
+    search_template,
+    scale_bbox,
+    refine_bbox,
+)
+
+
+def make_image(marker_pos, size=(200, 200)):
+    rng = np.random.default_rng(0)
+    img = rng.integers(0, 30, size, dtype=np.uint8)
+    x, y = marker_pos
+    img[y : y + 10, x : x + 10] = 255
+    img[y + 3 : y + 7, x + 3 : x + 7] = 100
+    return img
+
+
+def make_blob(centre, size=(100, 100), sigma=3.0):
+    y, x = np.mgrid[: size[0], : size[1]] + 0.5
+    cx, cy = centre
+    return np.exp(-((x - cx) ** 2 + (y - cy) ** 2) / (2 * sigma**2)).astype(
+        np.float32
+    )
+
+
+clip_bbox_testdata = [
+    ((10, 10, 20, 20), (10, 10, 20, 20)),
+    ((-5, -5, 20, 20), (0, 0, 15, 15)),
+    ((90, 90, 20, 20), (90, 90, 10, 10)),
+]
+
+
+@pytest.mark.parametrize("bbox, expected", clip_bbox_testdata)
+def test_clip_bbox(bbox, expected):
+    assert clip_bbox(bbox, (100, 100)) == expected
+
+
+def test_search_template_finds_moved_marker():
+    template = crop_patch(make_image((50, 50)), (48, 48, 14, 14))
+
+    bbox, score = search_template(make_image((70, 60)), template, (48, 48, 14, 14))
+    assert bbox == (68, 58, 14, 14)
+    assert score > 0.9
+
+
+def test_search_template_rejects_missing_marker():
+    template = crop_patch(make_image((50, 50)), (48, 48, 14, 14))
+    img = np.zeros((200, 200), dtype=np.uint8)
+
+    bbox, _ = search_template(img, template, (48, 48, 14, 14))
+    assert bbox is None
+
+
+def test_scale_bbox():
+    assert scale_bbox((10, 20, 30, 40), 0.5) == (5, 10, 15, 20)
+
+
+def test_refine_bbox_subpixel():
+    template = crop_patch(make_blob((50.5, 50.5)), (40, 40, 21, 21))
+
+    (x, y, w, h), score = refine_bbox(
+        make_blob((53.8, 52.2)), template, (42, 41, 21, 21)
+    )
+    assert x + w / 2 == pytest.approx(53.8, abs=0.1)
+    assert y + h / 2 == pytest.approx(52.2, abs=0.1)
+    assert (w, h) == (21, 21)
+
+
+def test_refine_bbox_keeps_bbox_without_match():
+    template = crop_patch(make_blob((50.5, 50.5)), (40, 40, 21, 21))
+    img = np.zeros((100, 100), dtype=np.float32)
+
+    bbox, score = refine_bbox(img, template, (42, 41, 21, 21))
+    assert bbox == (42, 41, 21, 21)
+    assert score < 0.6
+
+
+def test_centred_patch_subpixel():
+    template = crop_patch(make_blob((50.5, 50.5)), (40, 40, 21, 21))
+    patch = centred_patch(make_blob((53.8, 52.2)), (43.3, 41.7, 21, 21), (21, 21))
+
+    assert patch.shape == template.shape
+    assert np.allclose(patch, template, atol=0.05 * template.max())
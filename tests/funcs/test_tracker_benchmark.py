@@ -0,0 +1,39 @@
+import numpy as np
+
+from motion_analysis_2d.funcs.tracker_benchmark import (
+    summarise_benchmark,
+    recommend_tracker,
+)
+
+
+def make_results():
+    truth = np.stack([np.arange(10.0), np.zeros(10)], axis=1)
+    drifting = truth.copy()
+    drifting[:, 1] = np.linspace(0, 9, 10)
+    failing = truth.copy()
+    failing[5:] = np.nan
+    return {
+        "CSRT": {"target": truth, "duration": 1.0, "failures": 0},
+        "KCF": {"target": truth + 0.5, "duration": 0.1, "failures": 0},
+        "MOSSE": {"target": drifting, "duration": 0.01, "failures": 0},
+        "MIL": {"target": failing, "duration": 0.5, "failures": 5},
+    }
+
+
+def test_summarise_benchmark():
+    summary = summarise_benchmark(make_results())
+
+    # the first frame initialises the tracker, 9 updates are timed
+    assert np.isclose(summary["CSRT"]["fps"], 9)
+    assert np.isclose(summary["KCF"]["fps"], 90)
+    assert summary["MIL"]["failures"] == 5
+    assert summary["CSRT"]["drift"] < summary["MOSSE"]["drift"]
+    assert summary["MOSSE"]["max_drift"] > 8
+
+
+def test_recommend_tracker():
+    summary = summarise_benchmark(make_results())
+
+    assert recommend_tracker(summary, max_drift=100) == "MOSSE"
+    assert recommend_tracker(summary, max_drift=1) == "KCF"
+    assert recommend_tracker(summary, max_drift=-1) is None
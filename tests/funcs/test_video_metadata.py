@@ -0,0 +1,53 @@
+import json
+
+from motion_analysis_2d.funcs.video_metadata import (
+    data_file_complete,
+    describe_metadata,
+    file_signature,
+)
+
+
+def write_data_file(path, times):
+    path.write_text(json.dumps({"tracking_data": {"a": {"time": times}}}))
+
+
+def test_data_file_complete(tmp_path):
+    clip = tmp_path / "clip.mp4"
+    clip.write_bytes(b"\0" * 10)
+    assert not data_file_complete(clip, 3)
+
+    write_data_file(tmp_path / "clip.json", [0.0, None, 66.7])
+    assert not data_file_complete(clip, 3)
+
+    write_data_file(tmp_path / "clip.json", [0.0, 33.3, 66.7])
+    assert data_file_complete(clip, 3)
+    assert not data_file_complete(clip, 4)
+
+
+def test_file_signature(tmp_path):
+    clip = tmp_path / "clip.mp4"
+    clip.write_bytes(b"\0" * 10)
+    signature = file_signature(clip)
+    assert signature[0] == 10
+    assert signature[2:] == [None, None]
+
+    write_data_file(tmp_path / "clip.json", [0.0])
+    assert file_signature(clip)[:2] == signature[:2]
+    assert file_signature(clip)[2] is not None
+
+
+def test_describe_metadata():
+    metadata = {
+        "frame_rate": 30.0,
+        "frames": 300,
+        "width": 640,
+        "height": 480,
+        "duration": 10.0,
+        "codec": "avc1",
+        "keyframe_spacing": 30.0,
+        "complete": True,
+    }
+    assert describe_metadata(metadata) == (
+        "640x480, 30.00 fps, 300 frames (10.0 s), avc1, "
+        "keyframe every 30 frames, data complete"
+    )
@@ -0,0 +1,79 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from motion_analysis_2d.main_widget import MainWidget
+
+
+class TurboWindow:
+    """The frame view and turbo mode of MainWidget on stand-in widgets"""
+
+    update_frame_view = MainWidget.update_frame_view
+    update_turbo = MainWidget.update_turbo
+    update_turbo_status = MainWidget.update_turbo_status
+    frame_view_interval = MainWidget.frame_view_interval
+
+    def __init__(self):
+        self.turbo = False
+        self.turbo_sample = (0.0, 0)
+        self.turbo_progress_bar = MagicMock()
+        self.turbo_label = MagicMock()
+        self.last_frame_view = 0.0
+        self.frame_result = None
+        self.range_progress_dialog = None
+        self.stream_worker = MagicMock()
+        self.tracking_worker = MagicMock(frame_no=5, no_of_frames=10)
+        self.tracking_worker.take_result.return_value = MagicMock(
+            frame_no=5,
+            timestamp=40.0,
+            frame=np.zeros((4, 4, 3), dtype=np.uint8),
+            tracking_data={},
+            analysis_data={"angle": {}, "distance": {}},
+        )
+        self.frame_widget = MagicMock()
+        self.media_controls = MagicMock()
+        self.docks = {
+            "Tracking": MagicMock(),
+            "Files": MagicMock(),
+            "DataPlot": MagicMock(),
+            "Extrinsic": MagicMock(),
+        }
+        self.docks["Tracking"].auto_turbo_checkbox.isChecked.return_value = False
+        self.screen = MagicMock()
+        self.screen.return_value.refreshRate.return_value = 60
+        self.isMinimized = MagicMock(return_value=False)
+
+    def set_turbo(self, turbo):
+        self.docks["Tracking"].turbo_checkbox.isChecked.return_value = turbo
+        self.update_turbo()
+
+
+def test_turbo_suspends_drawing(qtbot):
+    window = TurboWindow()
+    window.set_turbo(True)
+
+    assert window.turbo
+    assert window.frame_view_interval() == 500
+    window.turbo_progress_bar.setVisible.assert_called_with(True)
+
+    window.update_frame_view()
+    window.frame_widget.update_frame.assert_not_called()
+    window.media_controls.set_seek_bar_value.assert_not_called()
+    window.turbo_progress_bar.setValue.assert_called_with(5)
+
+
+def test_turbo_off_redraws_once(qtbot):
+    window = TurboWindow()
+    window.set_turbo(True)
+    window.update_frame_view()
+
+    window.set_turbo(False)
+    assert not window.turbo
+    assert window.frame_view_interval() < 500
+    window.turbo_progress_bar.setVisible.assert_called_with(False)
+    window.frame_widget.update_frame.assert_called_once()
+    window.media_controls.set_seek_bar_value.assert_called_once_with(5)
+
+    # unchanged settings do not redraw again
+    window.set_turbo(False)
+    window.frame_widget.update_frame.assert_called_once()
@@ -0,0 +1,119 @@
+import threading
+from queue import Queue
+
+import numpy as np
+
+from motion_analysis_2d.workers import StreamWorker
+
+
+class Passthrough:
+    """Correction docks with nothing set up"""
+
+    def undistort_map(self, frame):
+        return frame
+
+    def orient_img(self, frame):
+        return frame
+
+    def change_perspective(self, frame):
+        return frame
+
+
+def make_worker(tmp_path, no_of_frames=12):
+    path = tmp_path / "clip.npy"
+    np.save(path, np.zeros((no_of_frames, 6, 8, 3), dtype=np.uint8))
+    return StreamWorker(path, Queue(), Passthrough(), Passthrough(), Passthrough())
+
+
+def open_at_first_frame(worker):
+    worker.cap = worker.open()
+    worker.move_frame_to(1)
+    worker.stream_queue.get_nowait()
+
+
+def queued_frame_numbers(worker):
+    frame_nos = []
+    while not worker.stream_queue.empty():
+        frame_nos.append(worker.stream_queue.get_nowait()[0])
+    return frame_nos
+
+
+def test_stream_tracks_range_to_end(qtbot, tmp_path):
+    worker = make_worker(tmp_path)
+    opened, done = threading.Event(), threading.Event()
+    finished = []
+    worker.stream_props.connect(lambda *args: opened.set())
+    worker.range_finished.connect(lambda *args: (finished.append(args), done.set()))
+
+    thread = threading.Thread(target=worker.stream, daemon=True)
+    thread.start()
+    try:
+        assert opened.wait(5)
+        assert queued_frame_numbers(worker) == [1]
+        # as the GUI does, once the stream is idle
+        worker.move_frame_to(1)
+        worker.start_range(1, 12)
+        assert done.wait(5)
+    finally:
+        worker.set_stop()
+        thread.join(5)
+
+    assert not thread.is_alive()
+    assert finished == [(12, True)]
+    assert queued_frame_numbers(worker) == list(range(1, 13))
+
+
+def test_stopped_range_is_not_completed(qtbot, tmp_path):
+    worker = make_worker(tmp_path)
+    finished = []
+    worker.range_finished.connect(lambda *args: finished.append(args))
+    open_at_first_frame(worker)
+
+    worker.start_range(1, 12)
+    worker.track_range_step()
+    worker.track_range_step()
+    worker.stop_range()
+    worker.track_range_step()
+
+    assert finished == [(3, False)]
+    assert worker.range_end is None
+    assert queued_frame_numbers(worker) == [2, 3]
+
+
+def test_range_progress_is_throttled(qtbot, tmp_path):
+    worker = make_worker(tmp_path)
+    progress = []
+    worker.range_progress.connect(lambda *args: progress.append(args))
+
+    worker.start_range(1, 12)
+    worker.frame_no = 5
+    worker.report_range_progress(interval=60)
+    assert progress == []
+
+    # reported once the interval passed, the last frame always
+    worker.report_range_progress(interval=0)
+    worker.frame_no = 12
+    worker.report_range_progress(interval=60)
+    assert [frame_no for frame_no, _ in progress] == [5, 12]
+
+
+def test_idle_token_is_queued_once_after_frames(qtbot, tmp_path):
+    worker = make_worker(tmp_path)
+    open_at_first_frame(worker)
+
+    worker.move_frame_forwards()
+    worker.move_frame_forwards()
+    worker.request_idle(1)
+    worker.confirm_idle()
+    worker.confirm_idle()
+
+    queued = []
+    while not worker.stream_queue.empty():
+        item = worker.stream_queue.get_nowait()
+        queued.append(item if isinstance(item, int) else item[0])
+    assert queued == [2, 3, 1]
+
+    # a token already confirmed is not queued again
+    worker.request_idle(1)
+    worker.confirm_idle()
+    assert worker.stream_queue.empty()
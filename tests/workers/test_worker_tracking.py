@@ -0,0 +1,94 @@
+import threading
+from queue import Queue
+
+import numpy as np
+
+from motion_analysis_2d.custom_components import FrameProducts
+from motion_analysis_2d.workers import TrackingWorker
+
+
+class StepTracker:
+    """Moves the bbox one pixel right on every update"""
+
+    def __init__(self):
+        self.updates = 0
+
+    def init(self, frame, bbox):
+        self.bbox = tuple(int(a) for a in bbox)
+
+    def update(self, frame):
+        self.updates += 1
+        x, y, w, h = self.bbox
+        self.bbox = (x + 1, y, w, h)
+        return True, self.bbox
+
+
+def make_frame(seed=0, shape=(80, 80)):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 255, shape, dtype=np.uint8)
+
+
+def make_worker(frame):
+    worker = TrackingWorker(Queue())
+    worker.create_tracker = lambda tracker_type: StepTracker()
+    worker.set_props(10)
+    worker.set_current_frame(1, 0.0, FrameProducts(frame))
+    worker.add_tracker("a", (20, 20), (16, 16), (0, 0))
+    return worker
+
+
+def test_motion_gate_skips_still_frames(qtbot):
+    frame = make_frame()
+    worker = make_worker(frame)
+    worker.set_motion_gate({"threshold": 2.0, "max_skip": 10, "downsample": 1})
+    tracker, _, _ = worker.trackers["a"]
+
+    # the first update sets the gate reference
+    worker.run_trackers(2, 40.0, FrameProducts(frame))
+    assert tracker.updates == 1
+
+    # a still region keeps the previous bbox without updating the tracker
+    worker.run_trackers(3, 80.0, FrameProducts(frame))
+    assert tracker.updates == 1
+    bboxes = worker.tracking_data["a"]["bbox"]
+    assert np.array_equal(bboxes[2], bboxes[1])
+
+    # motion above the threshold updates the tracker again
+    worker.run_trackers(4, 120.0, FrameProducts(np.roll(frame, 3, axis=1)))
+    assert tracker.updates == 2
+
+
+def test_tracked_frame_clears_reacquired(qtbot):
+    frame = make_frame()
+    worker = make_worker(frame)
+    reacquired = worker.tracking_data["a"]["reacquired"]
+    reacquired[1] = True
+
+    # frame 2 tracked again, e.g. after the stream was sent back
+    worker.run_trackers(2, 40.0, FrameProducts(frame))
+    assert not reacquired[1]
+
+
+def test_idle_token_is_handed_back_after_frames(qtbot):
+    frame = make_frame()
+    worker = make_worker(frame)
+    idle = threading.Event()
+    tokens = []
+
+    def stream_idle(token):
+        tokens.append((token, worker.frame_no))
+        idle.set()
+
+    worker.stream_idle.connect(stream_idle)
+    worker.stream_queue.put((2, 40.0, FrameProducts(frame), False))
+    worker.stream_queue.put(1)
+
+    thread = threading.Thread(target=worker.run, daemon=True)
+    thread.start()
+    try:
+        assert idle.wait(5)
+    finally:
+        worker.set_stop()
+        thread.join(5)
+
+    assert tokens == [(1, 2)]